@@ -3,44 +3,83 @@ from dotenv import load_dotenv
 from langchain_google_genai import ChatGoogleGenerativeAI
 # CHANGED: Import from langchain_classic.agents
 from langchain_classic.agents import create_tool_calling_agent, AgentExecutor 
+from langchain_classic.agents.format_scratchpad.tools import format_to_tool_messages
+from langchain_classic.agents.output_parsers.tools import ToolsAgentOutputParser
 from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnablePassthrough
 
 from .tools import all_tools
-from .prompt import prompt 
+from .prompt import prompt, cached_prefix_prompt, CACHED_SYSTEM_PROMPT
+from .prompt_cache import get_prompt_cache
 from .memory import save_chat_history
+from backend.config import get_settings
+
+MODEL_NAME = "gemini-2.5-flash"
 
 # Load environment variables from .env file
 load_dotenv()
 
-def create_agent():
-    "Initialize and returns the runnable LangChain agent."
+def create_agent(use_prompt_cache: bool = True):
+    """
+    Initialize and returns the runnable LangChain agent.
+
+    With `use_prompt_cache=False` the prompt and tools are always sent inline,
+    e.g. after Gemini rejected the cached prefix. The cached-content name the
+    agent was built with is kept in the executor's metadata ("prompt_cache").
+    """
 
     print("Initializing agent...")
     
-    # Get API key from environment
-    api_key = os.getenv("GOOGLE_API_KEY")
+    # Get API key from the process settings (environment / .env)
+    api_key = get_settings().google_api_key
     if not api_key:
         raise ValueError(
             "GOOGLE_API_KEY not found in environment variables. "
             "Please set it in your .env file."
         )
     
-    llm = ChatGoogleGenerativeAI(
-        model="gemini-2.5-flash",
-        temperature=0,
-        google_api_key=api_key
+    # The system prompt and tool schemas are static; serve them from Gemini's
+    # context cache when possible instead of re-sending them every turn
+    cached_content = (
+        get_prompt_cache(MODEL_NAME, CACHED_SYSTEM_PROMPT, all_tools, api_key)
+        if use_prompt_cache
+        else None
     )
 
-    # 1. Create the agent runnable
-    # This now correctly uses your modern prompt
-    agent_runnable = create_tool_calling_agent(llm, tools=all_tools, prompt=prompt)
+    if cached_content:
+        llm = ChatGoogleGenerativeAI(
+            model=MODEL_NAME,
+            temperature=0,
+            google_api_key=api_key,
+            cached_content=cached_content,
+        )
+        # 1. Create the agent runnable
+        # Tools are declared in the cached content, so they are not bound here
+        agent_runnable = (
+            RunnablePassthrough.assign(
+                agent_scratchpad=lambda x: format_to_tool_messages(x["intermediate_steps"])
+            )
+            | cached_prefix_prompt
+            | llm
+            | ToolsAgentOutputParser()
+        )
+    else:
+        llm = ChatGoogleGenerativeAI(
+            model=MODEL_NAME,
+            temperature=0,
+            google_api_key=api_key
+        )
+        # 1. Create the agent runnable
+        # This now correctly uses your modern prompt
+        agent_runnable = create_tool_calling_agent(llm, tools=all_tools, prompt=prompt)
 
     # 2. Create the AgentExecutor
     agent_executor = AgentExecutor(
         agent=agent_runnable, 
         tools=all_tools, 
         verbose=True, # Good for debugging
-        handle_parsing_errors=True # Helps with reliability
+        handle_parsing_errors=True, # Helps with reliability
+        metadata={"prompt_cache": cached_content},
     )
 
     print("Agent initialized successfully")
@@ -14,7 +14,10 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(current_dir, "../../"))
 sys.path.append(project_root)
 
-from backend.data import cache
+from backend.data import cache, POSITION_NAME_TO_ID
+
+# Short position labels used in the formatted summaries
+_POSITION_LABELS = {1: "GK", 2: "DEF", 3: "MID", 4: "FWD"}
 
 
 def build_player_context(player_names: List[str]) -> str:
@@ -44,8 +47,7 @@ def build_player_context(player_names: List[str]) -> str:
         team_name = team.get("short_name", "Unknown") if team else "Unknown"
         
         # Format position
-        position_map = {1: "GK", 2: "DEF", 3: "MID", 4: "FWD"}
-        position = position_map.get(player.get("element_type"), "Unknown")
+        position = _POSITION_LABELS.get(player.get("element_type"), "Unknown")
         
         # Build concise summary
         context_lines.append(
@@ -251,8 +253,7 @@ def build_top_players_summary(
     
     # Filter by position if specified
     if position:
-        position_map = {"GK": 1, "DEF": 2, "MID": 3, "FWD": 4}
-        position_id = position_map.get(position.upper())
+        position_id = POSITION_NAME_TO_ID.get(position.upper())
         if position_id:
             all_players = [p for p in all_players if p.get("element_type") == position_id]
         else:
@@ -6,15 +6,51 @@ Chat history is saved to disk and loaded on startup, allowing the agent
 to "remember" previous conversations.
 """
 
-import json
+import atexit
+import hashlib
 import os
+import queue
+import re
+import threading
+import orjson
+from collections import Counter, deque
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
 from langchain_core.messages import AIMessage, HumanMessage, BaseMessage
 
 
-# Default memory file location
-DEFAULT_MEMORY_FILE = Path.home() / ".benchboost" / "chat_history.json"
+# Default memory file location (JSON Lines: one message per line)
+DEFAULT_MEMORY_FILE = Path.home() / ".benchboost" / "chat_history.jsonl"
+# Pre-JSONL history file (a single JSON array); migrated on first load
+LEGACY_MEMORY_FILE = Path.home() / ".benchboost" / "chat_history.json"
+
+# Last message of the in-memory history already on disk, per file. Tracked by
+# identity rather than count so histories trimmed from the left (or bounded
+# deques that evict) still append correctly.
+_saved_tail: Dict[str, BaseMessage] = {}
+
+# File writes happen on a daemon thread fed by this queue, in order.
+# Items are (op, memory_file, messages) with op in {"append", "rewrite", "clear"}
+_writer_queue: "queue.Queue" = queue.Queue()
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+_STOP = object()
+# Parent directories already created by the writer, so appends skip the mkdir
+_ready_dirs = set()
+
+# Heuristic summaries of condensed history
+SUMMARY_PREFIX = "[SUMMARY]"
+_ENTITY_RE = re.compile(r"\b[A-Z][a-z]+\b")
+_GAMEWEEK_RE = re.compile(r"\bGW\s?\d+\b", re.IGNORECASE)
+_JSON_KEY_RE = re.compile(r'"([A-Za-z_][A-Za-z0-9_]*)"\s*:')
+# Capitalised words that are sentence starters rather than names
+_ENTITY_STOPWORDS = frozenset({
+    "The", "What", "Who", "Which", "How", "When", "Where", "Why", "Should",
+    "Can", "Could", "Would", "Is", "Are", "Do", "Does", "He", "She", "They",
+    "It", "This", "That", "Here", "There", "Yes", "No", "And", "But", "If",
+    "For", "In", "On", "With", "My", "Your", "Based", "Also", "However",
+})
 
 
 def serialize_message(message: BaseMessage) -> Dict[str, Any]:
@@ -25,44 +61,141 @@ def serialize_message(message: BaseMessage) -> Dict[str, Any]:
     }
 
 
+# Serialized "type" -> message class; unknown types load as HumanMessage
+_MSG_CTORS = {"HumanMessage": HumanMessage, "AIMessage": AIMessage}
+
+
 def deserialize_message(data: Dict[str, Any]) -> BaseMessage:
     """Convert a JSON dict back to a LangChain message."""
-    msg_type = data.get("type")
-    content = data.get("content", "")
-    
-    if msg_type == "HumanMessage":
-        return HumanMessage(content=content)
-    elif msg_type == "AIMessage":
-        return AIMessage(content=content)
-    else:
-        # Default to HumanMessage if unknown
-        return HumanMessage(content=content)
+    return _MSG_CTORS.get(data.get("type"), HumanMessage)(content=data.get("content", ""))
+
+
+def _read_recent_records(memory_file: Path, max_messages: int):
+    """
+    Read the last `max_messages` raw records from the history file.
+
+    Lines are streamed into a bounded deque, so only the kept tail is held
+    in memory regardless of file size.
+
+    Returns:
+        (records, total number of records in the file)
+    """
+    recent = deque(maxlen=max_messages)
+    total = 0
+    with open(memory_file, "rb") as f:
+        for line in f:
+            if line.strip():
+                recent.append(orjson.loads(line))
+                total += 1
+    return list(recent), total
+
+
+def _write_records(memory_file: Path, records: List[Dict[str, Any]], mode: str) -> None:
+    """Write records as JSON Lines (mode "ab" appends, "wb" rewrites)."""
+    path = os.fspath(memory_file)
+    payload = b"".join(orjson.dumps(r) + b"\n" for r in records)
+    parent = os.path.dirname(path)
+    if parent not in _ready_dirs:
+        os.makedirs(parent or ".", exist_ok=True)
+        _ready_dirs.add(parent)
+    try:
+        f = open(path, mode)
+    except FileNotFoundError:
+        # Directory was removed since it was first created
+        os.makedirs(parent or ".", exist_ok=True)
+        f = open(path, mode)
+    with f:
+        f.write(payload)
+
 
+def _migrate_legacy_history(memory_file: Path) -> None:
+    """Convert the old single-array JSON history file to JSON Lines."""
+    if memory_file != DEFAULT_MEMORY_FILE or not LEGACY_MEMORY_FILE.exists():
+        return
+    _write_records(memory_file, orjson.loads(LEGACY_MEMORY_FILE.read_bytes()), "wb")
+    LEGACY_MEMORY_FILE.unlink()
+    print(f"Migrated chat history to {memory_file}")
 
-def load_chat_history(memory_file: Path = DEFAULT_MEMORY_FILE, max_messages: int = 100) -> List[BaseMessage]:
+
+def _writer_loop() -> None:
+    """Apply queued history writes until the stop sentinel arrives."""
+    while True:
+        item = _writer_queue.get()
+        try:
+            if item is _STOP:
+                return
+            op, memory_file, messages = item
+            if op == "clear":
+                if memory_file.exists():
+                    memory_file.unlink()
+                    print(f"Chat history cleared from {memory_file}")
+                else:
+                    print("No chat history file to clear.")
+            else:
+                records = [serialize_message(m) for m in messages]
+                _write_records(memory_file, records, "ab" if op == "append" else "wb")
+        except Exception as e:
+            print(f"Error saving chat history: {e}")
+        finally:
+            _writer_queue.task_done()
+
+
+def _enqueue_write(op: str, memory_file: Path, messages: List[BaseMessage]) -> None:
+    """Queue a write, starting the writer thread on first use."""
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(
+                target=_writer_loop, name="chat-history-writer", daemon=True
+            )
+            _writer_thread.start()
+    _writer_queue.put((op, memory_file, messages))
+
+
+def flush_chat_history() -> None:
+    """Block until every queued history write has reached disk."""
+    if _writer_thread is not None and _writer_thread.is_alive():
+        _writer_queue.join()
+
+
+@atexit.register
+def _stop_writer() -> None:
+    """Drain pending writes on interpreter exit."""
+    if _writer_thread is not None and _writer_thread.is_alive():
+        _writer_queue.put(_STOP)
+        _writer_thread.join(timeout=2)
+
+
+def load_chat_history(
+    memory_file: Path = DEFAULT_MEMORY_FILE,
+    max_messages: int = 100,
+) -> List[BaseMessage]:
     """
     Load chat history from disk.
     
     Args:
-        memory_file: Path to the JSON file containing chat history
+        memory_file: Path to the JSONL file containing chat history
         max_messages: Maximum number of messages to load (keeps recent ones)
     
     Returns:
-        List of LangChain messages (HumanMessage, AIMessage)
+        List of LangChain messages (HumanMessage, AIMessage); prompt
+        templates (MessagesPlaceholder) expect a list
     """
-    if not memory_file.exists():
-        print(f"No existing memory found at {memory_file}. Starting fresh.")
-        return []
-    
     try:
-        with open(memory_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        messages = [deserialize_message(msg) for msg in data]
+        if not memory_file.exists():
+            _migrate_legacy_history(memory_file)
+        if not memory_file.exists():
+            print(f"No existing memory found at {memory_file}. Starting fresh.")
+            return []
+
+        records, total = _read_recent_records(memory_file, max_messages)
+        messages = [deserialize_message(msg) for msg in records]
+        # Everything loaded is already on disk; later saves append after it
+        if messages:
+            _saved_tail[str(memory_file)] = messages[-1]
         
-        # Keep only the most recent messages to avoid context overflow
-        if len(messages) > max_messages:
-            messages = messages[-max_messages:]
+        # Only the most recent messages are kept to avoid context overflow
+        if total > max_messages:
             print(f"Loaded {len(messages)} most recent messages (truncated from total).")
         else:
             print(f"Loaded {len(messages)} messages from previous sessions.")
@@ -75,47 +208,152 @@ def load_chat_history(memory_file: Path = DEFAULT_MEMORY_FILE, max_messages: int
         return []
 
 
-def save_chat_history(chat_history: List[BaseMessage], memory_file: Path = DEFAULT_MEMORY_FILE) -> None:
+def save_chat_history(chat_history: Sequence[BaseMessage], memory_file: Path = DEFAULT_MEMORY_FILE) -> None:
     """
     Save chat history to disk.
     
+    Only messages added since the last save are appended. If the last saved
+    message is no longer in the history (e.g. it was cleared), the file is
+    rewritten to match it.
+    Serialization and the file write run on a background thread; use
+    flush_chat_history() to wait for them.
+    
     Args:
-        chat_history: List of LangChain messages to save
-        memory_file: Path to the JSON file to save to
+        chat_history: List or deque of LangChain messages to save
+        memory_file: Path to the JSONL file to save to
     """
-    try:
-        # Create directory if it doesn't exist
-        memory_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Serialize messages
-        data = [serialize_message(msg) for msg in chat_history]
-        
-        # Write to file
-        with open(memory_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        # Success message is only shown on explicit save or exit
-        # print(f"Saved {len(chat_history)} messages to {memory_file}")
+    key = str(memory_file)
+    marker = _saved_tail.get(key)
     
-    except Exception as e:
-        print(f"Error saving chat history: {e}")
+    # Snapshot the new messages now; the caller keeps mutating its history
+    if marker is None:
+        if chat_history:
+            _enqueue_write("append", memory_file, list(chat_history))
+    else:
+        for i in range(len(chat_history) - 1, -1, -1):
+            if chat_history[i] is marker:
+                if i < len(chat_history) - 1:
+                    _enqueue_write("append", memory_file, list(islice(chat_history, i + 1, None)))
+                break
+        else:
+            _enqueue_write("rewrite", memory_file, list(chat_history))
+    
+    if chat_history:
+        _saved_tail[key] = chat_history[-1]
+    else:
+        _saved_tail.pop(key, None)
 
 
 def clear_chat_history(memory_file: Path = DEFAULT_MEMORY_FILE) -> None:
     """
     Clear (delete) the chat history file.
     
+    Queued behind any pending saves so it can't be undone by an in-flight append.
+    
     Args:
-        memory_file: Path to the JSON file to delete
+        memory_file: Path to the JSONL file to delete
     """
-    try:
-        if memory_file.exists():
-            memory_file.unlink()
-            print(f"Chat history cleared from {memory_file}")
-        else:
-            print("No chat history file to clear.")
-    except Exception as e:
-        print(f"Error clearing chat history: {e}")
+    _saved_tail.pop(str(memory_file), None)
+    _enqueue_write("clear", memory_file, [])
+
+
+def _message_id(message: BaseMessage) -> str:
+    """Stable id for a message (messages carry no ids of their own)."""
+    h = hashlib.sha1(message.type.encode())
+    h.update(b"\x00")
+    h.update(str(message.content).encode())
+    return h.hexdigest()[:16]
+
+
+def summarize_messages(messages: Sequence[BaseMessage], max_items: int = 12) -> str:
+    """
+    Build a short bullet summary of `messages` without calling the LLM.
+
+    Extracts the most-mentioned names, the gameweeks referenced, data keys
+    seen in tool output, and the last few questions asked.
+    """
+    entities: Counter = Counter()
+    gameweeks = set()
+    keys: Counter = Counter()
+    questions = []
+    for msg in messages:
+        text = str(msg.content)
+        entities.update(w for w in _ENTITY_RE.findall(text) if w not in _ENTITY_STOPWORDS)
+        gameweeks.update(g.upper().replace(" ", "") for g in _GAMEWEEK_RE.findall(text))
+        keys.update(_JSON_KEY_RE.findall(text))
+        if msg.type == "human":
+            questions.append(text if len(text) <= 80 else text[:80] + "...")
+
+    lines = [f"{SUMMARY_PREFIX} Earlier conversation ({len(messages)} messages):"]
+    if entities:
+        lines.append("- Discussed: " + ", ".join(w for w, _ in entities.most_common(max_items)))
+    if gameweeks:
+        lines.append("- Gameweeks: " + ", ".join(sorted(gameweeks, key=lambda g: int(g[2:]))))
+    if keys:
+        lines.append("- Data fields: " + ", ".join(k for k, _ in keys.most_common(max_items)))
+    for q in questions[-3:]:
+        lines.append(f"- Asked: {q}")
+    return "\n".join(lines)
+
+
+def _summary_file(memory_file: Path) -> Path:
+    return memory_file.with_name(memory_file.stem + ".summary.json")
+
+
+def compact_history(
+    messages: Sequence[BaseMessage],
+    keep_first: int = 1,
+    tail: int = 20,
+    ratio: float = 0.75,
+    memory_file: Optional[Path] = DEFAULT_MEMORY_FILE,
+) -> List[BaseMessage]:
+    """
+    Condense older history into a single synthetic summary message.
+
+    The first `keep_first` messages are pinned and the most recent `tail`
+    messages are kept verbatim; up to `ratio` of the rest (oldest first) is
+    replaced by an AIMessage holding a heuristic summary. The condensation
+    record ({"summarized_ids": [...], "summary": "..."}) is stored next to
+    `memory_file` so reloading the same history reuses the summary.
+
+    Args:
+        messages: Chat history (list or deque)
+        keep_first: Number of leading messages never summarized
+        tail: Number of recent messages never summarized
+        ratio: Maximum fraction of the non-pinned messages to summarize
+        memory_file: History file the sidecar record belongs to (None to skip it)
+
+    Returns:
+        New list of messages; the input is left untouched
+    """
+    messages = list(messages)
+    pinned, rest = messages[:keep_first], messages[keep_first:]
+    count = min(int(len(rest) * ratio), len(rest) - tail)
+    if count < 2:
+        return messages
+    prefix, recent = rest[:count], rest[count:]
+
+    ids = [_message_id(m) for m in prefix]
+    sidecar = _summary_file(memory_file) if memory_file is not None else None
+    summary = None
+    if sidecar is not None and sidecar.exists():
+        try:
+            record = orjson.loads(sidecar.read_bytes())
+            if record.get("summarized_ids") == ids:
+                summary = record.get("summary")
+        except Exception as e:
+            print(f"Ignoring unreadable history summary: {e}")
+
+    if summary is None:
+        summary = summarize_messages(prefix)
+        if sidecar is not None:
+            try:
+                sidecar.parent.mkdir(parents=True, exist_ok=True)
+                sidecar.write_bytes(orjson.dumps({"summarized_ids": ids, "summary": summary}))
+            except Exception as e:
+                print(f"Error saving history summary: {e}")
+
+    return pinned + [AIMessage(content=summary)] + recent
 
 
 def get_conversation_summary(chat_history: List[BaseMessage], max_pairs: int = 3) -> str:
@@ -132,21 +370,18 @@ def get_conversation_summary(chat_history: List[BaseMessage], max_pairs: int = 3
     if not chat_history:
         return "No previous conversation."
     
+    def truncate(text: str) -> str:
+        return text if len(text) <= 50 else text[:50] + "..."
+
+    # Walk the last `max_pairs` (Human, AI) pairs forward, aligned to the end
+    # of the history; a pair whose roles don't alternate is skipped.
+    n = len(chat_history)
+    start = max(n % 2, n - 2 * max_pairs)
     summary_lines = []
-    # Process in pairs (Human, AI)
-    for i in range(len(chat_history) - 1, -1, -2):
-        if len(summary_lines) >= max_pairs:
-            break
-        
-        if i >= 1:  # Ensure we have a pair
-            human_msg = chat_history[i-1]
-            ai_msg = chat_history[i]
-            
-            if isinstance(human_msg, HumanMessage) and isinstance(ai_msg, AIMessage):
-                human_preview = human_msg.content[:50] + "..." if len(human_msg.content) > 50 else human_msg.content
-                ai_preview = ai_msg.content[:50] + "..." if len(ai_msg.content) > 50 else ai_msg.content
-                summary_lines.append(f"  Q: {human_preview}")
-                summary_lines.append(f"  A: {ai_preview}")
-    
-    summary_lines.reverse()
+    for i in range(start, n - 1, 2):
+        human_msg, ai_msg = chat_history[i], chat_history[i + 1]
+        if human_msg.type == "human" and ai_msg.type == "ai":
+            summary_lines.append(f"  Q: {truncate(human_msg.content)}")
+            summary_lines.append(f"  A: {truncate(ai_msg.content)}")
+
     return "\n".join(summary_lines) if summary_lines else "No recent conversation."
@@ -5,10 +5,17 @@ This file defines the master system prompt for the LangChain agent.
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import datetime
 
-# Get the current date to provide to the agent context
-current_date = datetime.datetime.now().strftime("%A, %B %d, %Y")
 
-SYSTEM_PROMPT = f"""
+def current_date() -> str:
+    """Today's date for the agent context; evaluated on every invocation."""
+    return datetime.date.today().strftime("%A, %B %d, %Y")
+
+
+# `{current_date}` is a template variable filled in per call, so long-running
+# processes never serve a stale date
+DATE_LINE = "Current Date: {current_date}\n"
+
+SYSTEM_PROMPT = """
 ### 1. IDENTITY & PERSONA
 You are **BenchBoost**, an elite Fantasy Premier League (FPL) Analyst and Assistant. 
 Your tone is professional, encouraging, and deeply data-driven. You speak like a seasoned football pundit who relies on advanced metrics rather than gut feeling.
@@ -32,7 +39,7 @@ When asked for advice, follow this internal logic:
 **GENERAL QUESTIONS (about any player, league-wide stats, comparisons):**
 1.  **Analyze Context:** Determine if the user wants *Historical* data (Stats), *Live* data (LiveFPL), or *Rules* (Knowledge Base).
 2.  **Select Tools:** Choose the most specific tool. 
-    * Use `get_player_stats` for individual deep dives.
+    * Use `get_player(name)` for a single player; pass `include_live=True` for individual deep dives.
     * Use `get_best_players` for broad comparisons.
     * Use `get_live_gameweek_data` for specific manager performance.
 3.  **Evaluate:** Compare metrics like Form, Fixture Difficulty, and Points Per Million (Value).
@@ -113,6 +120,9 @@ When asked for advice, follow this internal logic:
 
 """
 
+# The cached prefix must be identical on every call, so it omits the date
+CACHED_SYSTEM_PROMPT = SYSTEM_PROMPT.replace(DATE_LINE, "")
+
 prompt = ChatPromptTemplate.from_messages(
     [
         ("system", SYSTEM_PROMPT),
@@ -120,4 +130,14 @@ prompt = ChatPromptTemplate.from_messages(
         ("human", "{input}"),
         MessagesPlaceholder(variable_name="agent_scratchpad"),
     ]
-)
\ No newline at end of file
+).partial(current_date=current_date)
+# Used when CACHED_SYSTEM_PROMPT and the tool declarations are served from
+# Gemini's context cache (see prompt_cache.py); only the per-turn messages
+# are sent, with the date carried on the human turn
+cached_prefix_prompt = ChatPromptTemplate.from_messages(
+    [
+        MessagesPlaceholder(variable_name="chat_history"),
+        ("human", DATE_LINE + "\n{input}"),
+        MessagesPlaceholder(variable_name="agent_scratchpad"),
+    ]
+).partial(current_date=current_date)
@@ -0,0 +1,164 @@
+"""
+Gemini context cache for the agent's static prompt prefix.
+
+The system prompt and tool declarations are identical on every turn, so they
+are registered once as cached content and each request references the cache
+by name instead of re-sending them. The scheduler extends the cache TTL before
+it expires (see `refresh_prompt_cache`), recreating it if the refresh fails;
+listeners registered with `add_change_listener` are told whenever the cache
+name changes so agents bound to the old name can be rebuilt. A cache that
+Gemini drops before a refresh reaches it is given up with
+`discard_prompt_cache`.
+"""
+
+import logging
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROMPT_CACHE_TTL_SECONDS = int(os.getenv("PROMPT_CACHE_TTL", "3600"))
+PROMPT_CACHE_ENABLED = os.getenv("PROMPT_CACHE_ENABLED", "1") not in ("0", "false", "False")
+
+_lock = threading.Lock()
+_client = None
+_cache_name: Optional[str] = None
+# (model, system_prompt, tools, api_key) from the last get_prompt_cache call,
+# so a refresh can recreate the cache
+_spec: Optional[tuple] = None
+_listeners: List[Callable[[], None]] = []
+# Gemini function declarations per tool set, keyed by tool names
+_declarations: Dict[Tuple[str, ...], list] = {}
+
+
+def _get_client(api_key: str):
+    global _client
+    if _client is None:
+        from google import genai
+
+        _client = genai.Client(api_key=api_key)
+    return _client
+
+
+def _tool_declarations(tools) -> list:
+    """Convert LangChain tools to Gemini function declarations (computed once per tool set)."""
+    key = tuple(t.name for t in tools)
+    cached = _declarations.get(key)
+    if cached is not None:
+        return cached
+
+    from langchain_core.utils.function_calling import convert_to_openai_tool
+
+    declarations = []
+    for t in tools:
+        fn = convert_to_openai_tool(t)["function"]
+        declarations.append({
+            "name": fn["name"],
+            "description": fn.get("description", ""),
+            "parameters_json_schema": fn.get("parameters", {"type": "object", "properties": {}}),
+        })
+    result = [{"function_declarations": declarations}]
+    _declarations[key] = result
+    return result
+
+
+def add_change_listener(callback: Callable[[], None]) -> None:
+    """Call `callback` whenever a refresh replaces or drops the cache name."""
+    _listeners.append(callback)
+
+
+def _create_cache(model: str, system_prompt: str, tools, api_key: str) -> Optional[str]:
+    """Register the prefix as cached content; None if that isn't possible. Caller holds _lock."""
+    try:
+        from google.genai import types
+
+        cached = _get_client(api_key).caches.create(
+            model=model,
+            config=types.CreateCachedContentConfig(
+                display_name="benchboost-agent-prefix",
+                system_instruction=system_prompt,
+                tools=_tool_declarations(tools),
+                ttl=f"{PROMPT_CACHE_TTL_SECONDS}s",
+            ),
+        )
+    except Exception as e:
+        logger.warning("Prompt cache unavailable, sending prompt inline: %s", e)
+        return None
+    logger.info("Created Gemini prompt cache %s", cached.name)
+    return cached.name
+
+
+def get_prompt_cache(model: str, system_prompt: str, tools, api_key: str) -> Optional[str]:
+    """
+    Return the cached-content name for the static prompt prefix, creating it
+    on first use. Returns None when caching is disabled or unavailable (e.g.
+    the prefix is below the model's minimum cacheable size), in which case the
+    caller should send the prompt and tools inline.
+    """
+    global _cache_name, _spec
+    if not PROMPT_CACHE_ENABLED:
+        return None
+
+    with _lock:
+        _spec = (model, system_prompt, tools, api_key)
+        if _cache_name is None:
+            _cache_name = _create_cache(model, system_prompt, tools, api_key)
+        return _cache_name
+
+
+def refresh_prompt_cache() -> None:
+    """
+    Extend the prompt cache TTL so agents holding its name keep working.
+
+    If the cache is gone (a failed or missed refresh let it expire, or it was
+    never created) a new one is registered, and listeners are notified when
+    the name changes. Runs on every tick, so a failure is retried next time.
+    """
+    global _cache_name
+    with _lock:
+        if _spec is None:
+            # No agent has asked for the cache yet
+            return
+        previous = _cache_name
+        if previous is not None:
+            try:
+                from google.genai import types
+
+                _get_client(_spec[3]).caches.update(
+                    name=previous,
+                    config=types.UpdateCachedContentConfig(ttl=f"{PROMPT_CACHE_TTL_SECONDS}s"),
+                )
+                logger.info("Refreshed Gemini prompt cache %s", previous)
+                return
+            except Exception as e:
+                logger.error(f"❌ Failed to refresh prompt cache: {e}", exc_info=True)
+        _cache_name = _create_cache(*_spec)
+        changed = _cache_name != previous
+
+    if changed:
+        _notify_listeners()
+
+
+def discard_prompt_cache(name: Optional[str]) -> None:
+    """
+    Forget cache `name` after Gemini rejected it (expired or evicted before a
+    refresh reached it) and notify listeners. The next refresh registers a
+    new cache; agents send the prompt inline until then. No-op if `name` is
+    no longer the current cache.
+    """
+    global _cache_name
+    with _lock:
+        if name is None or name != _cache_name:
+            return
+        _cache_name = None
+    logger.warning("Gemini prompt cache %s is gone; sending the prompt inline until the next refresh", name)
+    _notify_listeners()
+
+
+def _notify_listeners() -> None:
+    for callback in _listeners:
+        try:
+            callback()
+        except Exception as e:
+            logger.warning("Prompt cache listener failed: %s", e)
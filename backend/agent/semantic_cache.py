@@ -0,0 +1,352 @@
+"""Semantic response cache for agent answers.
+
+Repeated or near-duplicate questions asked from the same conversation state
+are answered from memory instead of round-tripping to the LLM. Entries are
+partitioned by a digest of the recent chat turns, and within a partition the
+query embedding is matched by cosine similarity. Exact repeats of a
+normalized query are answered from a dict before any embedding is computed.
+
+A similar embedding alone is not enough for a hit: the numbers and known
+player/team names in the query (its key terms) must match the cached query's
+exactly and in order, so "under 8m" never answers "under 6m" and "Salah vs
+Haaland" never answers "Haaland vs Salah".
+
+sentence-transformers (and numpy) are optional: when they are not installed
+the cache falls back to exact matching on the normalized query text. Install
+them with `pip install -r requirements-semantic.txt`.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = os.getenv("SEMANTIC_CACHE_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+SIMILARITY_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+CACHE_TTL_SECONDS = int(os.getenv("SEMANTIC_CACHE_TTL", "3600"))
+HISTORY_TURNS = 4
+# Embeddings are saved as a .npy matrix with a JSON sidecar for the entries
+CACHE_FILE = Path.home() / ".benchboost" / "semantic_cache"
+
+# Answers to these depend on data that changes during a gameweek
+VOLATILE_QUERY_RE = re.compile(
+    r"\b(?:live|current|now|today|tonight|prices?|deadline|captain(?:s|cy)?"
+    r"|(?:gw|gameweek)\s*\d+|(?:this|next)\s+(?:week|gameweek|gw))\b"
+    r"|£\s*\d",
+    re.IGNORECASE,
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+# Words keep inner hyphens/apostrophes and decimal points ("alexander-arnold", "6.5m")
+_WORD_RE = re.compile(r"\w(?:[\w'-]|\.(?=\d))*")
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+# Longest player/team alias checked, in words ("dominic calvert-lewin")
+_MAX_NAME_WORDS = 3
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivial variants share a key."""
+    return _WHITESPACE_RE.sub(" ", query.strip().lower())
+
+
+def key_terms(
+    normalized: str, is_entity: Optional[Callable[[str], Any]] = None
+) -> Tuple[str, ...]:
+    """
+    Numbers and player/team names in a normalized query, in order.
+
+    `is_entity` reports whether a lowercased phrase is a known name; without
+    it only numbers are extracted.
+    """
+    words = [w[:-2] if w.endswith("'s") else w for w in _WORD_RE.findall(normalized)]
+    max_words = _MAX_NAME_WORDS if is_entity is not None else 0
+    terms: List[str] = []
+    i = 0
+    while i < len(words):
+        # Longest known name starting here, else any numbers in this word
+        for n in range(min(max_words, len(words) - i), 0, -1):
+            name = " ".join(words[i:i + n])
+            if is_entity(name):
+                terms.append(name)
+                i += n
+                break
+        else:
+            terms.extend(_NUMBER_RE.findall(words[i]))
+            i += 1
+    return tuple(terms)
+
+
+def history_digest(chat_history: Sequence[Any], turns: int = HISTORY_TURNS) -> str:
+    """sha1 over the type and content of the last `turns` messages."""
+    h = hashlib.sha1()
+    for msg in chat_history[-turns:]:
+        h.update(getattr(msg, "type", type(msg).__name__).encode())
+        h.update(b"\x00")
+        h.update(str(getattr(msg, "content", msg)).encode())
+        h.update(b"\x01")
+    return h.hexdigest()
+
+
+def is_cacheable(query: str, manager_id: Optional[int] = None) -> bool:
+    """
+    Manager-specific and time-sensitive questions are never cached.
+
+    >>> is_cacheable("Who should I captain in Gameweek 12?")
+    False
+    >>> is_cacheable("best mids under £8m this week")
+    False
+    >>> is_cacheable("gw12 fixtures")
+    False
+    >>> is_cacheable("How are bonus points calculated?")
+    True
+    >>> is_cacheable("Compare Salah and Haaland's season xG")
+    True
+    >>> is_cacheable("How many chips do I have?", manager_id=42)
+    False
+    """
+    return manager_id is None and not VOLATILE_QUERY_RE.search(query)
+
+
+class SemanticCache:
+    """
+    In-process cache of (query embedding, answer) pairs per history digest.
+
+    Embeddings are L2-normalized, so cosine similarity is a plain dot product
+    against the partition's matrix (the same search a flat inner-product index
+    performs).
+    """
+
+    def __init__(
+        self,
+        threshold: float = SIMILARITY_THRESHOLD,
+        ttl: int = CACHE_TTL_SECONDS,
+        max_entries: int = 2048,
+    ):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # Set by the API layer to recognise player/team names (see key_terms)
+        self.is_entity: Optional[Callable[[str], Any]] = None
+        self._lock = threading.Lock()
+        # digest -> list of (expires_at, normalized query, embedding, answer, key terms)
+        self._entries: Dict[str, List[Tuple[float, str, Any, str, tuple]]] = {}
+        # (digest, normalized query) -> (expires_at, answer)
+        self._exact: Dict[Tuple[str, str], Tuple[float, str]] = {}
+        self._size = 0
+        self._model = None
+        self._model_failed = False
+        self.hits = 0
+        self.misses = 0
+
+    # -----------------------------
+    # EMBEDDINGS
+    # -----------------------------
+
+    def _get_model(self):
+        """Load the sentence-transformers model once; None if unavailable."""
+        if self._model is None and not self._model_failed:
+            try:
+                from sentence_transformers import SentenceTransformer
+
+                self._model = SentenceTransformer(EMBEDDING_MODEL)
+                logger.info("Semantic cache using embedding model %s", EMBEDDING_MODEL)
+            except Exception as e:
+                self._model_failed = True
+                logger.warning("Semantic cache falling back to exact matching: %s", e)
+        return self._model
+
+    def embed(self, text: str):
+        """Normalized embedding for `text`, or None when no model is loaded."""
+        model = self._get_model()
+        if model is None:
+            return None
+        return model.encode(text, normalize_embeddings=True)
+
+    # -----------------------------
+    # LOOKUP / STORE
+    # -----------------------------
+
+    def _live_entries(self, digest: str, now: float) -> List[Tuple[float, str, Any, str, tuple]]:
+        entries = self._entries.get(digest)
+        if not entries:
+            return []
+        live = [e for e in entries if e[0] > now]
+        if len(live) != len(entries):
+            self._size -= len(entries) - len(live)
+            for e in entries:
+                if e[0] <= now:
+                    self._exact.pop((digest, e[1]), None)
+            if live:
+                self._entries[digest] = live
+            else:
+                del self._entries[digest]
+        return live
+
+    def lookup(self, query: str, chat_history: Sequence[Any]) -> Tuple[Optional[str], Any]:
+        """
+        Find a cached answer for `query` in the current conversation state.
+
+        Returns:
+            (answer or None, query embedding) — the embedding is handed back
+            so a miss can be stored without encoding the query twice.
+        """
+        normalized = normalize_query(query)
+        digest = history_digest(chat_history)
+
+        with self._lock:
+            exact = self._exact.get((digest, normalized))
+            if exact is not None and exact[0] > time.monotonic():
+                self.hits += 1
+                return exact[1], None
+
+        vector = self.embed(normalized)
+        terms = key_terms(normalized, self.is_entity)
+        now = time.monotonic()
+
+        with self._lock:
+            entries = self._live_entries(digest, now)
+            answer = None
+            if vector is not None and entries:
+                import numpy as np
+
+                # Only queries about the same numbers and names can share an answer
+                candidates = [e for e in entries if e[2] is not None and e[4] == terms]
+                if candidates:
+                    scores = np.stack([e[2] for e in candidates]) @ vector
+                    best = int(scores.argmax())
+                    if scores[best] >= self.threshold:
+                        answer = candidates[best][3]
+
+            if answer is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return answer, vector
+
+    def store(self, query: str, chat_history: Sequence[Any], answer: str, vector: Any = None) -> None:
+        """Cache `answer`; `vector` is the embedding returned by lookup()."""
+        normalized = normalize_query(query)
+        digest = history_digest(chat_history)
+        terms = key_terms(normalized, self.is_entity)
+        with self._lock:
+            self._insert(digest, time.monotonic() + self.ttl, normalized, vector, answer, terms)
+
+    def _insert(
+        self, digest: str, expires: float, normalized: str, vector: Any, answer: str, terms: tuple
+    ) -> None:
+        if self._size >= self.max_entries:
+            # Drop the oldest partition rather than scanning every entry
+            oldest = next(iter(self._entries))
+            dropped = self._entries.pop(oldest)
+            self._size -= len(dropped)
+            for e in dropped:
+                self._exact.pop((oldest, e[1]), None)
+        self._entries.setdefault(digest, []).append((expires, normalized, vector, answer, terms))
+        self._exact[(digest, normalized)] = (expires, answer)
+        self._size += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._exact.clear()
+            self._size = 0
+
+    # -----------------------------
+    # PERSISTENCE
+    # -----------------------------
+
+    def save(self, path: Path = CACHE_FILE, data_version: Any = None) -> None:
+        """
+        Write live entries to `path`.npy (embeddings) and `path`.json (entries).
+
+        `data_version` identifies the FPL data the answers were built from;
+        load() discards the file when it no longer matches.
+        """
+        import numpy as np
+
+        with self._lock:
+            now = time.monotonic()
+            entries = [
+                (digest, e) for digest in list(self._entries)
+                for e in self._live_entries(digest, now)
+            ]
+        wall_offset = time.time() - now
+        vectors = [e[2] for _, e in entries if e[2] is not None]
+        records = []
+        row = 0
+        for digest, (expires, normalized, vector, answer, _) in entries:
+            records.append({
+                "digest": digest,
+                "query": normalized,
+                "answer": answer,
+                "expires": expires + wall_offset,
+                "row": row if vector is not None else -1,
+            })
+            row += vector is not None
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path.with_suffix(".npy"), "wb") as f:
+                np.save(f, np.stack(vectors) if vectors else np.empty((0, 0), dtype=np.float32))
+            path.with_suffix(".json").write_bytes(
+                orjson.dumps({"data_version": data_version, "entries": records})
+            )
+            logger.debug("Saved %d semantic cache entries to %s", len(records), path)
+        except Exception as e:
+            logger.warning("Failed to save semantic cache: %s", e)
+
+    def load(self, path: Path = CACHE_FILE, data_version: Any = None) -> int:
+        """
+        Restore unexpired entries written by save(); returns how many were loaded.
+
+        Nothing is loaded if the file was saved against a different
+        `data_version`, since those answers may describe outdated data.
+        """
+        try:
+            import numpy as np
+
+            saved = orjson.loads(path.with_suffix(".json").read_bytes())
+            matrix = np.load(path.with_suffix(".npy"), allow_pickle=False)
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            logger.warning("Ignoring unreadable semantic cache: %s", e)
+            return 0
+        if not isinstance(saved, dict) or saved.get("data_version") != data_version:
+            logger.info("Semantic cache on disk predates the current FPL data; not loading it")
+            return 0
+        records = saved["entries"]
+
+        wall_offset = time.time() - time.monotonic()
+        loaded = 0
+        with self._lock:
+            for r in records:
+                expires = r["expires"] - wall_offset
+                if expires <= time.monotonic():
+                    continue
+                vector = matrix[r["row"]] if r["row"] >= 0 else None
+                terms = key_terms(r["query"], self.is_entity)
+                self._insert(r["digest"], expires, r["query"], vector, r["answer"], terms)
+                loaded += 1
+        logger.info("Loaded %d semantic cache entries from %s", loaded, path)
+        return loaded
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "semantic": self._model is not None,
+            }
+
+
+# Shared instance used by the API layer
+response_cache = SemanticCache()
@@ -33,7 +33,7 @@ from pymongo import DESCENDING
 # -----------------------------
 
 @tool
-def get_all_players_with_stats(session: Optional[Any] = None, timeout: Optional[int] = None) -> List[Dict]:
+def get_all_players_with_stats() -> List[Dict]:
     """
     Get all players with calculated statistics.
     
@@ -44,23 +44,29 @@ def get_all_players_with_stats(session: Optional[Any] = None, timeout: Optional[
     - Classifications: ownership_tier, form_tier, price_tier, transfer_trend
     - Metadata: _meta with fetched_at timestamp
     """
-    return stats.get_all_players_with_stats(session=session, timeout=timeout)
+    return stats.get_all_players_with_stats()
 
 
 @tool
-def get_player_stats(player_name: str) -> Dict:
+def get_player(player_name: str, include_live: bool = False) -> Dict:
     """
-    Get comprehensive stats for a specific player by name.
+    Get a specific player by name.
     
-    Includes all calculated metrics, expected stats analysis, and classifications.
-    Use this for detailed player analysis questions.
+    Answers from the in-memory cache when possible. Set include_live=True for
+    detailed analysis: fresh stats with all calculated metrics, expected stats
+    analysis, and classifications.
     
     Args:
         player_name: Player's web name (e.g., "Haaland") or full name
+        include_live: Fetch fresh enriched stats instead of the cached record
         
     Returns:
-        Enriched player dict with all stats, or {"error": "..."} if not found
+        Player dict, or {"error": "..."} if not found
     """
+    if not include_live:
+        player = cache.get_player_by_name(player_name)
+        if player:
+            return player
     result = stats.get_player_stats(player_name)
     if result is None:
         return {"error": f"Player '{player_name}' not found", "suggestion": "Try a different spelling or use the web_name"}
@@ -205,7 +211,7 @@ def get_player_info(player_name: str, include_stats: bool = True, formatted: boo
     Get comprehensive player information with smart caching.
     
     This tool automatically uses cache → MongoDB → API in that order.
-    Use this instead of get_player_by_name for better performance.
+    Use this instead of get_player when you need a formatted summary.
     
     Args:
         player_name: Player's web name or full name
@@ -242,12 +248,6 @@ def get_player_info(player_name: str, include_stats: bool = True, formatted: boo
     return player
 
 
-@tool
-def get_player_by_name(player_name: str) -> Dict:
-    """Fast lookup for one specific player. Consider using get_player_info for more features."""
-    return cache.get_player_by_name(player_name)
-
-
 @tool
 def get_current_gameweek() -> Dict:
     """Get the current gameweek information."""
@@ -274,6 +274,26 @@ def get_team_by_name(team_name: str) -> Dict:
     return cache.get_team_by_name(team_name)
 
 
+@tool
+def get_entity_by_name(name: str) -> Dict:
+    """
+    Resolve a name to either a player or a Premier League team in one lookup.
+    
+    Use this when it is unclear whether the user means a player or a team.
+    
+    Args:
+        name: Player web/full name or team name/short name
+        
+    Returns:
+        {"kind": "player" | "team", "data": {...}}, or {"error": "..."} if not found
+    """
+    match = cache.get_entity_by_name(name)
+    if match is None:
+        return {"error": f"No player or team named '{name}'"}
+    kind, record = match
+    return {"kind": kind, "data": record}
+
+
 @tool
 def get_team_summary(team_name: str) -> str:
     """
@@ -308,19 +328,17 @@ def get_fixture_difficulty(team_name: str, num_fixtures: int = 5) -> str:
 # -----------------------------
 
 @tool
-def load_core_game_data(session: Optional[Any] = None, timeout: Optional[int] = None, force_refresh: bool = False) -> Dict:
+def load_core_game_data(force_refresh: bool = False) -> Dict:
     """
     Load all core FPL data with caching (players, teams, gameweeks, fixtures).
     
     Args:
-        session: Optional requests session
-        timeout: Request timeout
         force_refresh: Force cache refresh even if valid
         
     Returns:
         Dict with all core game data
     """
-    return cache.load_core_game_data(session=session, timeout=timeout, force_refresh=force_refresh)
+    return cache.load_core_game_data(force_refresh=force_refresh)
 
 
 # -----------------------------
@@ -338,15 +356,15 @@ def scrape_livefpl_data(entry_id: int, headless: bool = True, timeout: int = 180
 # -----------------------------
 
 @tool
-def bootstrap_static(session: Optional[Any] = None, timeout: Optional[int] = None) -> Dict:
+def bootstrap_static() -> Dict:
     """Get bootstrap-static data (events, elements, teams, etc.)."""
-    return api_client.bootstrap_static(session=session, timeout=timeout)
+    return api_client.bootstrap_static()
 
 
 @tool
-def event_live(event_id: int, session: Optional[Any] = None, timeout: Optional[int] = None) -> Dict:
+def event_live(event_id: int) -> Dict:
     """Get live event data for a specific gameweek."""
-    return api_client.event_live(event_id, session=session, timeout=timeout)
+    return api_client.event_live(event_id)
 
 
 # -----------------------------
@@ -354,9 +372,9 @@ def event_live(event_id: int, session: Optional[Any] = None, timeout: Optional[i
 # -----------------------------
 
 @tool
-def get_manager_info(entry_id: int, session: Optional[Any] = None, timeout: Optional[int] = None) -> Dict:
+def get_manager_info(entry_id: int) -> Dict:
     """Get a manager's profile (team name, OR, team value)."""
-    return api_client.entry_summary(entry_id, session=session, timeout=timeout)
+    return api_client.entry_summary(entry_id)
 
 
 @tool
@@ -383,7 +401,7 @@ def get_manager_squad(entry_id: int, event_id: Optional[int] = None) -> Dict:
 
 
 @tool
-def get_live_gameweek_data(entry_id: int, session: Optional[Any] = None, timeout: Optional[int] = None) -> Dict:
+def get_live_gameweek_data(entry_id: int) -> Dict:
     """Get a manager's live GW performance."""
     return livefpl_scrape.scrape_livefpl_data(entry_id)
 
@@ -443,7 +461,9 @@ def search_knowledge_base(query: str) -> List[str]:
 
     load_dotenv()
 
-    MONGO_URI = os.getenv("MONGO_URI")
+    from backend.config import get_settings
+
+    MONGO_URI = get_settings().mongo_uri
     DB_NAME = os.getenv("DB_NAME")
     COLLECTION_NAME = "fpl_knowledge_base"
     ATLAS_VECTOR_SEARCH_INDEX_NAME = "default"
@@ -561,7 +581,7 @@ all_tools = [
     
     # Player & stats tools
     get_all_players_with_stats,
-    get_player_stats,
+    get_player,
     get_best_players,
     
     # NEW: Transfer & differential tools
@@ -572,9 +592,9 @@ all_tools = [
     
     # Rules & lookup tools
     get_fpl_rules,
-    get_player_by_name,
     get_current_gameweek,
     get_team_by_name,
+    get_entity_by_name,
     
     # Data loading
     load_core_game_data,
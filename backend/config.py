@@ -0,0 +1,43 @@
+"""
+Process configuration for the BenchBoost API, parsed from the environment
+(and `.env`) once and shared by every module.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Process configuration, parsed from the environment once."""
+    google_api_key: str
+    mongo_uri: str
+    host: str
+    port: int
+    reload: bool
+    # Per client and per worker process: Atlas shared tiers cap connections
+    # for the whole cluster, so idle sockets are not kept open by default
+    mongo_max_pool_size: int
+    mongo_min_pool_size: int
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            google_api_key=os.getenv("GOOGLE_API_KEY", ""),
+            mongo_uri=os.getenv("MONGO_URI", ""),
+            host=os.getenv("HOST", "0.0.0.0"),
+            port=int(os.getenv("PORT", "8000")),
+            reload=os.getenv("UVICORN_RELOAD", "false").lower() == "true",
+            mongo_max_pool_size=int(os.getenv("MONGO_MAX_POOL_SIZE", "50")),
+            mongo_min_pool_size=int(os.getenv("MONGO_MIN_POOL_SIZE", "0")),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """The process settings, with `.env` loaded first; parsed on first call."""
+    load_dotenv()
+    return Settings.from_env()
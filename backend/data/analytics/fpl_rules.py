@@ -2,6 +2,9 @@
 Enhanced RAG Knowledge Base for FPL Rules and Advanced Queries
 """
 
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
 FPL_RULES_KNOWLEDGE = {
     "team_rules": {
         "max_players_per_team": 3,
@@ -88,52 +91,101 @@ FPL_RULES_KNOWLEDGE = {
     }
 }
 
-FPL_SEARCHABLE_RULES = f"""
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    return value
+
+
+# Read-only so the one shared copy can be handed out without defensive copies
+FPL_RULES_KNOWLEDGE = _freeze(FPL_RULES_KNOWLEDGE)
+
+
+def rules_as_dict() -> dict:
+    """Plain-dict copy of FPL_RULES_KNOWLEDGE for JSON/tool output."""
+    return _thaw(FPL_RULES_KNOWLEDGE)
+
+
+_searchable_rules: Optional[str] = None
+
+
+def _build_searchable_rules() -> str:
+    """Render the rules text from FPL_RULES_KNOWLEDGE."""
+    # Sections referenced below, bound once for the f-string
+    _team = FPL_RULES_KNOWLEDGE["team_rules"]
+    _transfer = FPL_RULES_KNOWLEDGE["transfer_rules"]
+    _scoring = FPL_RULES_KNOWLEDGE["scoring_system"]
+    _goals = _scoring["goals"]
+    _clean_sheet = _scoring["clean_sheet"]
+    _captain = FPL_RULES_KNOWLEDGE["captain_rules"]
+    _strategy = FPL_RULES_KNOWLEDGE["strategy_concepts"]
+    _differential = _strategy["differential_players"]
+    _template = _strategy["template_players"]
+    _value = _strategy["value_picks"]
+    _form = _strategy["form_analysis"]
+    return f"""
 FPL Rules and Regulations:
 
 Team Building Rules:
-- Maximum players from one team: {FPL_RULES_KNOWLEDGE['team_rules']['max_players_per_team']} players
-- Total squad size: {FPL_RULES_KNOWLEDGE['team_rules']['squad_size']} players (11 starters + 4 bench)
-- Starting budget: £{FPL_RULES_KNOWLEDGE['team_rules']['starting_budget']}m million pounds
-- Free transfers per week: {FPL_RULES_KNOWLEDGE['team_rules']['free_transfers_per_week']} transfer
-- Extra transfer cost: {FPL_RULES_KNOWLEDGE['team_rules']['transfer_cost']} points penalty deduction
+- Maximum players from one team: {_team['max_players_per_team']} players
+- Total squad size: {_team['squad_size']} players (11 starters + 4 bench)
+- Starting budget: £{_team['starting_budget']}m million pounds
+- Free transfers per week: {_team['free_transfers_per_week']} transfer
+- Extra transfer cost: {_team['transfer_cost']} points penalty deduction
 
 Transfer Rules and Regulations:
-- Free transfers: {FPL_RULES_KNOWLEDGE['transfer_rules']['free_transfers']} per gameweek
-- Transfer deadline: {FPL_RULES_KNOWLEDGE['transfer_rules']['transfer_deadline']} before kickoff
-- Banking transfers: {FPL_RULES_KNOWLEDGE['transfer_rules']['transfer_banking']} maximum
-- Point deduction: {FPL_RULES_KNOWLEDGE['transfer_rules']['point_deduction']} points per extra transfer
-- Wildcard transfers: {FPL_RULES_KNOWLEDGE['transfer_rules']['wildcard_transfers']} transfers no penalty
-- Free hit chip: {FPL_RULES_KNOWLEDGE['transfer_rules']['free_hit_transfers']} for one gameweek only
-- Price changes: {FPL_RULES_KNOWLEDGE['transfer_rules']['price_changes']} at 1:30am GMT
+- Free transfers: {_transfer['free_transfers']} per gameweek
+- Transfer deadline: {_transfer['transfer_deadline']} before kickoff
+- Banking transfers: {_transfer['transfer_banking']} maximum
+- Point deduction: {_transfer['point_deduction']} points per extra transfer
+- Wildcard transfers: {_transfer['wildcard_transfers']} transfers no penalty
+- Free hit chip: {_transfer['free_hit_transfers']} for one gameweek only
+- Price changes: {_transfer['price_changes']} at 1:30am GMT
 
 Scoring System Points:
-- Goal by goalkeeper: {FPL_RULES_KNOWLEDGE['scoring_system']['goals']['goalkeeper']} points
-- Goal by defender: {FPL_RULES_KNOWLEDGE['scoring_system']['goals']['defender']} points  
-- Goal by midfielder: {FPL_RULES_KNOWLEDGE['scoring_system']['goals']['midfielder']} points
-- Goal by forward: {FPL_RULES_KNOWLEDGE['scoring_system']['goals']['forward']} points
-- Assist any position: {FPL_RULES_KNOWLEDGE['scoring_system']['assists']} points
-- Clean sheet goalkeeper: {FPL_RULES_KNOWLEDGE['scoring_system']['clean_sheet']['goalkeeper']} points
-- Clean sheet defender: {FPL_RULES_KNOWLEDGE['scoring_system']['clean_sheet']['defender']} points
-- Clean sheet midfielder: {FPL_RULES_KNOWLEDGE['scoring_system']['clean_sheet']['midfielder']} point
-- Yellow card penalty: {FPL_RULES_KNOWLEDGE['scoring_system']['cards']['yellow']} point
-- Red card penalty: {FPL_RULES_KNOWLEDGE['scoring_system']['cards']['red']} points
-- Goalkeeper saves: {FPL_RULES_KNOWLEDGE['scoring_system']['saves']['goalkeeper']} point per 3 saves
-- Goals conceded penalty: {FPL_RULES_KNOWLEDGE['scoring_system']['goals_conceded']['goalkeeper']} point per 2 goals (GK/DEF)
+- Goal by goalkeeper: {_goals['goalkeeper']} points
+- Goal by defender: {_goals['defender']} points  
+- Goal by midfielder: {_goals['midfielder']} points
+- Goal by forward: {_goals['forward']} points
+- Assist any position: {_scoring['assists']} points
+- Clean sheet goalkeeper: {_clean_sheet['goalkeeper']} points
+- Clean sheet defender: {_clean_sheet['defender']} points
+- Clean sheet midfielder: {_clean_sheet['midfielder']} point
+- Yellow card penalty: {_scoring['cards']['yellow']} point
+- Red card penalty: {_scoring['cards']['red']} points
+- Goalkeeper saves: {_scoring['saves']['goalkeeper']} point per 3 saves
+- Goals conceded penalty: {_scoring['goals_conceded']['goalkeeper']} point per 2 goals (GK/DEF)
 
 Captain and Chips:
-- Captain points: double points multiplier {FPL_RULES_KNOWLEDGE['captain_rules']['captain_multiplier']}x
-- Triple captain chip: {FPL_RULES_KNOWLEDGE['captain_rules']['triple_captain_chip']}x points for one gameweek
-- Bench boost chip: all {FPL_RULES_KNOWLEDGE['team_rules']['squad_size']} players score points
+- Captain points: double points multiplier {_captain['captain_multiplier']}x
+- Triple captain chip: {_captain['triple_captain_chip']}x points for one gameweek
+- Bench boost chip: all {_team['squad_size']} players score points
 - Free hit chip: unlimited transfers for one gameweek
 - Wildcard chip: unlimited transfers reset team
 
 Strategic Concepts:
-- Differential players: {FPL_RULES_KNOWLEDGE['strategy_concepts']['differential_players']['definition']}
-- Low ownership threshold: {FPL_RULES_KNOWLEDGE['strategy_concepts']['differential_players']['ownership_threshold']} differential
-- Template players: {FPL_RULES_KNOWLEDGE['strategy_concepts']['template_players']['definition']}
-- High ownership threshold: {FPL_RULES_KNOWLEDGE['strategy_concepts']['template_players']['ownership_threshold']} template
-- Value picks: {FPL_RULES_KNOWLEDGE['strategy_concepts']['value_picks']['definition']}
-- Budget range: {FPL_RULES_KNOWLEDGE['strategy_concepts']['value_picks']['price_range']} value
-- Form analysis: {FPL_RULES_KNOWLEDGE['strategy_concepts']['form_analysis']['short_term']} short term form
-"""
\ No newline at end of file
+- Differential players: {_differential['definition']}
+- Low ownership threshold: {_differential['ownership_threshold']} differential
+- Template players: {_template['definition']}
+- High ownership threshold: {_template['ownership_threshold']} template
+- Value picks: {_value['definition']}
+- Budget range: {_value['price_range']} value
+- Form analysis: {_form['short_term']} short term form
+"""
+
+
+def __getattr__(name: str):
+    # FPL_SEARCHABLE_RULES is rendered on first access rather than at import
+    global _searchable_rules
+    if name == "FPL_SEARCHABLE_RULES":
+        if _searchable_rules is None:
+            _searchable_rules = _build_searchable_rules()
+        return _searchable_rules
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
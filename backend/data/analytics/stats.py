@@ -1,14 +1,19 @@
 """FPL player statistics - calculated metrics and analysis"""
 
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
+import heapq
 from datetime import datetime
+from functools import lru_cache
 import requests
-from ..core.api_client import bootstrap_static, DEFAULT_TIMEOUT
-from .fpl_rules import FPL_RULES_KNOWLEDGE, FPL_SEARCHABLE_RULES
+from ..core import cache
+from ..core.api_client import bootstrap_static, bootstrap_static_stamped, cached_at, DEFAULT_TIMEOUT
+from . import fpl_rules
 from ..core.utils import (
     get_player_full_name,
     get_position_name,
     calculate_player_stats,
+    calculate_player_stats_bulk,
+    parse_numeric_fields_bulk,
     calculate_expected_performance,
     classify_ownership,
     classify_form,
@@ -18,6 +23,20 @@ from ..core.utils import (
 )
 from ..core.constants import POSITION_NAME_TO_ID, VALID_PLAYER_METRICS
 
+# (api_client fetch time, parsed bootstrap-static, lowercased web/full name ->
+# first matching element). The fetch time only changes when bootstrap-static
+# is fetched again, so until then lookups skip both the parse and the scan.
+_name_index: Tuple[Optional[float], Dict[str, Any], Dict[str, Dict[str, Any]]] = (None, {}, {})
+
+
+def _bootstrap(session: Optional[requests.Session], timeout: float) -> Dict[str, Any]:
+    """
+    The bootstrap payload already held in core data, fetched if core data is
+    missing or past its TTL. Paths that promise live numbers (player lookups,
+    transfer trends) call bootstrap_static directly instead.
+    """
+    return cache.get_core_bootstrap() or bootstrap_static(session=session, timeout=timeout)
+
 
 def get_all_players_with_stats(
     session: Optional[requests.Session] = None, 
@@ -39,17 +58,29 @@ def get_all_players_with_stats(
     Returns:
         List of dicts with player info and calculated stats.
     """
-    bootstrap = bootstrap_static(session=session, timeout=timeout)
+    bootstrap = _bootstrap(session, timeout)
+    return _players_with_stats(bootstrap, include_expected, include_classifications)
+
+
+def _players_with_stats(
+    bootstrap: Dict[str, Any],
+    include_expected: bool = True,
+    include_classifications: bool = True,
+) -> List[Dict[str, Any]]:
+    """Enriched active players for an already fetched bootstrap payload."""
     teams = {t["id"]: t for t in bootstrap.get("teams", [])}
     players_with_stats = []
 
-    for element in bootstrap.get("elements", []):
-        # Skip players who transferred out (status = 'u' for unavailable/transferred)
-        # Keep injured players (status = 'i', 'd', 's') as they're still active
-        status = element.get("status", "a")
-        if status == "u":  # 'u' = transferred out of Premier League
-            continue
+    # Skip players who transferred out (status = 'u' for unavailable/transferred)
+    # Keep injured players (status = 'i', 'd', 's') as they're still active
+    active = [e for e in bootstrap.get("elements", []) if e.get("status", "a") != "u"]
+
+    # Decimal-string fields parsed once, then derived stats in one vectorized pass
+    numeric = parse_numeric_fields_bulk(active)
+    calculated = calculate_player_stats_bulk(active, numeric)
+    fetched_at = datetime.now().isoformat()
 
+    for element, stats, fields in zip(active, calculated, numeric):
         # Get team info
         team = teams.get(element.get("team"))
         
@@ -60,6 +91,8 @@ def get_all_players_with_stats(
             include_calculated_stats=True,
             include_expected_stats=include_expected,
             include_classifications=include_classifications,
+            calculated_stats=stats,
+            numeric_fields=fields,
         )
         
         # Add transfer info
@@ -70,7 +103,7 @@ def get_all_players_with_stats(
         
         # Add metadata
         enriched["_meta"] = {
-            "fetched_at": datetime.now().isoformat(),
+            "fetched_at": fetched_at,
             "source": "fpl_api",
         }
 
@@ -78,6 +111,27 @@ def get_all_players_with_stats(
 
     return players_with_stats
 
+def _exact_name_index(
+    session: Optional[requests.Session], timeout: float
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """The current bootstrap-static payload and its name index, rebuilt only when it is refetched."""
+    global _name_index
+
+    fetched_at, bootstrap, index = _name_index
+    if fetched_at is None or cached_at("bootstrap-static") != fetched_at:
+        fetched_at, bootstrap = bootstrap_static_stamped(session=session, timeout=timeout)
+        index = {}
+        for element in bootstrap.get("elements", []):
+            web = element.get("web_name", "").lower()
+            full = f"{element.get('first_name', '')} {element.get('second_name', '')}".strip().lower()
+            # First element wins, matching the order of the old linear scan
+            for name in (web, full):
+                if name:
+                    index.setdefault(name, element)
+        _name_index = (fetched_at, bootstrap, index)
+    return bootstrap, index
+
+
 def get_player_stats(
     player_name: str, 
     session: Optional[requests.Session] = None, 
@@ -107,7 +161,9 @@ def get_player_stats(
     if not target:
         return None
 
-    bootstrap = bootstrap_static(session=session, timeout=timeout)
+    # Callers come here for fresh stats, so this tracks the API client's
+    # short-lived copy rather than hour-old core data
+    bootstrap, name_index = _exact_name_index(session, timeout)
     candidates = bootstrap.get("elements", [])
     teams = {t["id"]: t for t in bootstrap.get("teams", [])}
 
@@ -137,12 +193,10 @@ def get_player_stats(
         
         return enriched
 
-    # Build searchable strings - exact match first
-    for element in candidates:
-        web = element.get("web_name", "").lower()
-        full = f"{element.get('first_name', '')} {element.get('second_name', '')}".strip().lower()
-        if target == web or target == full:
-            return enrich(element)
+    # Exact match first: one hash lookup
+    element = name_index.get(target)
+    if element is not None:
+        return enrich(element)
 
     # Substring match
     substring_hits = []
@@ -186,15 +240,57 @@ def get_best_players(
     Returns:
         List of top players sorted by the specified metric
     """
-    players = get_all_players_with_stats(session=session, timeout=timeout)
-    
+    pos_normalized = position.upper() if position else None
+    if cache.get_core_bootstrap() is None:
+        # Core data expired or a refresh failed: rank a fresh payload unmemoized
+        ranked = _rank_players(
+            _players_with_stats(bootstrap_static(session=session, timeout=timeout)),
+            pos_normalized,
+            sort_by,
+            min_minutes,
+        )
+    else:
+        ranked = _ranked_core_players(
+            cache.core_data.get("built_at"), pos_normalized, sort_by, min_minutes
+        )
+    # Copies, so a caller editing its results can't corrupt the memoized view
+    return [dict(p) for p in ranked[:count]]
+
+
+@lru_cache(maxsize=64)
+def _ranked_core_players(
+    built_at: Optional[float],
+    position: Optional[str],
+    sort_by: str,
+    min_minutes: int,
+) -> Tuple[Dict[str, Any], ...]:
+    """
+    get_best_players ranking over core data's bootstrap payload, memoized per
+    core-data build (`built_at` changes on every reload). If core data was
+    swapped after the caller read `built_at`, this ranks the newer build,
+    which is never looked up under the old key again.
+    """
+    bootstrap = cache.core_data["bootstrap_static"]
+    return tuple(_rank_players(_players_with_stats(bootstrap), position, sort_by, min_minutes))
+
+
+# A reload makes every memoized ranking stale
+cache.add_refresh_listener(_ranked_core_players.cache_clear)
+
+
+def _rank_players(
+    players: List[Dict[str, Any]],
+    position: Optional[str],
+    sort_by: str,
+    min_minutes: int,
+) -> List[Dict[str, Any]]:
+    """Filter `players` for get_best_players and sort them by `sort_by`."""
     # Filter by minimum minutes
     players = [p for p in players if p.get("minutes", 0) >= min_minutes]
     
     # Filter by position
     if position:
-        pos_normalized = position.upper()
-        pos_id = POSITION_NAME_TO_ID.get(pos_normalized)
+        pos_id = POSITION_NAME_TO_ID.get(position)
         if pos_id:
             players = [p for p in players if p.get("element_type") == pos_id]
     
@@ -222,7 +318,7 @@ def get_best_players(
     if sort_by:
         players = sorted(players, key=lambda x: get_sort_value(x, sort_by), reverse=True)
     
-    return players[:count]
+    return players
 
 
 def get_transfer_trends(
@@ -242,12 +338,11 @@ def get_transfer_trends(
     Returns:
         List of players with transfer data, sorted by transfer volume
     """
-    players = get_all_players_with_stats(session=session, timeout=timeout)
+    # transfers_in_event/transfers_out_event move by the minute; fetch fresh
+    players = _players_with_stats(bootstrap_static(session=session, timeout=timeout))
     
     sort_key = "transfers_in_event" if direction == "in" else "transfers_out_event"
-    players = sorted(players, key=lambda x: x.get(sort_key, 0), reverse=True)
-    
-    return players[:count]
+    return heapq.nlargest(count, players, key=lambda x: x.get(sort_key, 0))
 
 
 def get_differentials(
@@ -289,10 +384,8 @@ def get_differentials(
         if pos_id:
             differentials = [p for p in differentials if p.get("element_type") == pos_id]
     
-    # Sort by form
-    differentials = sorted(differentials, key=lambda x: x.get("form", 0), reverse=True)
-    
-    return differentials[:count]
+    # Top by form
+    return heapq.nlargest(count, differentials, key=lambda x: x.get("form", 0))
 
 
 def get_underperformers(
@@ -336,10 +429,8 @@ def get_underperformers(
             p["xg_difference"] = xg_diff
             underperformers.append(p)
     
-    # Sort by most underperforming (most negative first)
-    underperformers = sorted(underperformers, key=lambda x: x.get("xg_difference", 0))
-    
-    return underperformers[:count]
+    # Most underperforming (most negative first)
+    return heapq.nsmallest(count, underperformers, key=lambda x: x.get("xg_difference", 0))
 
 
 def get_overperformers(
@@ -381,17 +472,17 @@ def get_overperformers(
             p["xg_difference"] = xg_diff
             overperformers.append(p)
     
-    # Sort by most overperforming
-    overperformers = sorted(overperformers, key=lambda x: x.get("xg_difference", 0), reverse=True)
-    
-    return overperformers[:count]
+    # Most overperforming first
+    return heapq.nlargest(count, overperformers, key=lambda x: x.get("xg_difference", 0))
 
 
 def get_fpl_rules() -> dict:
     """Return the full FPL rules knowledge base and a formatted string for conversational use."""
     return {
-        "knowledge_base": FPL_RULES_KNOWLEDGE,
-        "searchable_rules": FPL_SEARCHABLE_RULES,
+        # The module copy is read-only; tool output needs JSON-serializable dicts
+        "knowledge_base": fpl_rules.rules_as_dict(),
+        # Rendered on first use (module-level __getattr__)
+        "searchable_rules": fpl_rules.FPL_SEARCHABLE_RULES,
         "_meta": {
             "fetched_at": datetime.now().isoformat(),
             "source": "static_rules",
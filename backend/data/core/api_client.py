@@ -1,7 +1,20 @@
 """FPL API client - handles all HTTP requests to the Fantasy Premier League API"""
 from langchain_core.tools import tool
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+import atexit
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+import threading
+import time
+import weakref
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    import httpx
 
 # Module-level cache for most-recent fetched public data. Kept here to avoid
 # circular imports between `api_client` and `cache`.
@@ -9,7 +22,131 @@ latest_data: Dict[str, Any] = {}
  
 BASE_URL = "https://fantasy.premierleague.com/api"
 DEFAULT_TIMEOUT = 10.0
- 
+
+# Short-lived cache for public endpoints that only change on FPL's own schedule.
+# Keyed by (path, sorted params); authenticated requests are never cached.
+# Entries hold the raw response bytes and every caller parses its own copy, so
+# one caller mutating its dicts can't leak into another's.
+_CACHE_TTL = {"bootstrap-static": 300.0}
+_LIVE_PATH_RE = re.compile(r"event/\d+/live")
+_LIVE_TTL = 60.0
+_cache: Dict[Tuple[str, tuple], Tuple[float, bytes]] = {}
+_CACHE_LOCK = threading.Lock()
+
+# Keep-alive sessions for callers that don't pass their own, so repeat calls
+# reuse the TCP/TLS connection; transient upstream errors are retried.
+# requests.Session is not guaranteed thread-safe, so each thread gets its own.
+_thread_sessions = threading.local()
+# Closed at exit; weak so a finished thread's session can be collected
+_all_sessions: "weakref.WeakSet[requests.Session]" = weakref.WeakSet()
+_SESSIONS_LOCK = threading.Lock()
+# Long-lived workers for fetch_public_data, so their sessions stay warm
+_fetch_pool = ThreadPoolExecutor(max_workers=6, thread_name_prefix="fpl-api")
+
+
+def _new_session() -> requests.Session:
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=["GET"],
+                # Hand the final response back so _get raises its usual HTTPError
+                raise_on_status=False,
+            ),
+        ),
+    )
+    session.headers.update({"Accept-Encoding": "gzip", "User-Agent": "BenchBoost/2"})
+    return session
+
+
+def get_session() -> requests.Session:
+    """The calling thread's pooled session, used when callers don't pass their own."""
+    session = getattr(_thread_sessions, "session", None)
+    if session is None:
+        session = _thread_sessions.session = _new_session()
+        with _SESSIONS_LOCK:
+            _all_sessions.add(session)
+    return session
+
+
+@atexit.register
+def _close_sessions() -> None:
+    with _SESSIONS_LOCK:
+        for session in list(_all_sessions):
+            session.close()
+
+
+def _cache_ttl(path: str) -> Optional[float]:
+    """TTL in seconds for a cacheable path, or None if it should not be cached."""
+    if path in _CACHE_TTL:
+        return _CACHE_TTL[path]
+    if _LIVE_PATH_RE.fullmatch(path):
+        return _LIVE_TTL
+    return None
+
+
+@lru_cache(maxsize=128)
+def _build_url(path: str) -> str:
+    """Full endpoint URL for `path`; paths repeat heavily, so results are memoized."""
+    return f"{BASE_URL}/{path.strip('/')}/"
+
+
+def _fetch_raw(
+    path: str,
+    params: Optional[Dict[str, Any]],
+    cookies: Optional[Dict[str, Any]],
+    session: Optional[requests.Session],
+    timeout: float,
+) -> bytes:
+    url = _build_url(path)
+    req = session or get_session()
+    resp = req.get(url, params=params, cookies=cookies, timeout=timeout)
+    try:
+        resp.raise_for_status()
+    except requests.HTTPError:
+        # Attach response content for easier debugging
+        raise requests.HTTPError(
+            f"GET {url} failed: {resp.status_code} - {resp.text}"
+        )
+    return resp.content
+
+def _get_raw(
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    *,
+    cookies: Optional[Dict[str, Any]] = None,
+    session: Optional[requests.Session] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    force_refresh: bool = False,
+) -> Tuple[float, bytes]:
+    """The response bytes for `path` and the monotonic time they were fetched.
+
+    Cacheable responses come from `_cache` while fresh, so the time only
+    changes when a new response is fetched.
+    """
+    path = path.strip("/")
+    ttl = _cache_ttl(path) if cookies is None else None
+    if ttl is None:
+        return time.monotonic(), _fetch_raw(path, params, cookies, session, timeout)
+
+    key = (path, tuple(sorted((params or {}).items())))
+    if not force_refresh:
+        with _CACHE_LOCK:
+            entry = _cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry
+
+    entry = (time.monotonic(), _fetch_raw(path, params, cookies, session, timeout))
+    with _CACHE_LOCK:
+        _cache[key] = entry
+    return entry
+
 def _get(
     path: str,
     params: Optional[Dict[str, Any]] = None,
@@ -17,33 +154,84 @@ def _get(
     cookies: Optional[Dict[str, Any]] = None,
     session: Optional[requests.Session] = None,
     timeout: float = DEFAULT_TIMEOUT,
+    force_refresh: bool = False,
 ) -> Dict[str, Any]:
-    """Internal helper to GET and return JSON with basic error handling."""
-    url = f"{BASE_URL}/{path.lstrip('/')}/"
-    req = session or requests
-    resp = req.get(url, params=params, cookies=cookies, timeout=timeout)
-    try:
-        resp.raise_for_status()
-    except requests.HTTPError:
-        # Attach response content for easier debugging
+    """Internal helper to GET and return JSON with basic error handling.
+
+    Unauthenticated bootstrap-static and event live responses are served from
+    a module-level TTL cache (see `_CACHE_TTL`); `force_refresh` skips the
+    cached copy and stores the new response. Each call returns a freshly
+    parsed object.
+    """
+    # Parse the raw bytes directly; bootstrap-static is ~1MB of JSON
+    _, raw = _get_raw(
+        path, params, cookies=cookies, session=session, timeout=timeout, force_refresh=force_refresh
+    )
+    return orjson.loads(raw)
+
+
+def cached_at(path: str, params: Optional[Dict[str, Any]] = None) -> Optional[float]:
+    """Fetch time of the cached response for `path`, or None if absent or expired."""
+    path = path.strip("/")
+    ttl = _cache_ttl(path)
+    if ttl is None:
+        return None
+    with _CACHE_LOCK:
+        entry = _cache.get((path, tuple(sorted((params or {}).items()))))
+    if entry is None or time.monotonic() - entry[0] >= ttl:
+        return None
+    return entry[0]
+ 
+async def _get_async(
+    path: str,
+    client: "httpx.AsyncClient",
+    params: Optional[Dict[str, Any]] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Dict[str, Any]:
+    """Async counterpart of `_get` using a shared httpx client (no worker thread)."""
+    url = _build_url(path)
+    resp = await client.get(url, params=params, timeout=timeout)
+    if resp.is_error:
+        # Same error type as the sync client so callers handle both alike
         raise requests.HTTPError(
             f"GET {url} failed: {resp.status_code} - {resp.text}"
         )
-    return resp.json()
+    return orjson.loads(resp.content)
  
 def bootstrap_static(
-    session: Optional[requests.Session] = None, timeout: float = DEFAULT_TIMEOUT
+    session: Optional[requests.Session] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    force_refresh: bool = False,
 ) -> Dict[str, Any]:
     """Get bootstrap-static data (events, elements, teams, settings, etc.)."""
-    return _get("bootstrap-static", session=session, timeout=timeout)
+    return _get("bootstrap-static", session=session, timeout=timeout, force_refresh=force_refresh)
+ 
+def bootstrap_static_stamped(
+    session: Optional[requests.Session] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Tuple[float, Dict[str, Any]]:
+    """bootstrap_static plus the fetch time its response was cached under (see `cached_at`)."""
+    fetched_at, raw = _get_raw("bootstrap-static", session=session, timeout=timeout)
+    return fetched_at, orjson.loads(raw)
  
 def event_live(
     event_id: int,
     session: Optional[requests.Session] = None,
     timeout: float = DEFAULT_TIMEOUT,
+    force_refresh: bool = False,
 ) -> Dict[str, Any]:
     """Get live event data for a specific gameweek (event_id)."""
-    return _get(f"event/{int(event_id)}/live", session=session, timeout=timeout)
+    return _get(
+        f"event/{int(event_id)}/live", session=session, timeout=timeout, force_refresh=force_refresh
+    )
+ 
+async def event_live_async(
+    event_id: int,
+    client: "httpx.AsyncClient",
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Dict[str, Any]:
+    """Async `event_live` on a shared httpx client."""
+    return await _get_async(f"event/{int(event_id)}/live", client, timeout=timeout)
  
 def my_team(
     entry_id: int,
@@ -86,6 +274,22 @@ def entry_history(
     """Get an entry's historical season and GW statistics."""
     return _get(f"entry/{int(entry_id)}/history", session=session, timeout=timeout)
  
+async def entry_summary_async(
+    entry_id: int,
+    client: "httpx.AsyncClient",
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Dict[str, Any]:
+    """Async variant of `entry_summary`."""
+    return await _get_async(f"entry/{int(entry_id)}", client, timeout=timeout)
+ 
+async def entry_history_async(
+    entry_id: int,
+    client: "httpx.AsyncClient",
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Dict[str, Any]:
+    """Async variant of `entry_history`."""
+    return await _get_async(f"entry/{int(entry_id)}/history", client, timeout=timeout)
+ 
 def transfers_history(
     entry_id: int,
     session: Optional[requests.Session] = None,
@@ -109,6 +313,17 @@ def gameweek_picks(
         timeout=timeout,
     )
  
+async def gameweek_picks_async(
+    entry_id: int,
+    event_id: int,
+    client: "httpx.AsyncClient",
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Dict[str, Any]:
+    """Async `gameweek_picks` (public picks, no auth cookie) on a shared httpx client."""
+    return await _get_async(
+        f"entry/{int(entry_id)}/event/{int(event_id)}/picks", client, timeout=timeout
+    )
+ 
 def fixtures(
     event: Optional[int] = None,
     session: Optional[requests.Session] = None,
@@ -178,32 +393,33 @@ def fetch_public_data(
       Dict with keys for each fetched endpoint (always includes `bootstrap_static`).
     """
     
-    result: Dict[str, Any] = {}
- 
-    result["bootstrap_static"] = bootstrap_static(session=session, timeout=timeout)
+    # The endpoints are independent, so issue them concurrently; wall time is
+    # the slowest call rather than the sum. Each worker uses its own thread's
+    # default session. A caller-supplied session isn't shared across threads,
+    # so its requests run one after another.
+    jobs = [("bootstrap_static", partial(bootstrap_static, session=session, timeout=timeout))]
  
     if entry_id is not None:
-        result["entry_summary"] = entry_summary(
-            entry_id, session=session, timeout=timeout
-        )
+        jobs.append(("entry_summary", partial(entry_summary, entry_id, session=session, timeout=timeout)))
  
     if event_id is not None:
-        result["event_live"] = event_live(event_id, session=session, timeout=timeout)
-        result["fixtures_event"] = fixtures(
-            event=event_id, session=session, timeout=timeout
-        )
+        jobs.append(("event_live", partial(event_live, event_id, session=session, timeout=timeout)))
+        jobs.append(("fixtures_event", partial(fixtures, event=event_id, session=session, timeout=timeout)))
     else:
-        result["fixtures_all"] = fixtures(session=session, timeout=timeout)
+        jobs.append(("fixtures_all", partial(fixtures, session=session, timeout=timeout)))
  
     if element_id is not None:
-        result["element_summary"] = element_summary(
-            element_id, session=session, timeout=timeout
-        )
+        jobs.append(("element_summary", partial(element_summary, element_id, session=session, timeout=timeout)))
  
     if league_id is not None:
-        result["league_standings"] = league_standings(
-            league_id, session=session, timeout=timeout
-        )
+        jobs.append(("league_standings", partial(league_standings, league_id, session=session, timeout=timeout)))
+ 
+    if session is not None:
+        result: Dict[str, Any] = {key: fn() for key, fn in jobs}
+    else:
+        futures = [(key, _fetch_pool.submit(fn)) for key, fn in jobs]
+        # Collect in submission order so the result keys keep their usual order
+        result = {key: fut.result() for key, fut in futures}
  
     if persist:
         latest_data.clear()
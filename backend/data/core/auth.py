@@ -9,6 +9,7 @@ Supports:
 - Email/password login
 - Google OAuth login (via browser-based flow)
 """
+import orjson
 import requests
 from typing import Dict, Any, Optional
 
@@ -220,7 +221,7 @@ def get_my_team_authenticated(entry_id: int, cookie_string: str) -> Dict[str, An
     try:
         response = session.get(url, timeout=10)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     except requests.exceptions.HTTPError as e:
         if response.status_code == 401:
             return {"error": "Authentication expired. Please log in again."}
@@ -246,7 +247,7 @@ def get_me_authenticated(cookie_string: str) -> Dict[str, Any]:
     try:
         response = session.get(url, timeout=10)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     except requests.exceptions.HTTPError as e:
         if response.status_code == 401:
             return {"error": "Authentication expired. Please log in again."}
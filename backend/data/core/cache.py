@@ -8,13 +8,22 @@ Enhanced caching system for optimal LLM context access:
 - Smart invalidation on data updates
 """
 
-from typing import Any, Dict, Optional
-from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+import asyncio
 import logging
+import pickle
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from pymongo import DESCENDING
-from backend.database.db import get_db
+from pymongo.errors import OperationFailure, PyMongoError
+from backend.database.db import get_db, get_async_db
 from .api_client import bootstrap_static, fixtures, DEFAULT_TIMEOUT
 
 logger = logging.getLogger(__name__)
@@ -129,12 +138,125 @@ def invalidate_cache(key: Optional[str] = None) -> None:
     
     if key is None:
         logger.info("Clearing entire cache")
-        _cache.clear()
         _cache_stats["invalidations"] += len(_cache)
+        _cache.clear()
     elif key in _cache:
         logger.info(f"Invalidating cache key: {key}")
         del _cache[key]
         _cache_stats["invalidations"] += 1
+    _notify_refresh()
+
+
+# Called after core data is rebuilt or the cache is invalidated, for caches
+# built on top of it (e.g. the agent's response cache)
+_refresh_listeners: List[Callable[[], None]] = []
+
+
+def add_refresh_listener(callback: Callable[[], None]) -> None:
+    """Call `callback` whenever core data is reloaded or the cache is invalidated."""
+    _refresh_listeners.append(callback)
+
+
+def _notify_refresh() -> None:
+    for callback in _refresh_listeners:
+        try:
+            callback()
+        except Exception as e:
+            logger.warning(f"Cache refresh listener failed: {e}")
+
+
+# Change-stream reconnect backoff, and the poll interval used instead on a
+# deployment without change streams (standalone mongod)
+_CACHE_EVENT_MAX_BACKOFF = 60.0
+_CACHE_EVENT_POLL_SECONDS = 15.0
+# "$changeStream is only supported on replica sets"
+_NOT_REPLICA_SET = 40573
+
+
+def _poll_cache_events(db) -> None:
+    """Clear the cache whenever a newer invalidate event appears in `cache_events`."""
+    last_seen = datetime.now(timezone.utc)
+    while True:
+        time.sleep(_CACHE_EVENT_POLL_SECONDS)
+        try:
+            latest = db.cache_events.find_one(
+                {"type": "invalidate", "ts": {"$gt": last_seen}},
+                projection={"ts": 1},
+                sort=[("ts", DESCENDING)],
+            )
+        except PyMongoError as e:
+            logger.warning(f"Polling cache events failed: {e}")
+            continue
+        if latest is not None:
+            last_seen = latest["ts"]
+            invalidate_cache()
+
+
+def _watch_cache_events() -> None:
+    """
+    Clear the cache whenever an ingestion run publishes an invalidate event.
+
+    A dropped stream is reopened with backoff from the last resume token, so
+    events published in between are still delivered. Without change streams
+    it falls back to polling.
+    """
+    db = get_db()
+    resume_token = None
+    backoff = 1.0
+    while True:
+        try:
+            with db.cache_events.watch(
+                [{"$match": {"operationType": "insert"}}], resume_after=resume_token
+            ) as stream:
+                backoff = 1.0
+                resume_token = stream.resume_token or resume_token
+                for change in stream:
+                    resume_token = stream.resume_token
+                    if change["fullDocument"].get("type") == "invalidate":
+                        invalidate_cache()
+        except OperationFailure as e:
+            if e.code == _NOT_REPLICA_SET:
+                logger.info("Change streams unavailable; polling cache_events instead")
+                _poll_cache_events(db)
+                return
+            # E.g. the resume token fell off the oplog: events may have been
+            # missed, so start over from now with a clean cache
+            logger.warning(f"Cache event stream failed, restarting it: {e}")
+            if resume_token is not None:
+                resume_token = None
+                invalidate_cache()
+        except PyMongoError as e:
+            logger.warning(f"Cache event stream interrupted, retrying in {backoff:.0f}s: {e}")
+        time.sleep(backoff)
+        backoff = min(backoff * 2, _CACHE_EVENT_MAX_BACKOFF)
+
+
+_listener_thread: Optional[threading.Thread] = None
+
+
+def start_cache_event_listener() -> None:
+    """
+    Subscribe to the `cache_events` change stream in a daemon thread.
+
+    Ingestion publishes to this collection instead of clearing caches inline,
+    which also reaches API processes other than the one running the ingest.
+    Change streams require a replica set (e.g. Atlas); on a standalone server
+    the listener polls the collection instead.
+    """
+    global _listener_thread
+
+    if _listener_thread is not None and _listener_thread.is_alive():
+        return
+
+    def _run():
+        try:
+            _watch_cache_events()
+        except Exception as e:
+            logger.warning(f"Cache event listener stopped: {e}")
+
+    _listener_thread = threading.Thread(target=_run, name="cache-events", daemon=True)
+    _listener_thread.start()
+    logger.info("Listening for cache invalidation events")
 
 
 def get_cache_stats() -> Dict[str, Any]:
@@ -171,10 +293,122 @@ core_data: Dict[str, Any] = {
 }
 
 
+# Per-table views of core_data bound by _set_core_data, so lookups are a
+# single dict get
+_players: Dict[int, Any] = {}
+_players_by_name: Dict[str, Any] = {}
+_teams: Dict[int, Any] = {}
+_teams_by_name: Dict[str, Any] = {}
+_gameweeks: Dict[int, Any] = {}
+_fixtures: Dict[int, Any] = {}
+_entity_index: Dict[str, Any] = {}
+
+
+def _set_core_data(data: Dict[str, Any]) -> None:
+    """Swap in `data` as core_data and rebind the lookup views."""
+    global core_data, _players, _players_by_name, _teams, _teams_by_name, _gameweeks, _fixtures
+    global _entity_index
+
+    core_data = data
+    _players = data["players"]
+    _players_by_name = data["players_by_name"]
+    _teams = data["teams"]
+    _teams_by_name = data["teams_by_name"]
+    _gameweeks = data["gameweeks"]
+    _fixtures = data["fixtures"]
+    _entity_index = data["entity_index"]
+    _resolve_player.cache_clear()
+    _resolve_team.cache_clear()
+
+
 # ============================================================================
 # DATA LOADING WITH CACHING
 # ============================================================================
 
+# Serializes rebuilds of core_data; readers never take it
+_core_data_lock = threading.Lock()
+# Fetches fixtures alongside bootstrap-static; long-lived so its thread's
+# HTTP session keeps its connection between refreshes
+_fixtures_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="core-data")
+
+
+def build_core_data(
+    session: Optional[requests.Session] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    force_refresh: bool = False,
+) -> Dict[str, Any]:
+    """
+    Fetch and organize core game data into a new dict.
+
+    Does not touch the module-level `core_data`; load_core_game_data swaps
+    the result in once it is complete. `force_refresh` also bypasses the API
+    client's short-lived bootstrap-static cache.
+    """
+    # bootstrap-static (main data source) and fixtures are independent; fetch
+    # them side by side and build the bootstrap tables while fixtures arrive.
+    # A caller's session isn't shared across threads, so with one they run in turn
+    if session is not None:
+        data = _organize_bootstrap(
+            bootstrap_static(session=session, timeout=timeout, force_refresh=force_refresh)
+        )
+        data["fixtures"] = {f.get("id"): f for f in fixtures(session=session, timeout=timeout)}
+    else:
+        fixtures_future = _fixtures_pool.submit(fixtures, timeout=timeout)
+        bs = bootstrap_static(timeout=timeout, force_refresh=force_refresh)
+        data = _organize_bootstrap(bs)
+        data["fixtures"] = {f.get("id"): f for f in fixtures_future.result()}
+    # Identifies this build (kept through snapshots) for caches derived from it
+    data["built_at"] = time.time()
+    return data
+
+
+def _organize_bootstrap(bs: Dict[str, Any]) -> Dict[str, Any]:
+    """Index the bootstrap-static payload by id and name."""
+    # Skip players who transferred out of Premier League
+    active = [p for p in bs.get("elements", ()) if p.get("status") != "u"]
+    teams = bs.get("teams", ())
+
+    data: Dict[str, Any] = {
+        "players": {p.get("id"): p for p in active},
+        # Web name and full name, so queries like "Erling Haaland" also match
+        "players_by_name": {
+            name.lower(): p
+            for p in active
+            for name in (
+                p.get("web_name", ""),
+                f"{p.get('first_name', '')} {p.get('second_name', '')}".strip(),
+            )
+            if name
+        },
+        "teams": {t.get("id"): t for t in teams},
+        "teams_by_name": {
+            name.lower(): t
+            for t in teams
+            for name in (t.get("name", ""), t.get("short_name", ""))
+            if name
+        },
+        # Organize gameweeks by ID
+        "gameweeks": {e.get("id"): e for e in bs.get("events", ())},
+    }
+    # Every player and team alias in one table, for "who/what is X" lookups;
+    # a team name takes precedence over a player with the same name
+    entity_index = {name: ("player", p) for name, p in data["players_by_name"].items()}
+    entity_index.update((name, ("team", t)) for name, t in data["teams_by_name"].items())
+    data["entity_index"] = entity_index
+    # Resolved once here so the per-turn lookups are a single dict get
+    data["current_gameweek_id"] = next(
+        (gid for gid, gw in data["gameweeks"].items() if gw.get("is_current")), None
+    )
+    data["next_gameweek_id"] = next(
+        (gid for gid, gw in data["gameweeks"].items() if gw.get("is_next")), None
+    )
+    
+    # Store full bootstrap data for reference
+    data["bootstrap_static"] = bs
+    data["game_settings"] = bs.get("game_settings", {})
+    return data
+
+
 def load_core_game_data(
     session: Optional[requests.Session] = None,
     timeout: float = DEFAULT_TIMEOUT,
@@ -190,6 +424,8 @@ def load_core_game_data(
     - All fixtures
     
     Data is cached with TTL and stored in module-level `core_data` dict.
+    A refresh builds the new data on the side and swaps it in with a single
+    assignment, so readers keep serving the previous data until then.
     
     Args:
         session: Optional requests session
@@ -199,83 +435,135 @@ def load_core_game_data(
     Returns:
         Dict with the organized core data
     """
-    global core_data
-    
     # Check cache first (unless force refresh)
     if not force_refresh:
         cached = _get_from_cache("core_game_data")
         if cached is not None:
-            core_data = cached
+            if cached is not core_data:
+                _set_core_data(cached)
             return core_data
     
-    logger.info("Loading core game data from API...")
-    
-    # Fetch bootstrap-static (main data source)
-    bs = bootstrap_static(session=session, timeout=timeout)
-    
-    # Organize players by ID and name
-    core_data["players"] = {}
-    core_data["players_by_name"] = {}
-    
-    for player in bs.get("elements", []):
-        # Skip players who transferred out of Premier League
-        if player.get("status") == "u":
-            continue
-        
-        player_id = player.get("id")
-        web_name = player.get("web_name", "")
-        full_name = f"{player.get('first_name', '')} {player.get('second_name', '')}".strip()
-        
-        core_data["players"][player_id] = player
-        if web_name:
-            core_data["players_by_name"][web_name.lower()] = player
-        if full_name:
-            # Also map full name to enable queries like "Erling Haaland"
-            core_data["players_by_name"][full_name.lower()] = player
-    
-    # Organize teams by ID and name
-    core_data["teams"] = {}
-    core_data["teams_by_name"] = {}
-    
-    for team in bs.get("teams", []):
-        team_id = team.get("id")
-        team_name = team.get("name", "")
-        team_short_name = team.get("short_name", "")
-        
-        core_data["teams"][team_id] = team
-        if team_name:
-            core_data["teams_by_name"][team_name.lower()] = team
-        if team_short_name:
-            core_data["teams_by_name"][team_short_name.lower()] = team
-    
-    # Organize gameweeks by ID
-    core_data["gameweeks"] = {}
-    
-    for event in bs.get("events", []):
-        event_id = event.get("id")
-        core_data["gameweeks"][event_id] = event
+    with _core_data_lock:
+        # Another thread may have finished a load while we waited
+        if not force_refresh:
+            cached = _get_from_cache("core_game_data")
+            if cached is not None:
+                if cached is not core_data:
+                    _set_core_data(cached)
+                return core_data
+
+        logger.info("Loading core game data from API...")
+        new_data = build_core_data(session=session, timeout=timeout, force_refresh=force_refresh)
+
+        # Atomic swap: readers see either the old dict or the complete new one
+        _set_core_data(new_data)
+        _set_in_cache("core_game_data", new_data, CACHE_TTL["bootstrap_static"])
+    _notify_refresh()
     
-    # Fetch and organize all fixtures
-    all_fixtures = fixtures(session=session, timeout=timeout)
-    core_data["fixtures"] = {}
+    logger.info(f"Loaded {len(new_data['players'])} players, "
+                f"{len(new_data['teams'])} teams, "
+                f"{len(new_data['gameweeks'])} gameweeks, "
+                f"{len(new_data['fixtures'])} fixtures")
     
-    for fixture in all_fixtures:
-        fixture_id = fixture.get("id")
-        core_data["fixtures"][fixture_id] = fixture
+    return new_data
+
+
+def get_core_bootstrap() -> Optional[Dict[str, Any]]:
+    """
+    The bootstrap-static payload held in core_data, or None if core data is
+    not loaded or its cache entry has expired (e.g. a scheduled refresh failed).
+    """
+    entry = _cache.get("core_game_data")
+    if entry is None or entry.data is not core_data or entry.is_expired():
+        return None
+    return core_data.get("bootstrap_static")
+
+
+# ============================================================================
+# DISK SNAPSHOT (survives uvicorn reloads)
+# ============================================================================
+
+SNAPSHOT_FILE = Path.home() / ".benchboost" / "core_data.pkl.z"
+SNAPSHOT_VERSION = "fpl-core-v5"
+
+
+def _next_deadline() -> Optional[float]:
+    """Epoch seconds of the next gameweek deadline in core_data, if known."""
+    gw = get_next_gameweek()
+    deadline = gw.get("deadline_time") if gw else None
+    if not deadline:
+        return None
+    try:
+        return datetime.fromisoformat(deadline.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def save_snapshot(snapshot_file: Path = SNAPSHOT_FILE) -> None:
+    """
+    Persist the loaded core data to disk so a restart can skip the API fetch.
     
-    # Store full bootstrap data for reference
-    core_data["bootstrap_static"] = bs
-    core_data["game_settings"] = bs.get("game_settings", {})
+    Args:
+        snapshot_file: Path to the compressed pickle file
+    """
+    try:
+        snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+        payload = pickle.dumps(
+            (SNAPSHOT_VERSION, _next_deadline(), core_data),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        tmp_file = snapshot_file.with_suffix(".tmp")
+        tmp_file.write_bytes(zlib.compress(payload, 1))
+        tmp_file.replace(snapshot_file)
+        logger.debug(f"Saved core data snapshot to {snapshot_file}")
+    except Exception as e:
+        logger.warning(f"Failed to save core data snapshot: {e}")
+
+
+def load_snapshot(
+    snapshot_file: Path = SNAPSHOT_FILE,
+    max_age_seconds: int = CACHE_TTL["bootstrap_static"]
+) -> bool:
+    """
+    Load core data from a disk snapshot if it is fresh enough.
     
-    # Cache the loaded data
-    _set_in_cache("core_game_data", core_data, CACHE_TTL["bootstrap_static"])
+    A snapshot is also rejected once the gameweek deadline that followed it
+    has passed, since squads, prices and the current gameweek change there.
     
-    logger.info(f"Loaded {len(core_data['players'])} players, "
-                f"{len(core_data['teams'])} teams, "
-                f"{len(core_data['gameweeks'])} gameweeks, "
-                f"{len(core_data['fixtures'])} fixtures")
+    Args:
+        snapshot_file: Path to the compressed pickle file
+        max_age_seconds: Maximum snapshot age to accept
+        
+    Returns:
+        True if the cache was populated from disk
+    """
+    try:
+        age = time.time() - snapshot_file.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    if age >= max_age_seconds:
+        return False
     
-    return core_data
+    try:
+        version, deadline, data = pickle.loads(zlib.decompress(snapshot_file.read_bytes()))
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable core data snapshot: {e}")
+        return False
+    if version != SNAPSHOT_VERSION:
+        return False
+    ttl = max_age_seconds - age
+    if deadline is not None:
+        if deadline <= time.time():
+            logger.info("Core data snapshot predates the last deadline; refetching")
+            return False
+        ttl = min(ttl, deadline - time.time())
+    
+    _set_core_data(data)
+    # Expire together with the snapshot (or at the deadline) rather than a full TTL from now
+    _set_in_cache("core_game_data", core_data, int(ttl))
+    logger.info(f"Loaded core data snapshot ({len(core_data.get('players', {}))} players, "
+                f"{int(age)}s old)")
+    return True
 
 
 # ============================================================================
@@ -284,40 +572,59 @@ def load_core_game_data(
 
 def get_player_by_id(player_id: int) -> Optional[Dict[str, Any]]:
     """Get player details by ID from core_data cache."""
-    return core_data.get("players", {}).get(player_id)
+    return _players.get(player_id)
+
+
+# Name lookups memoized on the raw name, so repeat queries for the same
+# player skip the lower() allocation; cleared whenever core_data is swapped
+@lru_cache(maxsize=256)
+def _resolve_player(player_name: str) -> Optional[Dict[str, Any]]:
+    return _players_by_name.get(player_name.lower())
+
+
+@lru_cache(maxsize=64)
+def _resolve_team(team_name: str) -> Optional[Dict[str, Any]]:
+    return _teams_by_name.get(team_name.lower())
 
 
 def get_player_by_name(player_name: str) -> Optional[Dict[str, Any]]:
     """Get player details by name (case-insensitive) from core_data cache."""
-    return core_data.get("players_by_name", {}).get(player_name.lower())
+    return _resolve_player(player_name)
 
 
 def get_team_by_id(team_id: int) -> Optional[Dict[str, Any]]:
     """Get team details by ID from core_data cache."""
-    return core_data.get("teams", {}).get(team_id)
+    return _teams.get(team_id)
 
 
 def get_team_by_name(team_name: str) -> Optional[Dict[str, Any]]:
     """Get team details by name (case-insensitive) from core_data cache."""
-    return core_data.get("teams_by_name", {}).get(team_name.lower())
+    return _resolve_team(team_name)
+
+
+def get_entity_by_name(name: str) -> Optional[tuple]:
+    """Resolve a player or team name (case-insensitive) to ("player"|"team", record)."""
+    return _entity_index.get(name.lower())
 
 
 def get_gameweek_by_id(gameweek_id: int) -> Optional[Dict[str, Any]]:
     """Get gameweek details by ID from core_data cache."""
-    return core_data.get("gameweeks", {}).get(gameweek_id)
+    return _gameweeks.get(gameweek_id)
 
 
 def get_current_gameweek() -> Optional[Dict[str, Any]]:
     """Get the current active gameweek from core_data cache."""
-    for gw in core_data.get("gameweeks", {}).values():
-        if gw.get("is_current"):
-            return gw
-    return None
+    return _gameweeks.get(core_data.get("current_gameweek_id"))
+
+
+def get_next_gameweek() -> Optional[Dict[str, Any]]:
+    """Get the next gameweek from core_data cache."""
+    return _gameweeks.get(core_data.get("next_gameweek_id"))
 
 
 def get_fixture_by_id(fixture_id: int) -> Optional[Dict[str, Any]]:
     """Get fixture details by ID from core_data cache."""
-    return core_data.get("fixtures", {}).get(fixture_id)
+    return _fixtures.get(fixture_id)
 
 
 def get_upcoming_fixtures_for_team(team_id: int, num_fixtures: int = 3) -> list:
@@ -394,6 +701,97 @@ def format_time_ago(dt):
     else:
         return f"{int(seconds // 86400)}d ago"
 
+# Only the fields the news feed renders, per videoprinter collection
+NEWS_PROJECTIONS = {
+    "price_changes": {"_id": 0, "player": 1, "change_type": 1, "new_price": 1, "timestamp": 1},
+    "player_status": {"_id": 0, "player": 1, "status": 1, "timestamp": 1},
+    "match_events": {"_id": 0, "event_type": 1, "player": 1, "scorer": 1, "assist": 1,
+                     "points": 1, "timestamp": 1},
+    "bonus_points": {"_id": 0, "players": 1, "timestamp": 1},
+    "team_news": {"_id": 0, "content": 1, "timestamp": 1},
+}
+NEWS_LIMIT = 20
+
+
+def _build_news_items(docs_by_collection: Dict[str, list]) -> list:
+    """Map the latest videoprinter documents to the frontend news schema."""
+    news_items = []
+    
+    # 1. Price Changes
+    # Schema: {player, change_type, new_price, timestamp}
+    for p in docs_by_collection["price_changes"]:
+        news_items.append({
+            "type": "price_change",
+            "player": p.get("player"),
+            "movement": "risen" if p.get("change_type") == "rise" else "fallen",
+            "price_text": f"£{p.get('new_price')}m",
+            "date": format_time_ago(p.get("timestamp")),
+            "raw_timestamp": p.get("timestamp")
+        })
+        
+    # 2. Player Status
+    # Schema: {player, status, team, timestamp}
+    for p in docs_by_collection["player_status"]:
+        news_items.append({
+            "type": "status",
+            "player": p.get("player"),
+            "status": p.get("status"),
+            "date": format_time_ago(p.get("timestamp")),
+            "raw_timestamp": p.get("timestamp")
+        })
+
+    # 3. Match Events (Goals, cards, saves)
+    # Schema: {event_type, player, timestamp, ...}
+    for e in docs_by_collection["match_events"]:
+        # Construct a status message based on event type
+        etype = e.get("event_type")
+        msg = etype.replace("_", " ").title()
+        
+        if etype == "goal":
+            msg = f"GOAL! {e.get('scorer')} scores"
+            if e.get("assist"):
+                msg += f" (Assist: {e.get('assist')})"
+        elif etype in ["yellow_card", "red_card"]:
+            msg = f"{etype.replace('_', ' ').title()} - {e.get('points')} pts"
+            
+        news_items.append({
+            "type": "match_event",
+            "player": e.get("scorer", e.get("player")), # Use scorer or player field
+            "status": msg,
+            "date": format_time_ago(e.get("timestamp")),
+            "raw_timestamp": e.get("timestamp")
+        })
+        
+    # 4. Bonus Points
+    for b in docs_by_collection["bonus_points"]:
+        # Flatten bonus players
+        players = b.get("players", [])
+        for player_bp in players:
+            news_items.append({
+                "type": "bonus",
+                "player": player_bp.get("player"),
+                "status": f"Bonus Points: {player_bp.get('bonus_points')} pts (Total: {player_bp.get('total_points')})",
+                "date": format_time_ago(b.get("timestamp")),
+                "raw_timestamp": b.get("timestamp")
+            })
+            
+    # 5. Team News
+    for t in docs_by_collection["team_news"]:
+        news_items.append({
+            "type": "team_news",
+            "player": "Team News",
+            "status": t.get("content"),
+            "date": format_time_ago(t.get("timestamp")),
+            "raw_timestamp": t.get("timestamp")
+        })
+
+    # Sort combined list by timestamp desc
+    news_items.sort(key=lambda x: x.get("raw_timestamp") or datetime.min, reverse=True)
+    
+    # Return top 50 mixed events
+    return news_items[:50]
+
+
 def get_cached_player_news(force_refresh: bool = False) -> list:
     """
     Get aggregated player news from MongoDB (Price Changes, Status, Matches).
@@ -401,88 +799,31 @@ def get_cached_player_news(force_refresh: bool = False) -> list:
     """
     try:
         db = get_db()
-        news_items = []
-        limit = 20
-        
-        # 1. Price Changes
-        # Schema: {player, change_type, new_price, timestamp}
-        prices = list(db.price_changes.find({}, {"_id": 0}).sort("timestamp", DESCENDING).limit(limit))
-        for p in prices:
-            news_items.append({
-                "type": "price_change",
-                "player": p.get("player"),
-                "movement": "risen" if p.get("change_type") == "rise" else "fallen",
-                "price_text": f"£{p.get('new_price')}m",
-                "date": format_time_ago(p.get("timestamp")),
-                "raw_timestamp": p.get("timestamp")
-            })
-            
-        # 2. Player Status
-        # Schema: {player, status, team, timestamp}
-        statuses = list(db.player_status.find({}, {"_id": 0}).sort("timestamp", DESCENDING).limit(limit))
-        for p in statuses:
-            news_items.append({
-                "type": "status",
-                "player": p.get("player"),
-                "status": p.get("status"),
-                "date": format_time_ago(p.get("timestamp")),
-                "raw_timestamp": p.get("timestamp")
-            })
-
-        # 3. Match Events (Goals, cards, saves)
-        # Schema: {event_type, player, timestamp, ...}
-        events = list(db.match_events.find({}, {"_id": 0}).sort("timestamp", DESCENDING).limit(limit))
-        for e in events:
-            # Construct a status message based on event type
-            etype = e.get("event_type")
-            msg = etype.replace("_", " ").title()
-            
-            if etype == "goal":
-                msg = f"GOAL! {e.get('scorer')} scores"
-                if e.get("assist"):
-                    msg += f" (Assist: {e.get('assist')})"
-            elif etype in ["yellow_card", "red_card"]:
-                msg = f"{etype.replace('_', ' ').title()} - {e.get('points')} pts"
-                
-            news_items.append({
-                "type": "match_event",
-                "player": e.get("scorer", e.get("player")), # Use scorer or player field
-                "status": msg,
-                "date": format_time_ago(e.get("timestamp")),
-                "raw_timestamp": e.get("timestamp")
-            })
-            
-        # 4. Bonus Points
-        bonuses = list(db.bonus_points.find({}, {"_id": 0}).sort("timestamp", DESCENDING).limit(limit))
-        for b in bonuses:
-            # Flatten bonus players
-            players = b.get("players", [])
-            for player_bp in players:
-                news_items.append({
-                    "type": "bonus",
-                    "player": player_bp.get("player"),
-                    "status": f"Bonus Points: {player_bp.get('bonus_points')} pts (Total: {player_bp.get('total_points')})",
-                    "date": format_time_ago(b.get("timestamp")),
-                    "raw_timestamp": b.get("timestamp")
-                })
-                
-        # 5. Team News
-        team_news = list(db.team_news.find({}, {"_id": 0}).sort("timestamp", DESCENDING).limit(limit))
-        for t in team_news:
-            news_items.append({
-                "type": "team_news",
-                "player": "Team News",
-                "status": t.get("content"),
-                "date": format_time_ago(t.get("timestamp")),
-                "raw_timestamp": t.get("timestamp")
-            })
-
-        # Sort combined list by timestamp desc
-        news_items.sort(key=lambda x: x.get("raw_timestamp") or datetime.min, reverse=True)
-        
-        # Return top 50 mixed events
-        return news_items[:50]
+        docs_by_collection = {
+            name: list(db[name].find({}, projection).sort("timestamp", DESCENDING).limit(NEWS_LIMIT))
+            for name, projection in NEWS_PROJECTIONS.items()
+        }
+        return _build_news_items(docs_by_collection)
         
     except Exception as e:
         logger.error(f"Failed to fetch aggregated news: {e}")
-        return []
\ No newline at end of file
+        return []
+
+
+async def get_cached_player_news_async() -> list:
+    """
+    Async variant of `get_cached_player_news` over Motor.
+    
+    The five collection reads run concurrently on the event loop, so serving
+    the news feed does not occupy a worker thread. Unlike the sync variant,
+    read errors propagate, so callers caching the result never cache a
+    failure as an empty feed.
+    """
+    db = get_async_db()
+    names = list(NEWS_PROJECTIONS)
+    results = await asyncio.gather(*(
+        db[name].find({}, NEWS_PROJECTIONS[name])
+        .sort("timestamp", DESCENDING).limit(NEWS_LIMIT).to_list(NEWS_LIMIT)
+        for name in names
+    ))
+    return _build_news_items(dict(zip(names, results)))
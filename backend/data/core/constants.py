@@ -9,7 +9,12 @@ Centralizes numbers and mappings to avoid duplication
 
 # Position ID to name mapping (consistent abbreviations)
 POSITION_ID_TO_NAME = {1: "GKP", 2: "DEF", 3: "MID", 4: "FWD"}
-POSITION_NAME_TO_ID = {"GKP": 1, "GK": 1, "DEF": 2, "MID": 3, "FWD": 4, "FORWARD": 4, "STRIKER": 4}
+POSITION_NAME_TO_ID = {
+    "GKP": 1, "GK": 1, "GOALKEEPER": 1,
+    "DEF": 2, "DEFENDER": 2,
+    "MID": 3, "MIDFIELDER": 3,
+    "FWD": 4, "FORWARD": 4, "STRIKER": 4,
+}
 
 # Position ID to full name
 POSITION_ID_TO_FULL_NAME = {
@@ -5,6 +5,7 @@ Consolidates common patterns to avoid duplication across modules.
 
 from typing import Dict, Any, Optional, List, Union
 from datetime import datetime
+import numpy as np
 from .constants import (
     POSITION_ID_TO_NAME, 
     POSITION_ID_TO_FULL_NAME,
@@ -114,6 +115,108 @@ def calculate_player_stats(player: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _column(players: List[Dict[str, Any]], key: str) -> np.ndarray:
+    """Numeric field of every player as a float64 array (missing/None -> 0)."""
+    return np.fromiter(
+        (p.get(key, 0) or 0 for p in players), dtype=np.float64, count=len(players)
+    )
+
+
+def _safe_div(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """Elementwise num / den, 0 wherever den is 0 (no per-row branch)."""
+    return np.divide(num, den, out=np.zeros_like(num), where=den > 0)
+
+
+def _round(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """np.round that agrees with Python's round() (used by calculate_player_stats)."""
+    rounded = np.round(values, ndigits)
+    # np.round scales, rounds and unscales, which can land on the other side
+    # of a near-halfway value; redo just those few with the builtin
+    scaled = values * 10 ** ndigits
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_half):
+        rounded[i] = round(float(values[i]), ndigits)
+    return rounded
+
+
+# FPL API fields that arrive as decimal strings (e.g. "5.3")
+NUMERIC_STRING_FIELDS = (
+    "form", "selected_by_percent", "points_per_game",
+    "influence", "creativity", "threat", "ict_index",
+)
+
+
+def parse_numeric_fields_bulk(players: List[Dict[str, Any]]) -> List[Dict[str, float]]:
+    """
+    Parse NUMERIC_STRING_FIELDS for every player with one NumPy conversion per field.
+    
+    Returns:
+        One {field: float} dict per player, in input order, for
+        enrich_player_data(numeric_fields=...)
+    """
+    if not players:
+        return []
+    columns = [
+        np.array([p.get(key, 0) or 0 for p in players], dtype=np.float64).tolist()
+        for key in NUMERIC_STRING_FIELDS
+    ]
+    return [dict(zip(NUMERIC_STRING_FIELDS, row)) for row in zip(*columns)]
+
+
+def calculate_player_stats_bulk(
+    players: List[Dict[str, Any]],
+    numeric_fields: Optional[List[Dict[str, float]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Vectorized calculate_player_stats over a list of players.
+    
+    Columns are extracted once and every derived stat is computed with
+    array arithmetic, then zipped back into one dict per player.
+    
+    Args:
+        players: Raw player dicts from FPL API
+        numeric_fields: Output of parse_numeric_fields_bulk for `players`;
+            points_per_game is taken from it instead of parsed again
+        
+    Returns:
+        List of dicts with the same keys as calculate_player_stats, in input order
+    """
+    if not players:
+        return []
+    
+    total_points = _column(players, "total_points")
+    minutes_played = _column(players, "minutes")
+    cost = _column(players, "now_cost") / 10  # Convert to millions
+    if numeric_fields is not None:
+        points_per_game = np.fromiter(
+            (f["points_per_game"] for f in numeric_fields), dtype=np.float64, count=len(players)
+        )
+    else:
+        # Comes from the API as a string like "5.3"; parsed in one C-level pass
+        points_per_game = np.array(
+            [p.get("points_per_game", 0) or 0 for p in players], dtype=np.float64
+        )
+    
+    # Calculate appearances (90 minute equivalents)
+    appearances = minutes_played / 90.0
+    
+    points_per_90 = _round(_safe_div(total_points, appearances), 2)
+    columns = {
+        "points_per_90": points_per_90,
+        "points_per_million": _round(_safe_div(total_points, cost), 2),
+        "points_per_game_per_million": _round(_safe_div(points_per_game, cost), 2),
+        "points_per_million_per_90": _round(_safe_div(points_per_90, cost), 2),
+        "goals_per_90": _round(_safe_div(_column(players, "goals_scored"), appearances), 2),
+        "assists_per_90": _round(_safe_div(_column(players, "assists"), appearances), 2),
+        "bonus_per_90": _round(_safe_div(_column(players, "bonus"), appearances), 2),
+        "appearances_90": _round(appearances, 1),
+    }
+    
+    keys = list(columns)
+    # tolist() hands back plain Python floats for JSON/orjson
+    return [dict(zip(keys, row)) for row in zip(*(a.tolist() for a in columns.values()))]
+
+
 def calculate_expected_performance(player: Dict[str, Any]) -> Dict[str, Any]:
     """
     Calculate expected vs actual performance metrics.
@@ -289,6 +392,8 @@ def enrich_player_data(
     include_calculated_stats: bool = True,
     include_expected_stats: bool = True,
     include_classifications: bool = True,
+    calculated_stats: Optional[Dict[str, Any]] = None,
+    numeric_fields: Optional[Dict[str, float]] = None,
 ) -> Dict[str, Any]:
     """
     Enrich raw player data with team info, position names, and calculated stats.
@@ -302,13 +407,19 @@ def enrich_player_data(
         include_calculated_stats: Whether to include PPM, points_per_90, etc.
         include_expected_stats: Whether to include xG/xA analysis
         include_classifications: Whether to include ownership/form/price tiers
+        calculated_stats: Precomputed calculate_player_stats result (e.g. from
+            calculate_player_stats_bulk); computed here if omitted
+        numeric_fields: Pre-parsed NUMERIC_STRING_FIELDS (e.g. from
+            parse_numeric_fields_bulk); parsed here if omitted
         
     Returns:
         Enriched player dict
     """
+    if numeric_fields is None:
+        numeric_fields = {key: float(player.get(key, 0) or 0) for key in NUMERIC_STRING_FIELDS}
     price = player.get("now_cost", 0) / 10
-    form = float(player.get("form", 0) or 0)
-    ownership = float(player.get("selected_by_percent", 0) or 0)
+    form = numeric_fields["form"]
+    ownership = numeric_fields["selected_by_percent"]
     
     enriched = {
         # Core identifiers
@@ -328,7 +439,7 @@ def enrich_player_data(
         
         # Core stats
         "form": form,
-        "points_per_game": float(player.get("points_per_game", 0) or 0),
+        "points_per_game": numeric_fields["points_per_game"],
         "total_points": player.get("total_points", 0),
         "minutes": player.get("minutes", 0),
         "selected_by_percent": ownership,
@@ -344,10 +455,10 @@ def enrich_player_data(
         "bps": player.get("bps", 0),
         
         # ICT
-        "influence": float(player.get("influence", 0) or 0),
-        "creativity": float(player.get("creativity", 0) or 0),
-        "threat": float(player.get("threat", 0) or 0),
-        "ict_index": float(player.get("ict_index", 0) or 0),
+        "influence": numeric_fields["influence"],
+        "creativity": numeric_fields["creativity"],
+        "threat": numeric_fields["threat"],
+        "ict_index": numeric_fields["ict_index"],
         
         # Availability
         "status": player.get("status", "a"),
@@ -392,7 +503,10 @@ def enrich_player_data(
     
     # Add calculated stats if requested
     if include_calculated_stats:
-        calculated = calculate_player_stats(player)
+        calculated = (
+            calculated_stats if calculated_stats is not None
+            else calculate_player_stats(player)
+        )
         enriched["derived_stats"] = calculated
         # Also add key metrics at top level for convenience
         enriched["points_per_90"] = calculated["points_per_90"]
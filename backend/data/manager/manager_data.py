@@ -1,5 +1,6 @@
 import requests
 import json
+import orjson
 
 class FPLDataFetcher:
     def __init__(self, manager_id=None, league_id=None, element_id=None, event_id=None, cookie=None):
@@ -34,8 +35,8 @@ class FPLDataFetcher:
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching {url}: {e}")
             return {}
 
@@ -164,7 +165,6 @@ def get_manager_squad_data(entry_id: int, event_id: int = None) -> dict:
         Dict with starting_xi, bench, and player details
     """
     from backend.data.core import api_client, cache
-    from backend.data.core.utils import get_player_full_name, get_position_name
     
     # Get current gameweek if not specified
     if event_id is None:
@@ -179,13 +179,65 @@ def get_manager_squad_data(entry_id: int, event_id: int = None) -> dict:
     if not picks_data or "picks" not in picks_data:
         return {"error": f"No team data found for manager {entry_id} in gameweek {event_id}"}
     
+    # Get live data for the gameweek to get actual points
+    live_data = api_client.event_live(event_id)
+    return build_manager_squad(entry_id, event_id, picks_data, live_data)
+
+
+async def get_manager_squad_data_async(entry_id: int, client, event_id: int = None) -> dict:
+    """
+    Async `get_manager_squad_data`: picks and live points are independent
+    requests, so both are fetched at once on the shared httpx client.
+    
+    Args:
+        entry_id: Manager's FPL entry ID
+        client: Shared httpx.AsyncClient
+        event_id: Gameweek number (defaults to current GW if None)
+    
+    Returns:
+        Same shape as get_manager_squad_data
+    """
+    import asyncio
+    from backend.data.core import api_client, cache
+    
+    if event_id is None:
+        current_gw = cache.get_current_gameweek()
+        if not current_gw:
+            return {"error": "Could not determine current gameweek"}
+        event_id = current_gw.get("id")
+    
+    picks_data, live_data = await asyncio.gather(
+        api_client.gameweek_picks_async(entry_id, event_id, client),
+        api_client.event_live_async(event_id, client),
+    )
+    
+    if not picks_data or "picks" not in picks_data:
+        return {"error": f"No team data found for manager {entry_id} in gameweek {event_id}"}
+    
+    return build_manager_squad(entry_id, event_id, picks_data, live_data)
+
+
+def build_manager_squad(entry_id: int, event_id: int, picks_data: dict, live_data: dict) -> dict:
+    """
+    Enrich raw picks with player details from cache and live points.
+    
+    Args:
+        entry_id: Manager's FPL entry ID
+        event_id: Gameweek number the picks belong to
+        picks_data: Response of the entry picks endpoint
+        live_data: Response of the event live endpoint
+    
+    Returns:
+        Dict with starting_xi, bench, and player details
+    """
+    from backend.data.core import cache
+    from backend.data.core.utils import get_player_full_name, get_position_name
+    
     picks = picks_data.get("picks", [])
     entry_history = picks_data.get("entry_history", {})
     active_chip = picks_data.get("active_chip")
     automatic_subs = picks_data.get("automatic_subs", [])
     
-    # Get live data for the gameweek to get actual points
-    live_data = api_client.event_live(event_id)
     live_elements = {e["id"]: e for e in live_data.get("elements", [])}
     
     # Enrich picks with player details from cache
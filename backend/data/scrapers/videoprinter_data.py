@@ -1,10 +1,15 @@
 import requests
 import json
+import orjson
 import re
 from bs4 import BeautifulSoup
 from datetime import datetime
 
 URL = "https://o8bbxwfg8k.execute-api.eu-west-1.amazonaws.com/dev/api/videprinter"
+REQUEST_TIMEOUT = 10.0
+
+# Reused across scheduled runs so the TLS connection stays alive between fetches
+_session = requests.Session()
 
 def parse_price_change(soup_element):
     """Parse a price change event from the HTML element."""
@@ -197,10 +202,10 @@ def parse_team_news(soup_element):
 
 def fetch_updates():
     """Fetch and parse all updates from the videprinter API."""
-    response = requests.get(URL)
+    response = _session.get(URL, timeout=REQUEST_TIMEOUT)
     response.raise_for_status()
     
-    data = response.json()
+    data = orjson.loads(response.content)
     html_content = data.get("details", "")
     timestamp = data.get("tme", "")
     
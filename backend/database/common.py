@@ -0,0 +1,216 @@
+"""
+Shared MongoDB schema and write helpers used by the ingestion scripts.
+"""
+
+import hashlib
+import logging
+import orjson
+from pymongo import ASCENDING, DESCENDING, ReplaceOne, UpdateOne
+
+logger = logging.getLogger(__name__)
+
+# (collection, index keys, create_index options)
+INDEX_SPECS = [
+    # 1. Players Collection
+    # Queries: By ID, By Name (text search), By Team, By Price/Stats
+    ("players", [("id", ASCENDING)], {"unique": True}),
+    ("players", [("web_name", ASCENDING)], {}),
+    ("players", [("second_name", ASCENDING)], {}),
+    ("players", [("team", ASCENDING)], {}),
+    ("players", [("element_type", ASCENDING)], {}),  # Position
+    # Compound index for sorting value
+    ("players", [("now_cost", ASCENDING), ("total_points", DESCENDING)], {}),
+    # Covers the "top players by points" read (sort + projected fields)
+    ("players", [("total_points", DESCENDING), ("web_name", ASCENDING), ("now_cost", ASCENDING)],
+     {"name": "top_players"}),
+
+    # 2. Teams Collection
+    ("teams", [("id", ASCENDING)], {"unique": True}),
+    ("teams", [("name", ASCENDING)], {}),
+    ("teams", [("short_name", ASCENDING)], {}),
+
+    # 3. Gameweeks (Events) Collection
+    ("gameweeks", [("id", ASCENDING)], {"unique": True}),
+    ("gameweeks", [("is_current", ASCENDING)], {}),
+    ("gameweeks", [("is_next", ASCENDING)], {}),
+
+    # 4. Fixtures Collection
+    ("fixtures", [("id", ASCENDING)], {"unique": True}),
+    ("fixtures", [("event", ASCENDING)], {}),  # Filter by Gameweek
+    ("fixtures", [("team_h", ASCENDING)], {}),  # Filter by Home Team
+    ("fixtures", [("team_a", ASCENDING)], {}),  # Filter by Away Team
+    ("fixtures", [("kickoff_time", ASCENDING)], {}),
+    # Upcoming fixtures in kickoff order; trailing keys make the read covered
+    ("fixtures",
+     [("finished", ASCENDING), ("kickoff_time", ASCENDING),
+      ("event", ASCENDING), ("team_h", ASCENDING), ("team_a", ASCENDING)],
+     {"name": "upcoming_fixtures", "partialFilterExpression": {"finished": False}}),
+
+    # 5. Price Changes Collection
+    ("price_changes", [("player", ASCENDING), ("timestamp", DESCENDING)], {"unique": True}),
+    ("price_changes", [("team", ASCENDING)], {}),
+    ("price_changes", [("change_type", ASCENDING)], {}),  # "rise" or "fall"
+    ("price_changes", [("timestamp", DESCENDING)], {}),
+
+    # 6. Player Status/Injuries Collection
+    ("player_status", [("player", ASCENDING), ("timestamp", DESCENDING)], {}),
+    ("player_status", [("team", ASCENDING)], {}),
+    ("player_status", [("status", "text")], {}),  # Full-text search on injury description
+
+    # 7. Match Events Collection (goals, cards, saves, etc.)
+    ("match_events", [("home_team", ASCENDING), ("event_type", ASCENDING), ("timestamp", DESCENDING)], {}),
+    ("match_events", [("player", ASCENDING)], {}),
+    ("match_events", [("event_type", ASCENDING)], {}),  # "goal", "yellow_card", etc.
+    ("match_events", [("timestamp", DESCENDING)], {}),
+
+    # 8. Bonus Points Collection
+    ("bonus_points", [("home_team", ASCENDING), ("timestamp", DESCENDING)], {}),
+    ("bonus_points", [("timestamp", DESCENDING)], {}),
+
+    # 9. Match Updates Collection (KO, HT, FT)
+    ("match_updates", [("home_team", ASCENDING), ("away_team", ASCENDING), ("timestamp", DESCENDING)], {}),
+    ("match_updates", [("timestamp", DESCENDING)], {}),
+
+    # 10. Team News Collection
+    ("team_news", [("timestamp", DESCENDING)], {}),
+    ("team_news", [("content", "text")], {}),  # Full-text search
+
+    # 11. Cache Events Collection (one invalidate event per ingest)
+    # TTL index: MongoDB removes events after a day; also serves the poll by ts
+    ("cache_events", [("ts", ASCENDING)], {"expireAfterSeconds": 86400}),
+]
+
+# Videoprinter update type -> target collection
+VIDEOPRINTER_COLLECTIONS = {
+    "price_change": "price_changes",
+    "status": "player_status",
+    "goal": "match_events",
+    "yellow_card": "match_events",
+    "red_card": "match_events",
+    "saves": "match_events",
+    "bonus": "bonus_points",
+    "match_update": "match_updates",
+    "team_news": "team_news",
+}
+
+# Fields identifying a unique Videoprinter update per collection. Every update
+# carries the scraped "date" marker, so the same event seen on a later run is
+# matched (and refreshed) instead of inserted again.
+VIDEOPRINTER_KEYS = {
+    "price_changes": ("player", "date"),
+    "player_status": ("player", "status", "date"),
+    "match_events": ("event_type", "player", "scorer", "home_team", "away_team",
+                     "home_score", "away_score", "date"),
+    "bonus_points": ("home_team", "away_team", "date"),
+    "match_updates": ("content", "date"),
+    "team_news": ("content", "date"),
+}
+
+
+def create_indexes(db, collections=None, target=None):
+    """
+    Defines and creates the schema indexes for efficient querying.
+
+    Args:
+        db: MongoDB database handle
+        collections: Optional list of collection names to restrict to
+        target: Optional collection to build the indexes on instead
+                (used to pre-index a staging collection before a swap)
+    """
+    logger.info("⚙️ Creating indexes...")
+    for coll_name, keys, options in INDEX_SPECS:
+        if collections is not None and coll_name not in collections:
+            continue
+        collection = target if target is not None else db[coll_name]
+        collection.create_index(keys, **options)
+    logger.info("✅ Indexes created successfully.")
+
+
+def swap_collection(db, name, docs, current_date_field=None):
+    """
+    Atomically replace a static collection with `docs`.
+
+    Documents are loaded into `<name>_staging`, indexed, then renamed over the
+    live collection with dropTarget, so readers never see an empty or
+    half-written collection.
+
+    If `current_date_field` is given, MongoDB stamps that field on every staged
+    document via `$currentDate` before the swap.
+    """
+    staging_name = f"{name}_staging"
+    staging = db[staging_name]
+    staging.drop()
+    staging.insert_many(docs, ordered=False, bypass_document_validation=True)
+    if current_date_field:
+        staging.update_many({}, {"$currentDate": {current_date_field: {"$type": "date"}}})
+    create_indexes(db, collections=[name], target=staging)
+    db.client.admin.command(
+        "renameCollection",
+        f"{db.name}.{staging_name}",
+        to=f"{db.name}.{name}",
+        dropTarget=True,
+    )
+
+
+def document_hash(doc):
+    """Stable 16-byte content hash of an API document (key order independent)."""
+    return hashlib.blake2b(orjson.dumps(doc, option=orjson.OPT_SORT_KEYS)).digest()[:16]
+
+
+def sync_collection(db, name, docs, key="id", current_date_field=None):
+    """
+    Bring a static collection in line with `docs`, writing only what changed.
+
+    Each document is stored with a content hash in `_h`. On later runs only
+    documents whose hash differs are replaced, and documents missing from
+    `docs` are deleted. An empty collection is loaded in one go through
+    swap_collection.
+
+    `docs` is not modified: the hash (and the `_id` pymongo adds on insert)
+    go on shallow copies, since callers may still hold the API payload.
+
+    Returns:
+        Number of documents written
+    """
+    docs = [{**doc, "_h": document_hash(doc)} for doc in docs]
+
+    collection = db[name]
+    existing = {d[key]: d.get("_h") for d in collection.find({}, {"_id": 0, key: 1, "_h": 1})}
+    if not existing:
+        swap_collection(db, name, docs, current_date_field=current_date_field)
+        return len(docs)
+
+    changed = [doc for doc in docs if existing.get(doc[key]) != doc["_h"]]
+    if changed:
+        ops = [ReplaceOne({key: doc[key]}, doc, upsert=True) for doc in changed]
+        collection.bulk_write(ops, ordered=False, bypass_document_validation=True)
+        if current_date_field:
+            collection.update_many(
+                {key: {"$in": [doc[key] for doc in changed]}},
+                {"$currentDate": {current_date_field: {"$type": "date"}}},
+            )
+
+    stale = existing.keys() - {doc[key] for doc in docs}
+    if stale:
+        collection.delete_many({key: {"$in": list(stale)}})
+
+    return len(changed)
+
+
+def upsert_updates(collection, docs, key_fields, timestamp):
+    """
+    Bulk upsert Videoprinter updates keyed on `key_fields`.
+    'timestamp' is only written on insert so it records when an update was first seen.
+    """
+    ops = [
+        UpdateOne(
+            {k: doc.get(k) for k in key_fields},
+            {
+                "$set": {k: v for k, v in doc.items() if k != "timestamp"},
+                "$setOnInsert": {"timestamp": timestamp},
+            },
+            upsert=True,
+        )
+        for doc in docs
+    ]
+    return collection.bulk_write(ops, ordered=False, bypass_document_validation=True)
@@ -1,22 +1,106 @@
 import os
+import threading
 from pymongo import MongoClient
+from pymongo.monitoring import ConnectionPoolListener
 from dotenv import load_dotenv
 
+from backend.config import get_settings
+
 load_dotenv()
 
-MONGO_URI = os.getenv("MONGO_URI")
+MONGO_URI = get_settings().mongo_uri or None
 DB_NAME = os.getenv("DB_NAME")
 COLLECTION_NAME = os.getenv("COLLECTION_NAME")
 
 
-client = MongoClient(MONGO_URI)
+# Pool sizing shared by every client in the app (MONGO_MAX_POOL_SIZE /
+# MONGO_MIN_POOL_SIZE). Each worker process opens its own pools, so the
+# defaults stay well under shared-tier cluster connection limits
+CLIENT_OPTIONS = {
+    "maxPoolSize": get_settings().mongo_max_pool_size,
+    "minPoolSize": get_settings().mongo_min_pool_size,
+    "maxIdleTimeMS": 300_000,
+    "serverSelectionTimeoutMS": 3000,
+    # Compress reply frames; zlib is the stdlib fallback if zstandard is missing
+    "compressors": "zstd,zlib",
+    "zlibCompressionLevel": 3,
+}
+
+
+
+class PoolStats(ConnectionPoolListener):
+    """Counts open and checked-out connections for one client's pools."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.open = 0
+        self.in_use = 0
+
+    def _add(self, attr: str, delta: int) -> None:
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + delta)
+
+    def connection_created(self, event):
+        self._add("open", 1)
+
+    def connection_closed(self, event):
+        self._add("open", -1)
+
+    def connection_checked_out(self, event):
+        self._add("in_use", 1)
+
+    def connection_checked_in(self, event):
+        self._add("in_use", -1)
+
+    # Remaining pool events are not tracked
+    def pool_created(self, event): pass
+    def pool_ready(self, event): pass
+    def pool_cleared(self, event): pass
+    def pool_closed(self, event): pass
+    def connection_ready(self, event): pass
+    def connection_check_out_started(self, event): pass
+    def connection_check_out_failed(self, event): pass
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"open": self.open, "in_use": self.in_use}
+
+
+_sync_pool_stats = PoolStats()
+_async_pool_stats = PoolStats()
+
+client = MongoClient(MONGO_URI, event_listeners=[_sync_pool_stats], **CLIENT_OPTIONS)
 
 
 def get_db():
-    client = MongoClient(MONGO_URI)
     return client[DB_NAME]
 
 
+_async_client = None
+
+
+def get_async_db():
+    """Motor database handle for async code paths (client created on first use)."""
+    global _async_client
+    if _async_client is None:
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        _async_client = AsyncIOMotorClient(
+            MONGO_URI, event_listeners=[_async_pool_stats], **CLIENT_OPTIONS
+        )
+    return _async_client[DB_NAME]
+
+
+def get_pool_stats() -> dict:
+    """Connection counts for the sync and async clients, plus configured limits."""
+    return {
+        "max_pool_size": CLIENT_OPTIONS["maxPoolSize"],
+        "min_pool_size": CLIENT_OPTIONS["minPoolSize"],
+        "sync": _sync_pool_stats.snapshot(),
+        "async": _async_pool_stats.snapshot() if _async_client is not None else None,
+    }
+
+
 db = get_db()
 if COLLECTION_NAME:
     collection = db[COLLECTION_NAME]
@@ -83,6 +167,66 @@ def save_chat_message(session_id: str, message: Dict[str, Any]):
         upsert=True
     )
 
+def _append_messages_pipeline(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Update pipeline that appends `messages` and sets the title on the first turn."""
+    now = datetime.utcnow()
+    history = {"$ifNull": ["$history", []]}
+    title = {"$ifNull": ["$title", "New Chat"]}
+
+    # If this is the first user message, update the title
+    if messages[0].get("type") == "HumanMessage":
+        new_title = messages[0].get("content", "")[:30] + "..."
+        title = {"$cond": [{"$gt": [{"$size": history}, 0]}, title, {"$literal": new_title}]}
+
+    # Pipeline update so the title check and the append happen in one command;
+    # message content is wrapped in $literal so it is never parsed as an expression
+    return [{"$set": {
+        "title": title,
+        "history": {"$concatArrays": [history, {"$literal": messages}]},
+        "updated_at": now,
+        "created_at": {"$ifNull": ["$created_at", now]},
+    }}]
+
+def save_chat_messages(session_id: str, messages: List[Dict[str, Any]]):
+    """Append several messages to a session's history in one round-trip."""
+    if not messages:
+        return
+    get_chat_collection().update_one(
+        {"session_id": session_id},
+        _append_messages_pipeline(messages),
+        upsert=True
+    )
+
+# --- Async (Motor) variants for the API's request path ---
+
+async def get_chat_history_async(
+    session_id: str, limit: Optional[int] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Async get_chat_history_db on the pooled Motor client.
+
+    Args:
+        session_id: Chat session ID
+        limit: Only return the last `limit` messages (sliced server-side)
+    """
+    history_projection = {"$slice": -limit} if limit else 1
+    doc = await get_async_db()["chat_sessions"].find_one(
+        {"session_id": session_id}, {"_id": 0, "history": history_projection}
+    )
+    if doc:
+        return doc.get("history", [])
+    return None
+
+async def save_chat_messages_async(session_id: str, messages: List[Dict[str, Any]]):
+    """Async save_chat_messages on the pooled Motor client."""
+    if not messages:
+        return
+    await get_async_db()["chat_sessions"].update_one(
+        {"session_id": session_id},
+        _append_messages_pipeline(messages),
+        upsert=True
+    )
+
 def update_chat_title(session_id: str, title: str):
     """Update the title of a chat session."""
     collection = get_chat_collection()
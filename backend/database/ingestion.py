@@ -2,6 +2,7 @@ import sys
 import os
 import logging
 import time
+from collections import defaultdict
 from datetime import datetime, timezone
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -12,7 +13,13 @@ sys.path.append(project_root)
 from backend.data.core.api_client import bootstrap_static, fixtures
 from backend.database.db import get_db
 from backend.data.scrapers.videoprinter_data import fetch_updates
-from pymongo import ASCENDING, DESCENDING
+from backend.database.common import (
+    create_indexes,
+    sync_collection,
+    upsert_updates,
+    VIDEOPRINTER_COLLECTIONS,
+    VIDEOPRINTER_KEYS,
+)
 
 # --- Logging Configuration ---
 logging.basicConfig(
@@ -22,87 +29,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def create_indexes(db):
-    """
-    Defines and creates the schema indexes for efficient querying.
-    """
-    logger.info("⚙️ Creating indexes...")
-
-    # 1. Players Collection
-    # Queries: By ID, By Name (text search), By Team, By Price/Stats
-    db.players.create_index([("id", ASCENDING)], unique=True)
-    db.players.create_index([("web_name", ASCENDING)])
-    db.players.create_index([("second_name", ASCENDING)])
-    db.players.create_index([("team", ASCENDING)])
-    db.players.create_index([("element_type", ASCENDING)])  # Position
-    # Compound index for sorting value
-    db.players.create_index([("now_cost", ASCENDING), ("total_points", DESCENDING)])
-
-    # 2. Teams Collection
-    db.teams.create_index([("id", ASCENDING)], unique=True)
-    db.teams.create_index([("name", ASCENDING)])
-    db.teams.create_index([("short_name", ASCENDING)])
-
-    # 3. Gameweeks (Events) Collection
-    db.gameweeks.create_index([("id", ASCENDING)], unique=True)
-    db.gameweeks.create_index([("is_current", ASCENDING)])
-    db.gameweeks.create_index([("is_next", ASCENDING)])
-
-    # 4. Fixtures Collection
-    db.fixtures.create_index([("id", ASCENDING)], unique=True)
-    db.fixtures.create_index([("event", ASCENDING)])  # Filter by Gameweek
-    db.fixtures.create_index([("team_h", ASCENDING)]) # Filter by Home Team
-    db.fixtures.create_index([("team_a", ASCENDING)]) # Filter by Away Team
-    db.fixtures.create_index([("kickoff_time", ASCENDING)])
-
-    # 1. Price Changes Collection
-    db.price_changes.create_index([
-        ("player", ASCENDING),
-        ("timestamp", DESCENDING)
-    ], unique=True)
-    db.price_changes.create_index([("team", ASCENDING)])
-    db.price_changes.create_index([("change_type", ASCENDING)])  # "rise" or "fall"
-    db.price_changes.create_index([("timestamp", DESCENDING)])
-
-    # 2. Player Status/Injuries Collection
-    db.player_status.create_index([
-        ("player", ASCENDING),
-        ("timestamp", DESCENDING)
-    ])
-    db.player_status.create_index([("team", ASCENDING)])
-    db.player_status.create_index([("status", "text")])  # Full-text search on injury description
-
-    # 3. Match Events Collection (goals, cards, saves, etc.)
-    db.match_events.create_index([
-        ("home_team", ASCENDING),
-        ("event_type", ASCENDING),
-        ("timestamp", DESCENDING)
-    ])
-    db.match_events.create_index([("player", ASCENDING)])
-    db.match_events.create_index([("event_type", ASCENDING)])  # "goal", "yellow_card", etc.
-    db.match_events.create_index([("timestamp", DESCENDING)])
-
-    # 4. Bonus Points Collection
-    db.bonus_points.create_index([
-        ("home_team", ASCENDING),
-        ("timestamp", DESCENDING)
-    ])
-    db.bonus_points.create_index([("timestamp", DESCENDING)])
-
-    # 5. Match Updates Collection (KO, HT, FT)
-    db.match_updates.create_index([
-        ("home_team", ASCENDING),
-        ("away_team", ASCENDING),
-        ("timestamp", DESCENDING)
-    ])
-    db.match_updates.create_index([("timestamp", DESCENDING)])
-
-    # 6. Team News Collection
-    db.team_news.create_index([("timestamp", DESCENDING)])
-    db.team_news.create_index([("content", "text")])  # Full-text search
-
-    logger.info("✅ Indexes created successfully.")
-
 def update_static_data():
     """
     Main ingestion logic:
@@ -119,92 +45,87 @@ def update_static_data():
         # --- STEP 1: Fetch Data ---
         logger.info("📡 Fetching bootstrap-static data from FPL API...")
         bootstrap = bootstrap_static()
-        if not isinstance(bootstrap, dict):
-            raise ValueError("bootstrap_static did not return a dict")
+        try:
+            teams = bootstrap["teams"]
+            events = bootstrap["events"]
+            raw_players = bootstrap["elements"]
+        except (KeyError, TypeError) as e:
+            raise ValueError("bootstrap_static malformed") from e
         
         logger.info("📡 Fetching all fixtures from FPL API...")
         all_fixtures = fixtures()
-        if not isinstance(all_fixtures, list):
-            raise ValueError("fixtures did not return a list")
 
         # --- STEP 2: Process & Insert Teams ---
-        teams = bootstrap.get("teams", [])
         if teams:
-            logger.info(f"💾 Upserting {len(teams)} teams...")
-            # Strategy: Drop and Insert ensures clean state for static data
-            db.teams.drop()
-            db.teams.insert_many(teams)
+            logger.info("💾 Upserting %d teams...", len(teams))
+            # Strategy: Only write documents whose content hash changed
+            sync_collection(db, "teams", teams)
         
         # --- STEP 3: Process & Insert Players (Elements) ---
-        raw_players = bootstrap.get("elements", [])
-        logger.info(f"📡 Fetched {len(raw_players)} player profiles from bootstrap-static...")
+        logger.info("📡 Fetched %d player profiles from bootstrap-static...", len(raw_players))
         # raw_players = get_all_players()
         # Filter: Optional - remove players who have left the league (status = 'u')
         # keeping 'i' (injured) and 's' (suspended) as they are still entities
         active_players = [p for p in raw_players if p.get("status") != "u"]
-        
+
         if active_players:
-            logger.info(f"💾 Upserting {len(active_players)} players (filtered from {len(raw_players)} total)...")
-            db.players.drop()
-            # Add a timestamp to track when this data was last updated
-            for p in active_players:
-                p["_last_updated"] = datetime.now(timezone.utc)
-            db.players.insert_many(active_players)
+            logger.info("💾 Upserting %d players (filtered from %d total)...", len(active_players), len(raw_players))
+            # MongoDB stamps _last_updated to track when this data was last updated
+            sync_collection(db, "players", active_players, current_date_field="_last_updated")
 
         # --- STEP 4: Process & Insert Gameweeks (Events) ---
-        events = bootstrap.get("events", [])
         if events:
-            logger.info(f"💾 Upserting {len(events)} gameweeks...")
-            db.gameweeks.drop()
-            db.gameweeks.insert_many(events)
+            logger.info("💾 Upserting %d gameweeks...", len(events))
+            sync_collection(db, "gameweeks", events)
 
         # --- STEP 5: Process & Insert Fixtures ---
         if all_fixtures:
-            logger.info(f"💾 Upserting {len(all_fixtures)} fixtures...")
-            db.fixtures.drop()
-            db.fixtures.insert_many(all_fixtures)
+            logger.info("💾 Upserting %d fixtures...", len(all_fixtures))
+            sync_collection(db, "fixtures", all_fixtures)
 
         # --- STEP 6: Process & Insert Videoprinter Updates ---
-        update_videoprinter_data()
+        update_videoprinter_data(db)
 
         # --- STEP 7: Apply Schema/Indexes ---
         create_indexes(db)
         
-        # --- STEP 7: Invalidate Cache ---
-        # Ensure cache is cleared after database update
+        # --- STEP 8: Publish Cache Invalidation ---
+        # API processes listen on cache_events and clear their own caches
         try:
-            from backend.data import cache
-            cache.invalidate_cache()
-            logger.info("✅ Cache invalidated after database update")
+            db.cache_events.insert_one({
+                "type": "invalidate",
+                "collections": ["players", "teams", "fixtures", "gameweeks"],
+                "ts": datetime.now(timezone.utc),
+            })
+            logger.info("✅ Cache invalidation event published")
         except Exception as cache_error:
-            logger.warning(f"⚠️  Failed to invalidate cache: {cache_error}")
+            logger.warning("⚠️  Failed to publish cache invalidation: %s", cache_error)
 
         elapsed = time.time() - start_time
-        logger.info(f"✅ Data ingestion complete in {elapsed:.2f} seconds.")
+        logger.info("✅ Data ingestion complete in %.2f seconds.", elapsed)
 
     except Exception as e:
-        logger.error(f"❌ Data ingestion failed: {e}", exc_info=True)
+        logger.error("❌ Data ingestion failed: %s", e, exc_info=True)
         sys.exit(1)
 
-def update_videoprinter_data():
+def update_videoprinter_data(db):
     """
     Fetch and upsert Videoprinter data (Price Changes, Status, Matches).
+
+    Args:
+        db: MongoDB database handle (e.g. from get_db())
     """
     logger.info("📡 Fetching Videoprinter updates...")
     try:
-        db = get_db()
         vp_data = fetch_updates()
         if vp_data and vp_data.get("updates"):
             updates = vp_data["updates"]
             timestamp = datetime.now(timezone.utc)
             
-            # buckets for separating data
-            price_changes = []
-            player_statuses = []
-            match_events = []
-            bonus_points = []
-            match_updates = []
-            team_news = []
+            # buckets for separating data, keyed by target collection
+            # Price changes are deduplicated per player as they arrive
+            buckets = defaultdict(list)
+            unique_prices = {}
             
             for update in updates:
                 # Add ingestion timestamp to all
@@ -216,59 +137,34 @@ def update_videoprinter_data():
                      update["timestamp"] = timestamp
 
                 u_type = update.get("type")
-                
-                if u_type == "price_change":
-                    price_changes.append(update)
-                elif u_type == "status":
-                    player_statuses.append(update)
-                elif u_type in ["goal", "yellow_card", "red_card", "saves"]:
+                coll_name = VIDEOPRINTER_COLLECTIONS.get(u_type)
+                if coll_name is None:
+                    continue
+                if coll_name == "price_changes":
+                    unique_prices[update["player"]] = update
+                    continue
+                if coll_name == "match_events":
                     update["event_type"] = u_type
-                    match_events.append(update)
-                elif u_type == "bonus":
-                    bonus_points.append(update)
-                elif u_type == "match_update":
-                    match_updates.append(update)
-                elif u_type == "team_news":
-                    team_news.append(update)
+                buckets[coll_name].append(update)
+
+            if unique_prices:
+                buckets["price_changes"] = list(unique_prices.values())
+
+            # Upsert into separate collections (keeps history across runs)
+            for coll_name, docs in buckets.items():
+                upsert_updates(db[coll_name], docs, VIDEOPRINTER_KEYS[coll_name], timestamp)
+
+            # Sample document is only rendered when debug logging is on
+            if unique_prices and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Examples: %s", next(iter(unique_prices.values())))
 
-            # Insert into separate collections
-            if price_changes:
-                # Deduplicate price changes
-                unique_prices = {}
-                for p in price_changes:
-                    unique_prices[p["player"]] = p
-                
-                deduped_price_changes = list(unique_prices.values())
-                
-                db.price_changes.delete_many({}) 
-                db.price_changes.drop() 
-                db.price_changes.insert_many(deduped_price_changes)
-                logger.info(f"Examples: {deduped_price_changes[0]}")
-                
-            if player_statuses:
-                db.player_status.drop()
-                db.player_status.insert_many(player_statuses)
-                
-            if match_events:
-                db.match_events.drop()
-                db.match_events.insert_many(match_events)
-                
-            if bonus_points:
-                db.bonus_points.drop()
-                db.bonus_points.insert_many(bonus_points)
-                
-            if match_updates:
-                db.match_updates.drop()
-                db.match_updates.insert_many(match_updates)
-                
-            if team_news:
-                db.team_news.drop()
-                db.team_news.insert_many(team_news)
-                
-            logger.info(f"💾 Upserted Videoprinter data: {len(price_changes)} prices, {len(match_events)} events, {len(player_statuses)} statuses")
+            logger.info(
+                "💾 Upserted Videoprinter data: %d prices, %d events, %d statuses",
+                len(unique_prices), len(buckets["match_events"]), len(buckets["player_status"]),
+            )
             
     except Exception as e:
-        logger.error(f"Failed to update Videoprinter data: {e}")
+        logger.error("Failed to update Videoprinter data: %s", e)
 
 
 if __name__ == "__main__":
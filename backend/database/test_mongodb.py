@@ -11,6 +11,9 @@ Usage:
 
 import sys
 import os
+import io
+import asyncio
+import contextvars
 from datetime import datetime
 from typing import Dict, List, Any
 
@@ -19,6 +22,7 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(current_dir, "../../"))
 sys.path.append(project_root)
 
+from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
 from dotenv import load_dotenv
 
@@ -27,7 +31,7 @@ load_dotenv()
 
 # Import after loading env vars
 try:
-    from backend.database.db import get_db, MONGO_URI, DB_NAME
+    from backend.database.db import MONGO_URI, DB_NAME, CLIENT_OPTIONS
 except Exception as e:
     print(f"Error importing database module: {e}")
     MONGO_URI = os.getenv("MONGO_URI")
@@ -43,7 +47,7 @@ except Exception as e:
         print("Please set it in your .env file")
         sys.exit(1)
     
-    from backend.database.db import get_db
+    CLIENT_OPTIONS = {}
 
 
 class Colors:
@@ -59,41 +63,80 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+# Ready-made line prefixes so each message is a single concatenation
+_SUCCESS_PREFIX = f"{Colors.OKGREEN}✓ "
+_ERROR_PREFIX = f"{Colors.FAIL}✗ "
+_WARN_PREFIX = f"{Colors.WARNING}⚠ "
+_INFO_PREFIX = f"{Colors.OKCYAN}ℹ "
+_RESET = Colors.ENDC
+
+
+# Sections run concurrently, so each one writes into its own buffer and the
+# buffers are flushed in order (one write per section) once they finish
+_section_buffer: contextvars.ContextVar = contextvars.ContextVar("section_buffer", default=None)
+
+
+def _out(text: str):
+    """Print a line, or buffer it if running inside a section"""
+    buf = _section_buffer.get()
+    if buf is None:
+        print(text)
+    else:
+        buf.write(text)
+        buf.write("\n")
+
+
+async def run_section(coro):
+    """Await a test section, returning its result and buffered output"""
+    buf = io.StringIO()
+    token = _section_buffer.set(buf)
+    try:
+        result = await coro
+    finally:
+        _section_buffer.reset(token)
+    return result, buf.getvalue()
+
+
+def flush_section(output: str):
+    """Write a section's buffered output in a single call"""
+    sys.stdout.write(output)
+    sys.stdout.flush()
+
+
 def print_header(text: str):
     """Print a formatted header"""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{text.center(70)}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.ENDC}\n")
+    _out(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.ENDC}")
+    _out(f"{Colors.HEADER}{Colors.BOLD}{text.center(70)}{Colors.ENDC}")
+    _out(f"{Colors.HEADER}{Colors.BOLD}{'=' * 70}{Colors.ENDC}\n")
 
 
 def print_success(text: str):
     """Print success message"""
-    print(f"{Colors.OKGREEN}✓ {text}{Colors.ENDC}")
+    _out(_SUCCESS_PREFIX + text + _RESET)
 
 
 def print_error(text: str):
     """Print error message"""
-    print(f"{Colors.FAIL}✗ {text}{Colors.ENDC}")
+    _out(_ERROR_PREFIX + text + _RESET)
 
 
 def print_warning(text: str):
     """Print warning message"""
-    print(f"{Colors.WARNING}⚠ {text}{Colors.ENDC}")
+    _out(_WARN_PREFIX + text + _RESET)
 
 
 def print_info(text: str):
     """Print info message"""
-    print(f"{Colors.OKCYAN}ℹ {text}{Colors.ENDC}")
+    _out(_INFO_PREFIX + text + _RESET)
 
 
-def test_connection() -> bool:
+async def test_connection(db) -> bool:
     """Test MongoDB connection"""
     print_header("Testing MongoDB Connection")
     
     try:
-        db = get_db()
         # The ping command is cheap and does not require auth
-        db.client.admin.command('ping')
+        await db.client.admin.command('ping')
         print_success(f"Connected to MongoDB successfully!")
         print_info(f"URI: {MONGO_URI[:20]}...{MONGO_URI[-10:] if len(MONGO_URI) > 30 else ''}")
         print_info(f"Database: {DB_NAME}")
@@ -110,7 +153,7 @@ def test_connection() -> bool:
         return False
 
 
-def test_collections() -> Dict[str, int]:
+async def test_collections(db, coll_names: frozenset) -> Dict[str, int]:
     """Test collections existence and count documents"""
     print_header("Testing Collections")
     
@@ -118,14 +161,12 @@ def test_collections() -> Dict[str, int]:
     collection_counts = {}
     
     try:
-        db = get_db()
-        existing_collections = db.list_collection_names()
-        
-        print_info(f"Found {len(existing_collections)} collections in database")
+        print_info(f"Found {len(coll_names)} collections in database")
         
         for coll_name in expected_collections:
-            if coll_name in existing_collections:
-                count = db[coll_name].count_documents({})
+            if coll_name in coll_names:
+                # Reads collection metadata instead of scanning the _id index
+                count = await db[coll_name].estimated_document_count()
                 collection_counts[coll_name] = count
                 print_success(f"Collection '{coll_name}': {count} documents")
             else:
@@ -133,7 +174,7 @@ def test_collections() -> Dict[str, int]:
                 print_warning(f"Collection '{coll_name}' not found!")
         
         # Check for unexpected collections
-        unexpected = set(existing_collections) - set(expected_collections)
+        unexpected = coll_names - set(expected_collections)
         if unexpected:
             print_info(f"Additional collections found: {', '.join(unexpected)}")
         
@@ -143,26 +184,29 @@ def test_collections() -> Dict[str, int]:
         return {}
 
 
-def test_indexes():
+async def test_indexes(db, coll_names: frozenset):
     """Test if indexes are properly created"""
     print_header("Testing Indexes")
     
     try:
-        db = get_db()
-        
         # Expected indexes for each collection
         expected_indexes = {
             "players": ["id_1", "web_name_1", "second_name_1", "team_1", 
-                       "element_type_1", "now_cost_1_total_points_-1"],
+                       "element_type_1", "now_cost_1_total_points_-1", "top_players"],
             "teams": ["id_1", "name_1", "short_name_1"],
             "gameweeks": ["id_1", "is_current_1", "is_next_1"],
-            "fixtures": ["id_1", "event_1", "team_h_1", "team_a_1", "kickoff_time_1"]
+            "fixtures": ["id_1", "event_1", "team_h_1", "team_a_1", "kickoff_time_1",
+                        "upcoming_fixtures"]
         }
         
+        # Issue the listIndexes commands together; each uses its own pooled socket
+        present = [c for c in expected_indexes if c in coll_names]
+        results = await asyncio.gather(*(db[c].list_indexes().to_list(None) for c in present))
+        indexes_by_coll = dict(zip(present, results))
+        
         for coll_name, expected_idx in expected_indexes.items():
-            if coll_name in db.list_collection_names():
-                indexes = db[coll_name].list_indexes()
-                index_names = [idx['name'] for idx in indexes]
+            if coll_name in indexes_by_coll:
+                index_names = [idx['name'] for idx in indexes_by_coll[coll_name]]
                 
                 print_info(f"\n{coll_name.capitalize()} Collection Indexes:")
                 
@@ -184,18 +228,31 @@ def test_indexes():
         print_error(f"Error testing indexes: {e}")
 
 
-def test_data_integrity():
+async def test_data_integrity(db):
     """Test data integrity and sample queries"""
     print_header("Testing Data Integrity")
     
     try:
-        db = get_db()
+        required_fields = ["id", "web_name", "team", "element_type", "now_cost", "total_points"]
+        
+        # The four lookups are independent, so run them together and report after.
+        # Each projects only the fields checked/printed below
+        async with asyncio.TaskGroup() as tg:
+            player_task = tg.create_task(
+                db.players.find_one({}, {"_id": 0, **dict.fromkeys(required_fields, 1)})
+            )
+            team_task = tg.create_task(db.teams.find_one({}, {"_id": 0, "name": 1, "short_name": 1}))
+            gameweek_task = tg.create_task(
+                db.gameweeks.find_one({"is_current": True}, {"_id": 0, "id": 1, "name": 1})
+            )
+            fixture_task = tg.create_task(
+                db.fixtures.find_one({}, {"_id": 0, "team_h": 1, "team_a": 1, "event": 1})
+            )
         
         # Test 1: Check if players have required fields
         print_info("Testing player documents structure...")
-        sample_player = db.players.find_one()
+        sample_player = player_task.result()
         if sample_player:
-            required_fields = ["id", "web_name", "team", "element_type", "now_cost", "total_points"]
             missing_fields = [f for f in required_fields if f not in sample_player]
             
             if not missing_fields:
@@ -212,7 +269,7 @@ def test_data_integrity():
         
         # Test 2: Check teams
         print_info("\nTesting team documents...")
-        sample_team = db.teams.find_one()
+        sample_team = team_task.result()
         if sample_team:
             print_success(f"Sample team: {sample_team.get('name', 'N/A')} "
                          f"({sample_team.get('short_name', 'N/A')})")
@@ -221,7 +278,7 @@ def test_data_integrity():
         
         # Test 3: Check current gameweek
         print_info("\nTesting gameweek documents...")
-        current_gw = db.gameweeks.find_one({"is_current": True})
+        current_gw = gameweek_task.result()
         if current_gw:
             print_success(f"Current gameweek: GW{current_gw.get('id', 'N/A')} "
                          f"({current_gw.get('name', 'N/A')})")
@@ -230,7 +287,7 @@ def test_data_integrity():
         
         # Test 4: Check fixtures
         print_info("\nTesting fixture documents...")
-        sample_fixture = db.fixtures.find_one()
+        sample_fixture = fixture_task.result()
         if sample_fixture:
             print_success(f"Sample fixture: Team {sample_fixture.get('team_h', 'N/A')} vs "
                          f"Team {sample_fixture.get('team_a', 'N/A')} "
@@ -243,19 +300,30 @@ def test_data_integrity():
         print_error(f"Error testing data integrity: {e}")
 
 
-def test_queries():
+async def test_queries(db):
     """Test common queries"""
     print_header("Testing Common Queries")
     
     try:
-        db = get_db()
+        # One grouped pass instead of a count per position
+        pipeline = [{"$group": {"_id": "$element_type", "n": {"$sum": 1}}}]
+        
+        # Run the three queries together, then report in order
+        async with asyncio.TaskGroup() as tg:
+            # Covered by the top_players index: no FETCH stage, no in-memory sort
+            top_task = tg.create_task(db.players.find(
+                {},
+                {"_id": 0, "web_name": 1, "total_points": 1, "now_cost": 1}
+            ).sort("total_points", -1).limit(5).hint("top_players").to_list(5))
+            positions_task = tg.create_task(db.players.aggregate(pipeline).to_list(None))
+            upcoming_task = tg.create_task(db.fixtures.find(
+                {"finished": False},
+                {"_id": 0, "team_h": 1, "team_a": 1, "event": 1, "kickoff_time": 1}
+            ).sort("kickoff_time", 1).limit(5).hint("upcoming_fixtures").to_list(5))
         
         # Query 1: Top 5 players by total points
         print_info("Query 1: Top 5 players by total points")
-        top_players = list(db.players.find(
-            {},
-            {"web_name": 1, "total_points": 1, "now_cost": 1}
-        ).sort("total_points", -1).limit(5))
+        top_players = top_task.result()
         
         if top_players:
             for i, player in enumerate(top_players, 1):
@@ -268,16 +336,13 @@ def test_queries():
         # Query 2: Count players by position
         print_info("\nQuery 2: Players by position")
         positions = {1: "Goalkeeper", 2: "Defender", 3: "Midfielder", 4: "Forward"}
+        position_counts = {row["_id"]: row["n"] for row in positions_task.result()}
         for pos_id, pos_name in positions.items():
-            count = db.players.count_documents({"element_type": pos_id})
-            print_success(f"  {pos_name}s: {count}")
+            print_success(f"  {pos_name}s: {position_counts.get(pos_id, 0)}")
         
         # Query 3: Upcoming fixtures
         print_info("\nQuery 3: Next 5 upcoming fixtures")
-        upcoming_fixtures = list(db.fixtures.find(
-            {"finished": False},
-            {"team_h": 1, "team_a": 1, "event": 1, "kickoff_time": 1}
-        ).sort("kickoff_time", 1).limit(5))
+        upcoming_fixtures = upcoming_task.result()
         
         if upcoming_fixtures:
             for i, fixture in enumerate(upcoming_fixtures, 1):
@@ -293,27 +358,27 @@ def test_queries():
         print_error(f"Error testing queries: {e}")
 
 
-def test_database_stats():
+async def test_database_stats(db):
     """Display database statistics"""
     print_header("Database Statistics")
     
     try:
-        db = get_db()
-        stats = db.command("dbstats")
+        # Server-side scaling to MB; freeStorage=0 skips the free-space walk
+        stats = await db.command({"dbStats": 1, "scale": 1024 * 1024, "freeStorage": 0})
         
         print_info(f"Database: {stats.get('db', 'N/A')}")
         print_info(f"Collections: {stats.get('collections', 0)}")
-        print_info(f"Data Size: {stats.get('dataSize', 0) / 1024 / 1024:.2f} MB")
-        print_info(f"Storage Size: {stats.get('storageSize', 0) / 1024 / 1024:.2f} MB")
+        print_info(f"Data Size: {stats.get('dataSize', 0):.2f} MB")
+        print_info(f"Storage Size: {stats.get('storageSize', 0):.2f} MB")
         print_info(f"Indexes: {stats.get('indexes', 0)}")
-        print_info(f"Index Size: {stats.get('indexSize', 0) / 1024 / 1024:.2f} MB")
+        print_info(f"Index Size: {stats.get('indexSize', 0):.2f} MB")
         
         print_success("\nDatabase statistics retrieved successfully")
     except Exception as e:
         print_error(f"Error getting database stats: {e}")
 
 
-def run_all_tests():
+async def run_all_tests():
     """Run all MongoDB tests"""
     print(f"\n{Colors.BOLD}{Colors.OKBLUE}")
     print("╔════════════════════════════════════════════════════════════════════╗")
@@ -324,18 +389,30 @@ def run_all_tests():
     
     start_time = datetime.now()
     
-    # Run tests
-    connection_ok = test_connection()
+    # Run tests against a single pooled client; collection names are listed once
+    client = AsyncIOMotorClient(MONGO_URI, **CLIENT_OPTIONS)
+    db = client[DB_NAME]
+    connection_ok, output = await run_section(test_connection(db))
+    flush_section(output)
     
     if not connection_ok:
         print_error("\n❌ Connection failed. Aborting remaining tests.")
         return False
     
-    collection_counts = test_collections()
-    test_indexes()
-    test_data_integrity()
-    test_queries()
-    test_database_stats()
+    coll_names = frozenset(await db.list_collection_names())
+    
+    # Sections are independent reads, so overlap their round-trips
+    sections = await asyncio.gather(
+        run_section(test_collections(db, coll_names)),
+        run_section(test_indexes(db, coll_names)),
+        run_section(test_data_integrity(db)),
+        run_section(test_queries(db)),
+        run_section(test_database_stats(db)),
+    )
+    for _, output in sections:
+        flush_section(output)
+    collection_counts = sections[0][0]
+    client.close()
     
     # Summary
     end_time = datetime.now()
@@ -359,7 +436,7 @@ def run_all_tests():
 
 if __name__ == "__main__":
     try:
-        success = run_all_tests()
+        success = asyncio.run(run_all_tests())
         sys.exit(0 if success else 1)
     except KeyboardInterrupt:
         print(f"\n\n{Colors.WARNING}Test interrupted by user.{Colors.ENDC}\n")
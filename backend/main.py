@@ -9,17 +9,20 @@ This script is the single entry point that:
 
 import os
 import sys
+import asyncio
 import logging
 from contextlib import asynccontextmanager
-from dotenv import load_dotenv
 
 from fastapi import FastAPI
-import uvicorn
+
+from backend.config import Settings, get_settings
 
 # Import the FastAPI app factory from middleware
-from backend.middleware.api import create_app
-from backend.data import cache
-from backend.scheduler import start_scheduler, stop_scheduler, warm_cache_on_startup
+from backend.middleware.api import (
+    create_app,
+    get_http_client,
+    prewarm_agent,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -28,12 +31,12 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def validate_environment():
+def validate_environment() -> Settings:
     """Validate that required environment variables are set."""
-    load_dotenv()
+    settings = get_settings()
 
-    required_vars = ["GOOGLE_API_KEY", "MONGO_URI"]
-    missing = [var for var in required_vars if not os.getenv(var)]
+    required = {"GOOGLE_API_KEY": settings.google_api_key, "MONGO_URI": settings.mongo_uri}
+    missing = [var for var, value in required.items() if not value]
 
     if missing:
         logger.error(f"Missing required environment variables: {', '.join(missing)}")
@@ -41,26 +44,38 @@ def validate_environment():
         sys.exit(1)
 
     logger.info("Environment variables validated")
+    return settings
 
 
-def initialize_cache():
-    """Warm the cache with FPL data on startup."""
+def initialize_cache() -> dict:
+    """Warm the cache with FPL data on startup and return the cache stats."""
     logger.info("=" * 60)
     logger.info("Initializing FPL Chatbot Cache")
     logger.info("=" * 60)
 
+    from backend.data import cache
+    from backend.scheduler import warm_cache_on_startup
+
     try:
-        warm_cache_on_startup()
-        stats = cache.get_cache_stats()
-        logger.info(f"✅ Cache initialized: {stats.get('cache_size')} entries loaded")
-        logger.info(f"   Hit rate: {stats.get('hit_rate_percent', 0)}%")
+        # Reloads reuse a recent on-disk snapshot instead of refetching from FPL
+        if not cache.load_snapshot():
+            warm_cache_on_startup()
+            cache.save_snapshot()
     except Exception as e:
         logger.error(f"❌ Error warming cache: {e}")
         logger.warning("⚠️ The API may have degraded performance until data is loaded.")
+        return cache.get_cache_stats()
+
+    stats = cache.get_cache_stats()
+    logger.info(f"✅ Cache initialized: {stats.get('cache_size')} entries loaded")
+    logger.info(f"   Hit rate: {stats.get('hit_rate_percent', 0)}%")
+    return stats
 
 
 def initialize_scheduler():
     """Start the background scheduler for automatic data refresh."""
+    from backend.scheduler import start_scheduler
+
     try:
         start_scheduler(refresh_interval_hours=1)
         logger.info("✅ Background data refresh scheduler started (1 hour interval)")
@@ -71,8 +86,27 @@ def initialize_scheduler():
         )
 
 
+def _save_response_cache() -> None:
+    """Save the semantic response cache, tagged with the core data it answers from."""
+    from backend.agent.semantic_cache import response_cache
+    from backend.data import cache
+
+    response_cache.save(data_version=cache.core_data.get("built_at"))
+
+
+async def persist_response_cache(interval_seconds: int = 600):
+    """Periodically save the semantic response cache so restarts keep it."""
+    from backend.agent.semantic_cache import response_cache
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await asyncio.to_thread(_save_response_cache)
+
+
 def shutdown_scheduler():
     """Stop the background scheduler."""
+    from backend.scheduler import stop_scheduler
+
     try:
         stop_scheduler()
         logger.info("Scheduler stopped")
@@ -83,20 +117,43 @@ def shutdown_scheduler():
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle startup and shutdown events."""
+    from backend.data import cache
+
     # Startup
     logger.info("Starting up FPL Chatbot API...")
-    initialize_cache()
+    # Core data and the default agent are independent; load them side by side.
+    # Stats are read once here; scheduler/listener startup doesn't touch the cache
+    startup_stats, _ = await asyncio.gather(
+        asyncio.to_thread(initialize_cache),
+        asyncio.to_thread(prewarm_agent),
+    )
+    # Shared pooled HTTP/2 client for the async FPL calls in the endpoints
+    get_http_client(app)
+    # Motor pool for chat-history reads/writes; opened here so the first
+    # request doesn't pay for client construction. The db helpers use the
+    # module-level client, so nothing is stored on app.state
+    from backend.database.db import get_async_db
+
+    get_async_db()
     initialize_scheduler()
+    cache.start_cache_event_listener()
 
-    # Log final cache stats
-    final_stats = cache.get_cache_stats()
-    logger.info(f"Startup complete: {final_stats.get('cache_size')} entries in cache")
+    from backend.agent.semantic_cache import response_cache
+
+    # Answers saved against older FPL data are not restored
+    await asyncio.to_thread(response_cache.load, data_version=cache.core_data.get("built_at"))
+    persist_task = asyncio.create_task(persist_response_cache())
+
+    logger.info(f"Startup complete: {startup_stats.get('cache_size')} entries in cache")
 
     yield
 
     # Shutdown
     logger.info("Shutting down FPL Chatbot API...")
     shutdown_scheduler()
+    persist_task.cancel()
+    await asyncio.to_thread(_save_response_cache)
+    await get_http_client(app).aclose()
 
     # Show final cache stats
     final_stats = cache.get_cache_stats()
@@ -106,18 +163,30 @@ async def lifespan(app: FastAPI):
     )
 
 
+def get_app() -> FastAPI:
+    """Build the FastAPI app without the environment checks (e.g. for tests)."""
+    return create_app(lifespan=lifespan)
+
+
 # Create the FastAPI app at module level (required for reload to work)
 # This must be done after imports but before main()
-validate_environment()
-app = create_app(lifespan=lifespan)
+# Validate once per process tree: `python -m backend.main` imports this module
+# twice (__main__ + uvicorn's import string) and reload workers inherit the env
+if os.environ.get("BENCHBOOST_APP_BOOTSTRAPPED") != "1":
+    settings = validate_environment()
+    os.environ["BENCHBOOST_APP_BOOTSTRAPPED"] = "1"
+else:
+    settings = get_settings()
+app = get_app()
+app.state.settings = settings
 
 
 def main():
     """Main entry point - starts Uvicorn with the pre-created app."""
-    # Get configuration from environment
-    host = os.getenv("HOST", "0.0.0.0")
-    port = int(os.getenv("PORT", "8000"))
-    reload = os.getenv("UVICORN_RELOAD", "false").lower() == "true"
+    import uvicorn
+
+    # Configuration was parsed once at import
+    host, port, reload = settings.host, settings.port, settings.reload
 
     logger.info(f"Starting Uvicorn server on {host}:{port}")
     logger.info(f"Reload mode: {'enabled' if reload else 'disabled'}")
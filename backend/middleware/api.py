@@ -7,25 +7,41 @@ by the caller (main.py) via the lifespan parameter.
 
 import os
 import asyncio
+import heapq
 import logging
+import random
 import re
-from typing import Optional, List, Any, Dict, Iterable
-from fastapi import FastAPI, HTTPException
+import time
+import weakref
+from collections import OrderedDict, deque
+from operator import itemgetter
+from types import GeneratorType
+from typing import Optional, List, Any, Deque, Dict, Tuple
+import orjson
+from fastapi import BackgroundTasks, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 
-from backend.agent.agent import create_agent
 from langchain_core.messages import AIMessage, HumanMessage
 from backend.data import cache
 from backend.database.db import (
     get_all_chat_sessions,
     create_chat_session,
     delete_chat_session,
-    get_chat_history_db,
-    save_chat_message,
+    get_chat_history_async,
+    get_pool_stats,
+    save_chat_messages_async,
     update_chat_title,
 )
-from backend.agent.memory import serialize_message, deserialize_message
+from backend.agent import prompt_cache
+from backend.agent.memory import compact_history, serialize_message, deserialize_message
+from backend.agent.semantic_cache import (
+    history_digest,
+    is_cacheable,
+    normalize_query,
+    response_cache,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -42,101 +58,519 @@ class QueryRequest(BaseModel):
 
 class QueryResponse(BaseModel):
     answer: str
-    raw_output: Optional[Any] = None
 
 
-# Agent cache per session
-_AGENT_CACHE: Dict[str, Any] = {}
+class _AsyncTTLCache:
+    """Small TTL cache for endpoint responses; concurrent misses share one fetch."""
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 10_000):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: Dict[Any, tuple] = {}
+        # key -> task filling it, awaited by every miss until the entry is set
+        self._pending: Dict[Any, "asyncio.Task"] = {}
+
+    def _fresh(self, key: Any) -> Optional[tuple]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry
+        return None
+
+    async def get_or_set(self, key: Any, fetch) -> Any:
+        """Return the cached value for key, or await fetch() once to fill it."""
+        entry = self._fresh(key)
+        if entry is not None:
+            return entry[1]
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fill(key, fetch))
+            self._pending[key] = task
+        # Shielded: a caller going away doesn't cancel the fill for the others
+        return await asyncio.shield(task)
+
+    async def _fill(self, key: Any, fetch) -> Any:
+        task = asyncio.current_task()
+        try:
+            value = await fetch()
+            # Not if invalidate() dropped this fill while it ran
+            if self._pending.get(key) is task:
+                if len(self._entries) >= self.maxsize:
+                    # Dicts keep insertion order: drop the oldest entry
+                    self._entries.pop(next(iter(self._entries)))
+                self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            return value
+        finally:
+            # The entry (if any) is already set, so no miss can slip in between
+            if self._pending.get(key) is task:
+                del self._pending[key]
+
+    def invalidate(self, key: Any = None) -> None:
+        """Drop one entry (and any fill in progress), or everything if key is None."""
+        if key is None:
+            self._entries.clear()
+            self._pending.clear()
+        else:
+            self._entries.pop(key, None)
+            self._pending.pop(key, None)
+
+
+# FPL manager data and videoprinter news change at most about once a minute.
+# Entries hold the finished response dicts, so a hit does no formatting at all
+_MANAGER_CACHE = _AsyncTTLCache(ttl_seconds=60)
+_NEWS_CACHE = _AsyncTTLCache(ttl_seconds=60)
+_TEAM_CACHE = _AsyncTTLCache(ttl_seconds=60)
+# In-flight manual news refresh, shared by concurrent /api/news/refresh calls
+_NEWS_REFRESH_TASK: Optional["asyncio.Task[list]"] = None
+
+
+def get_http_client(app: FastAPI) -> Any:
+    """Return the app's shared async HTTP client, creating it on first use."""
+    client = getattr(app.state, "http", None)
+    if client is None:
+        import httpx
+
+        client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+            timeout=10.0,
+        )
+        app.state.http = client
+    return client
 
 
-def _get_or_create_agent(session_id: str) -> Any:
-    """Helper to create an agent using the project's main implementation."""
-    agent = _AGENT_CACHE.get(session_id)
-    if agent is None:
-        logger.info("Creating agent for session=%s", session_id)
-        agent = create_agent()
-        _AGENT_CACHE[session_id] = agent
-    return agent
+# The process-wide agent. The executor holds no per-session state (chat
+# history travels in each payload), so every session shares it
+_agent: Optional[Any] = None
+# Bumped whenever the agent is dropped, so a build that started before the
+# drop doesn't install an agent bound to the old prompt cache
+_agent_generation = 0
+# One (re)build at a time; concurrent requests wait for it instead of each
+# starting their own
+_AGENT_BUILD_LOCK = asyncio.Lock()
 
 
-def _get_chat_history(session_id: str) -> List[Any]:
-    """Ensure a chat history list exists per session."""
-    raw_history = get_chat_history_db(session_id)
-    if not raw_history:
-        return []
-    return [deserialize_message(m) for m in raw_history]
+def _build_agent(use_prompt_cache: bool = True) -> Any:
+    """Create the agent. Blocking: it may register the Gemini prompt cache."""
+    # Deferred: the agent pulls in the LLM client stack, which isn't
+    # needed to serve the app until the first chat request
+    from backend.agent.agent import create_agent
 
+    logger.info("Creating shared agent")
+    return create_agent(use_prompt_cache=use_prompt_cache)
 
-def _extract_status_code(exc: Exception) -> Optional[int]:
-    """Try to pull an HTTP-ish status code off the exception."""
+
+def _install_agent(agent: Any, generation: int) -> None:
+    global _agent
+    if generation == _agent_generation:
+        _agent = agent
+
+
+def _drop_agent() -> None:
+    """Forget the shared agent; the next request rebuilds it."""
+    global _agent, _agent_generation
+    _agent = None
+    _agent_generation += 1
+
+
+# A recreated (or dropped) Gemini prompt cache invalidates the name the shared
+# agent was built with; the next request rebuilds it against the new one
+prompt_cache.add_change_listener(_drop_agent)
+
+
+async def _get_agent() -> Any:
+    """The shared agent, (re)built in a worker thread so the event loop never blocks on it."""
+    agent = _agent
+    if agent is not None:
+        return agent
+    async with _AGENT_BUILD_LOCK:
+        if _agent is not None:
+            return _agent
+        generation = _agent_generation
+        agent = await asyncio.to_thread(_build_agent)
+        _install_agent(agent, generation)
+        return agent
+
+
+async def _replace_stale_agent(agent: Any) -> Any:
+    """
+    An agent to retry with after Gemini rejected the cached prompt `agent` was
+    built with. The cache is discarded and, unless another request already
+    rebuilt the agent, the replacement sends the prompt inline.
+    """
+    name = (getattr(agent, "metadata", None) or {}).get("prompt_cache")
+    # Off the loop: the prompt cache lock may be held by a refresh mid-request
+    await asyncio.to_thread(prompt_cache.discard_prompt_cache, name)
+    async with _AGENT_BUILD_LOCK:
+        if _agent is not None and _agent is not agent:
+            return _agent
+        generation = _agent_generation
+        replacement = await asyncio.to_thread(_build_agent, False)
+        _install_agent(replacement, generation)
+        return replacement
+
+
+def prewarm_agent() -> None:
+    """Build the agent ahead of time so the first request skips construction."""
+    try:
+        generation = _agent_generation
+        _install_agent(_build_agent(), generation)
+    except Exception as e:
+        logger.warning("Agent prewarm failed (will build on first request): %s", e)
+
+
+# Cached answers describe the FPL data they were built from: recognise player
+# and team names for the key-term check, and drop everything on a data refresh
+response_cache.is_entity = cache.get_entity_by_name
+cache.add_refresh_listener(response_cache.clear)
+
+
+# One lock per session so concurrent turns of the same chat run in order.
+# Weak values: a lock lives exactly as long as a request holds or awaits it,
+# so the map stays bounded and a busy lock is never replaced
+_SESSION_LOCKS: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def _session_lock(session_id: str) -> asyncio.Lock:
+    """The lock serializing turns of `session_id`, created on demand."""
+    lock = _SESSION_LOCKS.get(session_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _SESSION_LOCKS[session_id] = lock
+    return lock
+
+
+# Recent chat history per session (LRU of bounded deques). The DB keeps the
+# full transcript; the agent only ever sees the last CHAT_HISTORY_TURNS turns,
+# so each turn costs O(window) instead of re-reading the whole conversation
+_HISTORY_CACHE_MAX = 512
+_HISTORY_WINDOW = 2 * int(os.getenv("CHAT_HISTORY_TURNS", "20"))
+_HISTORY_CACHE: "OrderedDict[str, Deque[Any]]" = OrderedDict()
+# Messages at the end of the window the agent sees verbatim; older ones in the
+# window are condensed into a single summary message (see compact_history)
+_HISTORY_VERBATIM = 2 * int(os.getenv("CHAT_HISTORY_VERBATIM_TURNS", "10"))
+
+
+def _prompt_history(history: Deque[Any]) -> List[Any]:
+    """The history list handed to the agent for one turn, with older turns summarized."""
+    return compact_history(history, keep_first=0, tail=_HISTORY_VERBATIM, memory_file=None)
+
+
+async def _get_chat_history(session_id: str) -> Deque[Any]:
+    """
+    Recent-history window for a session, hydrated from the DB on first touch.
+    Callers hold the session lock, so a session is only hydrated once.
+    """
+    history = _HISTORY_CACHE.get(session_id)
+    if history is not None:
+        _HISTORY_CACHE.move_to_end(session_id)
+        return history
+
+    raw_history = await get_chat_history_async(session_id, limit=_HISTORY_WINDOW)
+    history = deque(
+        (deserialize_message(m) for m in raw_history or ()), maxlen=_HISTORY_WINDOW
+    )
+    _HISTORY_CACHE[session_id] = history
+    if len(_HISTORY_CACHE) > _HISTORY_CACHE_MAX:
+        _HISTORY_CACHE.popitem(last=False)
+    return history
+
+
+_STATUS_RE = re.compile(r"\b([45]\d{2})\b")
+
+
+def _code_from_attrs(exc: Exception) -> Optional[int]:
+    """Status code from the exception's attributes (cheap, no string building)."""
+    # HTTP client errors (httpx.HTTPStatusError, requests.HTTPError) carry
+    # the authoritative code on the response object
+    response = getattr(exc, "response", None)
+    if response is not None:
+        code = getattr(response, "status_code", None)
+        if isinstance(code, int):
+            return code
     for attr in ("status", "status_code", "code"):
         value = getattr(exc, attr, None)
         if isinstance(value, int):
             return value
         if isinstance(value, str) and value.isdigit():
             return int(value)
-    match = re.search(r"\b([45]\d{2})\b", str(exc))
+    return None
+
+
+def _code_from_message(message: str) -> Optional[int]:
+    """Status code found in the error text, if any."""
+    match = _STATUS_RE.search(message)
     if match:
         return int(match.group(1))
     return None
 
 
+def _extract_status_code(exc: Exception) -> Optional[int]:
+    """Try to pull an HTTP-ish status code off the exception."""
+    code = _code_from_attrs(exc)
+    if code is not None:
+        return code
+    return _code_from_message(str(exc))
+
+
+_RETRY_HINT_RE = re.compile(r"retry (?:in|after) (\d+(?:\.\d+)?)\s*s", re.IGNORECASE)
+_AGENT_MAX_ATTEMPTS = int(os.getenv("AGENT_MAX_ATTEMPTS", "3"))
+
+
+def _retry_after_hint(exc: Exception) -> Optional[float]:
+    """Pull a provider-suggested retry delay (seconds) off the exception, if any."""
+    for attr in ("retry_after", "retry_delay"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, (int, float)) and value > 0:
+            return float(value)
+    match = _RETRY_HINT_RE.search(str(exc))
+    if match:
+        return float(match.group(1))
+    return None
+
+
 def _is_model_overloaded(exc: Exception) -> bool:
-    msg = str(exc).lower()
-    return "model is overloaded" in msg or _extract_status_code(exc) == 503
+    code = _code_from_attrs(exc)
+    if code == 503:
+        return True
+    # Only render the (possibly large) provider message when attributes don't decide
+    msg = str(exc)
+    if "model is overloaded" in msg.lower():
+        return True
+    return code is None and _code_from_message(msg) == 503
+
+
+_RETRYABLE_CODES = frozenset({429, 500, 502, 503, 504})
+_RETRY_MAX_DELAY = 8.0
+
+
+# "CachedContent not found", "cached_content ... expired", ...
+_CACHED_CONTENT_RE = re.compile(r"cached[ _]?content", re.IGNORECASE)
+
+
+def _is_stale_prompt_cache(exc: Exception) -> bool:
+    """Gemini rejected the cached-content name in the request (expired or evicted)."""
+    if _extract_status_code(exc) not in (400, 403, 404):
+        return False
+    return _CACHED_CONTENT_RE.search(str(exc)) is not None
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Overload, rate-limit and transient server errors are worth another try."""
+    code = _code_from_attrs(exc)
+    if code is not None:
+        # Client errors other than rate limiting won't succeed on retry
+        return code in _RETRYABLE_CODES
+    return _is_model_overloaded(exc) or _code_from_message(str(exc)) in _RETRYABLE_CODES
+
+
+# Unordered/one-shot containers flattened by _coerce_to_text; they are
+# materialized before reversing (lists/tuples are handled separately).
+# Explicit types avoid an ABC check per item
+_SEQUENCE_TYPES = (set, frozenset, GeneratorType)
 
 
 def _coerce_to_text(payload: Any) -> str:
     """Flatten structured provider output into a plain string for clients."""
-    if payload is None:
-        return ""
     if isinstance(payload, str):
         return payload
-    if isinstance(payload, (bytes, bytearray)):
-        return payload.decode("utf-8", errors="replace")
-    if isinstance(payload, dict):
-        if "text" in payload:
-            return _coerce_to_text(payload.get("text"))
-        if "content" in payload:
-            return _coerce_to_text(payload.get("content"))
-        return str(payload)
-    if isinstance(payload, Iterable):
-        parts: List[str] = []
-        for item in payload:
-            text = _coerce_to_text(item)
-            if text:
-                parts.append(text)
-        return "\n".join(parts)
-    return str(payload)
-
 
-async def _invoke_agent(
-    agent: Any, query: str, chat_history: List[Any], manager_id: Optional[int] = None
-) -> Any:
-    """Async wrapper to run agent.invoke in a worker thread (sync API)."""
+    # Iterative walk (no recursion): nested blocks are pushed back onto the
+    # front of the worklist so fragments come out in their original order
+    parts: List[str] = []
+    worklist = deque([payload])
+    while worklist:
+        item = worklist.popleft()
+        if item is None:
+            continue
+        if isinstance(item, str):
+            text = item
+        elif isinstance(item, (bytes, bytearray)):
+            text = item.decode("utf-8", errors="replace")
+        elif isinstance(item, dict):
+            if "text" in item:
+                worklist.appendleft(item.get("text"))
+                continue
+            if "content" in item:
+                worklist.appendleft(item.get("content"))
+                continue
+            text = str(item)
+        elif isinstance(item, (list, tuple)):
+            # Reversible in place; no intermediate copy
+            worklist.extendleft(reversed(item))
+            continue
+        elif isinstance(item, _SEQUENCE_TYPES):
+            worklist.extendleft(reversed(list(item)))
+            continue
+        elif hasattr(item, "content"):
+            # Message-like objects (AIMessage, chunks): unwrap their content
+            worklist.appendleft(item.content)
+            continue
+        else:
+            text = str(item)
+        if text:
+            parts.append(text)
+    return "\n".join(parts)
+
+
+def _build_agent_payload(
+    query: str, chat_history: List[Any], manager_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """Build the AgentExecutor input for a user query."""
     # If manager_id is provided, prepend it as context to the query
     if manager_id is not None:
         enhanced_query = f"[User's FPL Team ID: {manager_id}]\n\n{query}"
     else:
         enhanced_query = query
 
-    payload = {"input": enhanced_query, "chat_history": chat_history}
-    delay = 2.0
-    max_attempts = 3
+    return {"input": enhanced_query, "chat_history": chat_history}
+
+
+def _sse(data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Events message."""
+    return f"data: {orjson.dumps(data).decode()}\n\n"
+
+
+async def _ainvoke_with_retries(agent: Any, payload: Dict[str, Any]) -> Any:
+    """agent.ainvoke with retries on transient errors."""
+    delay = 1.0
+    max_attempts = _AGENT_MAX_ATTEMPTS
     for attempt in range(1, max_attempts + 1):
         try:
-            return await asyncio.to_thread(agent.invoke, payload)
+            # LLM calls are awaited on the loop; LangChain runs the sync
+            # tools in the default executor
+            return await agent.ainvoke(payload)
         except Exception as exc:
-            if attempt == max_attempts or not _is_model_overloaded(exc):
+            if attempt == max_attempts or not _is_retryable(exc):
                 raise
+            # Prefer the provider's hint; otherwise jitter so callers that
+            # failed together don't all retry in lockstep
+            sleep_for = _retry_after_hint(exc) or delay * (0.5 + random.random())
+            sleep_for = min(sleep_for, _RETRY_MAX_DELAY)
             logger.warning(
-                "Agent invoke attempt %s/%s failed with potential overload. Retrying in %.1fs...",
+                "Agent invoke attempt %s/%s failed with a retryable error. Retrying in %.1fs...",
                 attempt,
                 max_attempts,
-                delay,
+                sleep_for,
             )
-            await asyncio.sleep(delay)
-            delay *= 2
+            await asyncio.sleep(sleep_for)
+            delay = min(delay * 2, _RETRY_MAX_DELAY)
+
+
+async def _invoke_agent(
+    agent: Any, query: str, chat_history: List[Any], manager_id: Optional[int] = None
+) -> Any:
+    """
+    Run the agent natively async (ainvoke) with retries on transient errors,
+    and once more with the prompt inline if Gemini rejects the cached prompt.
+    """
+    payload = _build_agent_payload(query, chat_history, manager_id)
+    try:
+        return await _ainvoke_with_retries(agent, payload)
+    except Exception as exc:
+        if not _is_stale_prompt_cache(exc):
+            raise
+        logger.warning("Gemini rejected the cached prompt; retrying with it inline")
+        agent = await _replace_stale_agent(agent)
+        return await _ainvoke_with_retries(agent, payload)
+
+
+async def _stream_agent_events(agent: Any, payload: Dict[str, Any]):
+    """
+    agent.astream_events, restarted once with the prompt inline if Gemini
+    rejects the cached prompt before any text has streamed.
+    """
+    streamed = False
+    try:
+        async for event in agent.astream_events(payload, version="v2"):
+            streamed = streamed or event["event"] == "on_chat_model_stream"
+            yield event
+    except Exception as exc:
+        if streamed or not _is_stale_prompt_cache(exc):
+            raise
+        logger.warning("Gemini rejected the cached prompt; restarting the stream with it inline")
+        agent = await _replace_stale_agent(agent)
+        async for event in agent.astream_events(payload, version="v2"):
+            yield event
+
+
+async def _persist_turn(session_id: str, messages: List[Dict[str, Any]]) -> None:
+    """Write one chat turn to the DB; failures are logged, not raised."""
+    try:
+        await save_chat_messages_async(session_id, messages)
+    except Exception:
+        logger.exception("Failed to persist chat turn for session=%s", session_id)
+
+
+# Strong references to detached tasks so they aren't garbage-collected mid-run
+_BACKGROUND_TASKS: "set[asyncio.Task]" = set()
+
+
+def _spawn(coro) -> "asyncio.Task":
+    """Run a coroutine detached from the current request."""
+    task = asyncio.create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+    return task
+
+
+async def _run_agent_text(
+    agent: Any, query: str, chat_history: List[Any], manager_id: Optional[int] = None
+) -> str:
+    """Run the agent and flatten its output to the answer text."""
+    result = await _invoke_agent(agent, query, chat_history, manager_id)
+    response_raw = result.get("output") if isinstance(result, dict) else result
+    return _coerce_to_text(response_raw if response_raw is not None else result)
+
+
+# In-flight cacheable answers keyed by (normalized query, history digest), so
+# identical questions arriving together share one agent run
+_INFLIGHT: Dict[Tuple[str, str], "asyncio.Future[str]"] = {}
+
+
+async def _answer_query(
+    agent: Any, query: str, chat_history: List[Any], manager_id: Optional[int] = None
+) -> str:
+    """Answer from the semantic response cache when possible, else run the agent."""
+    if not is_cacheable(query, manager_id):
+        return await _run_agent_text(agent, query, chat_history, manager_id)
+
+    key = (normalize_query(query), history_digest(chat_history))
+    pending = _INFLIGHT.get(key)
+    if pending is not None:
+        try:
+            answer = await asyncio.shield(pending)
+            logger.info("Coalesced with in-flight run for query=%s", query[:120])
+            return answer
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise
+            # The leading request went away; answer this one directly
+
+    future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = future
+    try:
+        cached, vector = await asyncio.to_thread(response_cache.lookup, query, chat_history)
+        if cached is not None:
+            logger.info("Semantic cache hit, tokens saved for query=%s", query[:120])
+            answer = cached
+        else:
+            answer = await _run_agent_text(agent, query, chat_history, manager_id)
+            if answer:
+                response_cache.store(query, chat_history, answer, vector)
+        future.set_result(answer)
+        return answer
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark retrieved so an unawaited future doesn't log a warning
+        future.exception()
+        raise
+    finally:
+        if _INFLIGHT.get(key) is future:
+            del _INFLIGHT[key]
 
 
 def create_app(lifespan=None) -> FastAPI:
@@ -150,7 +584,12 @@ def create_app(lifespan=None) -> FastAPI:
     Returns:
         Configured FastAPI application instance
     """
-    app = FastAPI(title="FPLChatbot Middleware", lifespan=lifespan)
+    # orjson-backed responses for the JSON-heavy chat/manager/news endpoints
+    app = FastAPI(
+        title="FPLChatbot Middleware",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
 
     # Configure CORS
     _frontend_urls = os.getenv("FRONTEND_URLS")
@@ -186,7 +625,7 @@ def _register_routes(app: FastAPI):
     """Register all API routes."""
 
     @app.post("/api/query", response_model=QueryResponse)
-    async def query_endpoint(req: QueryRequest):
+    async def query_endpoint(req: QueryRequest, background: BackgroundTasks):
         """
         Accepts JSON: { "query": "...", "session_id": "optional" }
         Creates or reuses an agent per session_id and maintains per-session chat history.
@@ -197,73 +636,147 @@ def _register_routes(app: FastAPI):
             )
 
         session = req.session_id or "_default"
-        agent = _get_or_create_agent(session)
-        chat_history = _get_chat_history(session)
-
-        try:
-            logger.info(
-                "Running agent for session=%s query=%s manager_id=%s",
-                session,
-                req.query[:120],
-                req.manager_id,
-            )
-            result = await _invoke_agent(agent, req.query, chat_history, req.manager_id)
+        # Serialize turns within a session (agent creation, history order);
+        # other sessions are not blocked
+        async with _session_lock(session):
+            agent = await _get_agent()
+            history = await _get_chat_history(session)
+            # Prompt templates expect a list; snapshot the window for this turn
+            chat_history = _prompt_history(history)
+
+            try:
+                logger.info(
+                    "Running agent for session=%s query=%s manager_id=%s",
+                    session,
+                    req.query[:120],
+                    req.manager_id,
+                )
+                response_text = await _answer_query(
+                    agent, req.query, chat_history, req.manager_id
+                )
+
+                # Save to DB persistence
+                human_msg = HumanMessage(content=req.query)
+                ai_msg = AIMessage(content=response_text)
+
+                # Persist after the response is sent; later turns of this
+                # session read the cached history, which is updated now
+                background.add_task(
+                    _persist_turn,
+                    session,
+                    [serialize_message(human_msg), serialize_message(ai_msg)],
+                )
+                history.extend([human_msg, ai_msg])
+
+                return QueryResponse(answer=response_text)
+            except Exception as e:
+                logger.exception("Agent run failed")
+                if _is_model_overloaded(e):
+                    raise HTTPException(
+                        status_code=503,
+                        detail="The language model provider is temporarily overloaded. Please try again shortly.",
+                    ) from e
+                raise HTTPException(
+                    status_code=500, detail="Agent failed to process the request."
+                ) from e
 
-            # Extract response and update chat history
-            response_raw = result.get("output") if isinstance(result, dict) else result
-            response_text = _coerce_to_text(
-                response_raw if response_raw is not None else result
+    @app.post("/api/query/stream")
+    async def query_stream_endpoint(req: QueryRequest):
+        """
+        Same input as /api/query, but streams the answer as Server-Sent Events:
+        `data: {"delta": "..."}` per text chunk, then `data: {"done": true}`
+        (or `data: {"error": "..."}`). The full answer is persisted once the
+        run completes, even if the client disconnects after the last delta.
+        """
+        if not req.query or not req.query.strip():
+            raise HTTPException(
+                status_code=400, detail="query must be a non-empty string"
             )
 
-            # Save to DB persistence
-            human_msg = HumanMessage(content=req.query)
-            ai_msg = AIMessage(content=response_text)
-
-            save_chat_message(session, serialize_message(human_msg))
-            save_chat_message(session, serialize_message(ai_msg))
+        session = req.session_id or "_default"
 
-            return QueryResponse(answer=response_text, raw_output=None)
-        except Exception as e:
-            logger.exception("Agent run failed")
-            if _is_model_overloaded(e):
-                raise HTTPException(
-                    status_code=503,
-                    detail="The language model provider is temporarily overloaded. Please try again shortly.",
-                ) from e
-            raise HTTPException(
-                status_code=500, detail="Agent failed to process the request."
-            ) from e
+        async def event_stream():
+            async with _session_lock(session):
+                agent = await _get_agent()
+                history = await _get_chat_history(session)
+                chat_history = _prompt_history(history)
+                payload = _build_agent_payload(req.query, chat_history, req.manager_id)
+
+                deltas: List[str] = []
+                final_text: Optional[str] = None
+                try:
+                    logger.info(
+                        "Streaming agent for session=%s query=%s manager_id=%s",
+                        session,
+                        req.query[:120],
+                        req.manager_id,
+                    )
+                    async for event in _stream_agent_events(agent, payload):
+                        kind = event["event"]
+                        if kind == "on_chat_model_stream":
+                            delta = _coerce_to_text(event["data"]["chunk"].content)
+                            if delta:
+                                deltas.append(delta)
+                                yield _sse({"delta": delta})
+                        elif kind == "on_chain_end" and not event.get("parent_ids"):
+                            # Root AgentExecutor finished: its output is the answer
+                            output = event["data"].get("output")
+                            if isinstance(output, dict) and output.get("output") is not None:
+                                final_text = _coerce_to_text(output["output"])
+
+                    response_text = final_text if final_text is not None else "".join(deltas)
+                    human_msg = HumanMessage(content=req.query)
+                    ai_msg = AIMessage(content=response_text)
+                    history.extend([human_msg, ai_msg])
+                    # Persist in a detached task: the client gets "done" without
+                    # waiting on the DB, and a disconnect right after the last
+                    # delta can't cancel the write
+                    _spawn(_persist_turn(
+                        session,
+                        [serialize_message(human_msg), serialize_message(ai_msg)],
+                    ))
+                except Exception as e:
+                    logger.exception("Agent stream failed")
+                    if _is_model_overloaded(e):
+                        yield _sse({"error": "The language model provider is temporarily overloaded. Please try again shortly."})
+                    else:
+                        yield _sse({"error": "Agent failed to process the request."})
+                    return
+
+                yield _sse({"done": True})
+
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
 
     @app.get("/api/chats")
     async def list_chats():
         """List all chat sessions."""
-        return get_all_chat_sessions()
+        return await asyncio.to_thread(get_all_chat_sessions)
 
     @app.post("/api/chats")
     async def create_new_chat():
         """Create a new chat session."""
-        session_id = create_chat_session()
+        session_id = await asyncio.to_thread(create_chat_session)
         return {"session_id": session_id}
 
     @app.delete("/api/chats/{session_id}")
     async def delete_chat(session_id: str):
         """Delete a chat session."""
-        delete_chat_session(session_id)
+        await asyncio.to_thread(delete_chat_session, session_id)
         # Also clear from memory cache if present
-        if session_id in _AGENT_CACHE:
-            del _AGENT_CACHE[session_id]
+        _HISTORY_CACHE.pop(session_id, None)
         return {"status": "deleted"}
 
     @app.get("/api/chats/{session_id}")
     async def get_chat_details(session_id: str):
         """Get chat history for a session."""
-        history = _get_chat_history(session_id)
-        # Convert back to serializable format for frontend
-        return {"history": [serialize_message(m) for m in history]}
+        # Rows are stored already serialized ({type, content}); return them as-is
+        # instead of deserializing into messages and serializing back
+        history = await get_chat_history_async(session_id)
+        return {"history": history or []}
 
     @app.get("/api/health")
     async def health():
-        return {"status": "ok"}
+        return {"status": "ok", "db_pool": get_pool_stats()}
 
     @app.get("/api/manager/{entry_id}")
     async def get_manager(entry_id: int):
@@ -273,12 +786,14 @@ def _register_routes(app: FastAPI):
         """
         from backend.data import api_client
 
-        try:
-            # Get manager summary
-            summary = await asyncio.to_thread(api_client.entry_summary, entry_id)
+        async def _load_manager() -> Dict[str, Any]:
+            http = get_http_client(app)
 
-            # Get manager history for current season stats
-            history = await asyncio.to_thread(api_client.entry_history, entry_id)
+            # Manager summary and season history are independent; fetch both at once
+            summary, history = await asyncio.gather(
+                api_client.entry_summary_async(entry_id, http),
+                api_client.entry_history_async(entry_id, http),
+            )
 
             # Extract current gameweek data
             current_gw = history.get("current", [])
@@ -286,14 +801,15 @@ def _register_routes(app: FastAPI):
 
             # Extract classic leagues (limit to top 5 by rank)
             leagues = summary.get("leagues", {}).get("classic", [])
-            top_leagues = sorted(
-                [
+            top_leagues = heapq.nsmallest(
+                5,
+                (
                     {"id": l["id"], "name": l["name"], "rank": l["entry_rank"]}
                     for l in leagues
                     if l.get("entry_rank")
-                ],
-                key=lambda x: x["rank"],
-            )[:5]
+                ),
+                key=itemgetter("rank"),
+            )
 
             return {
                 "id": summary.get("id"),
@@ -307,6 +823,9 @@ def _register_routes(app: FastAPI):
                 "total_transfers": summary.get("last_deadline_total_transfers", 0),
                 "leagues": top_leagues,
             }
+
+        try:
+            return await _MANAGER_CACHE.get_or_set(entry_id, _load_manager)
         except Exception as e:
             logger.exception(f"Failed to get manager info for entry_id={entry_id}")
             raise HTTPException(
@@ -320,15 +839,22 @@ def _register_routes(app: FastAPI):
         Get a manager's full team for a specific gameweek.
         If event (gameweek) is not provided, uses the current gameweek.
         """
-        from backend.data.manager.manager_data import get_manager_squad_data
+        from backend.data.manager.manager_data import get_manager_squad_data_async
 
-        try:
-            result = await asyncio.to_thread(get_manager_squad_data, entry_id, event)
+        async def _load_team() -> Dict[str, Any]:
+            # Picks and live points are fetched concurrently on the shared client
+            result = await get_manager_squad_data_async(
+                entry_id, get_http_client(app), event
+            )
 
+            # Raising here also keeps error results out of the cache
             if "error" in result:
                 raise HTTPException(status_code=404, detail=result["error"])
 
             return result
+
+        try:
+            return await _TEAM_CACHE.get_or_set((entry_id, event), _load_team)
         except HTTPException:
             raise
         except Exception as e:
@@ -342,11 +868,10 @@ def _register_routes(app: FastAPI):
     @app.get("/api/news")
     async def get_player_news():
         """Get the latest player news (injuries, price changes) from MongoDB."""
-        from backend.data.core.cache import get_cached_player_news
+        from backend.data.core.cache import get_cached_player_news_async
 
         try:
-            alerts = await asyncio.to_thread(get_cached_player_news)
-            return alerts
+            return await _NEWS_CACHE.get_or_set("news", get_cached_player_news_async)
         except Exception as e:
             logger.exception("Failed to fetch player news")
             return []
@@ -357,12 +882,22 @@ def _register_routes(app: FastAPI):
         Manually trigger a refresh of videoprinter data (price changes, injuries, match events).
         """
         from backend.database.ingestion import update_videoprinter_data
-        from backend.data.core.cache import get_cached_player_news
+        from backend.database.db import get_db
+        from backend.data.core.cache import get_cached_player_news_async
 
-        try:
+        async def _refresh() -> list:
             logger.info("Manual videoprinter refresh triggered")
-            await asyncio.to_thread(update_videoprinter_data)
-            alerts = await asyncio.to_thread(get_cached_player_news)
+            await asyncio.to_thread(update_videoprinter_data, get_db())
+            _NEWS_CACHE.invalidate("news")
+            return await _NEWS_CACHE.get_or_set("news", get_cached_player_news_async)
+
+        # Refreshes requested while one is running share its result
+        global _NEWS_REFRESH_TASK
+        if _NEWS_REFRESH_TASK is None or _NEWS_REFRESH_TASK.done():
+            _NEWS_REFRESH_TASK = asyncio.create_task(_refresh())
+
+        try:
+            alerts = await asyncio.shield(_NEWS_REFRESH_TASK)
             return {"success": True, "message": "Data refreshed", "data": alerts}
         except Exception as e:
             logger.exception("Failed to refresh videoprinter data")
@@ -370,8 +905,3 @@ def _register_routes(app: FastAPI):
                 status_code=500, detail=f"Failed to refresh data: {str(e)}"
             )
 
-
-# Backwards compatibility: maintain the global 'app' variable for direct imports
-# This allows existing code to still use 'from backend.middleware.api import app'
-# but the recommended way is to use create_app()
-app = create_app()
@@ -7,8 +7,9 @@ the cache and database stay up-to-date without manual intervention.
 
 import sys
 import os
+import asyncio
 import logging
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime
 
@@ -18,12 +19,22 @@ project_root = os.path.abspath(os.path.join(current_dir, "../"))
 sys.path.append(project_root)
 
 from backend.data import cache
+from backend.database.db import get_db
 from backend.database.ingestion import update_static_data, update_videoprinter_data
 
 logger = logging.getLogger(__name__)
 
 # Global scheduler instance
-_scheduler: BackgroundScheduler | None = None
+_scheduler: AsyncIOScheduler | None = None
+
+# Same setting prompt_cache reads; not imported from there because the agent
+# package pulls in LangChain and every tool
+PROMPT_CACHE_TTL_SECONDS = int(os.getenv("PROMPT_CACHE_TTL", "3600"))
+
+
+async def _run_in_thread(func, *args):
+    """Run a blocking job off the event loop the scheduler is bound to."""
+    await asyncio.to_thread(func, *args)
 
 
 def refresh_fpl_data():
@@ -31,9 +42,11 @@ def refresh_fpl_data():
     Refresh all FPL data (cache + database).
     
     This function:
-    1. Invalidates the cache
-    2. Runs database ingestion
-    3. Reloads core game data into cache
+    1. Runs database ingestion
+    2. Rebuilds core game data and swaps it into the cache
+
+    The cache is not cleared first: requests keep reading the previous
+    data until the rebuilt copy replaces it.
     """
     logger.info("=" * 60)
     logger.info("Starting scheduled FPL data refresh...")
@@ -41,15 +54,11 @@ def refresh_fpl_data():
     logger.info("=" * 60)
     
     try:
-        # Step 1: Invalidate cache
-        logger.info("Invalidating cache...")
-        cache.invalidate_cache()
-        
-        # Step 2: Update database
+        # Step 1: Update database
         logger.info("Updating database...")
         update_static_data()
         
-        # Step 3: Warm cache
+        # Step 2: Rebuild and swap in core data
         logger.info("Warming cache...")
         cache.load_core_game_data(force_refresh=True)
         
@@ -65,6 +74,14 @@ def refresh_fpl_data():
         logger.error(f"❌ Scheduled data refresh failed: {e}", exc_info=True)
 
 
+def _refresh_prompt_cache():
+    """Keep the Gemini prompt-prefix cache alive before its TTL runs out."""
+    # Lazy import: the agent package pulls in LangChain and every tool
+    from backend.agent.prompt_cache import refresh_prompt_cache
+
+    refresh_prompt_cache()
+
+
 def start_scheduler(
     refresh_interval_hours: int = 1,
     enable_cron: bool = False,
@@ -72,6 +89,9 @@ def start_scheduler(
 ):
     """
     Start the background scheduler for automatic data refresh.
+
+    Must be called from a running event loop (e.g. the FastAPI lifespan):
+    jobs are scheduled on that loop and their blocking work runs in a thread.
     
     Args:
         refresh_interval_hours: Refresh interval in hours (default: 1)
@@ -79,7 +99,7 @@ def start_scheduler(
         cron_expression: Cron expression for scheduling (default: every hour)
         
     Returns:
-        BackgroundScheduler instance
+        AsyncIOScheduler instance
     """
     global _scheduler
     
@@ -87,14 +107,15 @@ def start_scheduler(
         logger.warning("Scheduler is already running")
         return _scheduler
     
-    _scheduler = BackgroundScheduler()
+    _scheduler = AsyncIOScheduler()
     
     if enable_cron:
         # Use cron trigger
         trigger = CronTrigger.from_crontab(cron_expression)
         _scheduler.add_job(
-            refresh_fpl_data,
+            _run_in_thread,
             trigger=trigger,
+            args=[refresh_fpl_data],
             id="fpl_data_refresh",
             name="FPL Data Refresh (Cron)",
             replace_existing=True
@@ -103,9 +124,10 @@ def start_scheduler(
     else:
         # Use interval trigger
         _scheduler.add_job(
-            refresh_fpl_data,
+            _run_in_thread,
             'interval',
             hours=refresh_interval_hours,
+            args=[refresh_fpl_data],
             id="fpl_data_refresh",
             name="FPL Data Refresh (Interval)",
             replace_existing=True
@@ -114,14 +136,29 @@ def start_scheduler(
         
         # Add separate job for Videoprinter updates (every 15 minutes for real-time updates)
         _scheduler.add_job(
-            update_videoprinter_data,
+            _run_in_thread,
             'interval',
             minutes=15,
+            args=[update_videoprinter_data, get_db()],
             id="fpl_videoprinter_refresh",
             name="Videoprinter Update (Interval)",
             replace_existing=True
         )
         logger.info("Scheduler added Videoprinter update job (every 15 minutes)")
+
+    # Extend the prompt cache well before its (configurable) TTL runs out. A
+    # late run still fires and catches up, since missing one lets it expire
+    _scheduler.add_job(
+        _run_in_thread,
+        'interval',
+        seconds=max(60, int(PROMPT_CACHE_TTL_SECONDS * 0.8)),
+        args=[_refresh_prompt_cache],
+        id="prompt_cache_refresh",
+        name="Prompt Cache Refresh (Interval)",
+        misfire_grace_time=None,
+        coalesce=True,
+        replace_existing=True
+    )
     
     _scheduler.start()
     logger.info("Background scheduler is running")
@@ -134,14 +171,14 @@ def stop_scheduler():
     global _scheduler
     
     if _scheduler is not None and _scheduler.running:
-        _scheduler.shutdown()
+        _scheduler.shutdown(wait=False)
         logger.info("Scheduler stopped")
         _scheduler = None
     else:
         logger.warning("Scheduler is not running")
 
 
-def get_scheduler() -> BackgroundScheduler | None:
+def get_scheduler() -> AsyncIOScheduler | None:
     """Get the current scheduler instance."""
     return _scheduler
 
@@ -163,24 +200,24 @@ def warm_cache_on_startup():
         logger.error(f"❌ Failed to warm cache: {e}", exc_info=True)
 
 
+async def _run_standalone():
+    """Warm the cache and keep the scheduler running until interrupted."""
+    await asyncio.to_thread(warm_cache_on_startup)
+    start_scheduler(refresh_interval_hours=1)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        stop_scheduler()
+
+
 # Example usage
 if __name__ == "__main__":
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(levelname)s - %(message)s"
     )
-    
-    # Warm cache on startup
-    warm_cache_on_startup()
-    
-    # Start scheduler (refresh every hour)
-    start_scheduler(refresh_interval_hours=1)
-    
-    # Keep the script running
+
     try:
-        import time
-        while True:
-            time.sleep(60)
+        asyncio.run(_run_standalone())
     except KeyboardInterrupt:
         logger.info("Shutting down...")
-        stop_scheduler()
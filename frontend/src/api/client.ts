@@ -7,7 +7,6 @@ export type QueryRequest = {
 
 export type QueryResponse = {
   answer: string;
-  raw_output?: unknown;
 };
 
 export type ManagerData = {